@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark pre-compressed feed artifacts.
+
+Saves a feed with each artifact encoding and reports output sizes and
+wall-clock times as JSON, next to compressing the finished file afterwards.
+
+Usage:
+    python benchmarks/bench_compression.py                  # Bundled roku_feed.json
+    python benchmarks/bench_compression.py --feed feed.json --repeat 5
+"""
+
+import argparse
+import gzip
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from vimeo_roku_sdk.compression import GZIP_LEVEL, artifact_path, resolve_encodings
+from vimeo_roku_sdk.models import RokuFeed
+
+
+def best_of(repeat: int, func) -> float:
+    """Fastest of several runs, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(feed_path: Path, repeat: int) -> dict:
+    with open(feed_path, encoding="utf-8") as f:
+        feed = RokuFeed.from_dict(json.load(f))
+    for video in feed.iter_videos():
+        video.to_json_fragment()  # Measure writing, not item serialization
+
+    results = {
+        "feed": str(feed_path),
+        "videos": sum(1 for _ in feed.iter_videos()),
+        "repeat": repeat,
+        "runs": [],
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp) / "roku_feed.json"
+
+        plain = best_of(repeat, lambda: feed.save(str(out)))
+        json_bytes = out.stat().st_size
+        results["runs"].append({"encoding": "identity", "seconds": plain, "bytes": json_bytes})
+
+        for encoding in resolve_encodings(["gzip", "br"]):
+            seconds = best_of(repeat, lambda: feed.save(str(out), encodings=[encoding]))
+            size = Path(artifact_path(out, encoding)).stat().st_size
+            results["runs"].append({
+                "encoding": encoding,
+                "seconds": seconds,
+                "extra_seconds": seconds - plain,
+                "bytes": size,
+                "ratio": size / json_bytes,
+            })
+
+        # Reference: compressing the finished file in a second pass
+        data = out.read_bytes()
+        seconds = best_of(repeat, lambda: gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0))
+        results["runs"].append({
+            "encoding": "gzip (after save)",
+            "seconds": plain + seconds,
+            "extra_seconds": seconds,
+            "bytes": len(gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)),
+        })
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark compressed feed artifacts")
+    parser.add_argument(
+        "--feed",
+        default=str(Path(__file__).parent.parent / "roku_feed.json"),
+        help="Feed JSON to benchmark with (default: bundled roku_feed.json)"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    results = run(Path(args.feed), args.repeat)
+    text = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark the JSON backends.
+
+Decodes synthetic Vimeo listing pages and serializes the resulting feed
+items with each installed backend, and reports the timings as JSON.
+
+Usage:
+    python benchmarks/bench_json.py
+    python benchmarks/bench_json.py --videos 10000 --repeat 5
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from catalog import make_catalog
+from vimeo_roku_sdk import json_codec
+from vimeo_roku_sdk.exceptions import ConfigurationError
+from vimeo_roku_sdk.feed_writer import serialize_item
+from vimeo_roku_sdk.models import RokuVideo, Video
+
+
+def best_of(repeat: int, func) -> float:
+    """Fastest of several runs, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the JSON backends")
+    parser.add_argument("--videos", type=int, default=5000, help="Videos in the synthetic catalog")
+    parser.add_argument("--per-page", type=int, default=100, help="Videos per listing page")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    responses = make_catalog(args.videos)
+    pages = [
+        json.dumps({"total": args.videos, "data": responses[start:start + args.per_page]}).encode("utf-8")
+        for start in range(0, args.videos, args.per_page)
+    ]
+    items = [RokuVideo.from_video(Video.from_vimeo_response(data)).to_dict() for data in responses]
+
+    results = {
+        "python": sys.version.split()[0],
+        "videos": args.videos,
+        "page_bytes": sum(len(page) for page in pages),
+        "runs": [],
+    }
+
+    previous = json_codec.get_backend()
+    for backend in json_codec.BACKENDS:
+        try:
+            json_codec.set_backend(backend)
+        except ConfigurationError:
+            continue  # Not installed
+
+        results["runs"].append({
+            "backend": backend,
+            "decode_seconds": best_of(args.repeat, lambda: [json_codec.loads(page) for page in pages]),
+            "serialize_seconds": best_of(args.repeat, lambda: [serialize_item(item) for item in items]),
+        })
+    json_codec.set_backend(previous)
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-video memory of parsed Vimeo videos.
+
+Parses a synthetic catalog (see catalog.py) in full and lean mode, and
+reports the memory retained per video as JSON.
+
+Usage:
+    python benchmarks/bench_models_memory.py
+    python benchmarks/bench_models_memory.py --videos 50000
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from catalog import make_video
+from vimeo_roku_sdk.models import RokuVideo, Video
+
+
+def measure(responses, lean: bool) -> int:
+    """Bytes retained by the parsed videos."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        videos = [Video.from_vimeo_response(data, lean=lean) for data in responses]
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    # Lean and full parses must produce the same feed item
+    sample = responses[0]
+    assert RokuVideo.from_video(videos[0]) == RokuVideo.from_video(Video.from_vimeo_response(sample))
+    return retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-video memory of parsed videos")
+    parser.add_argument("--videos", type=int, default=20000, help="Videos to parse")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    responses = [make_video(index) for index in range(args.videos)]
+    results = {
+        "python": sys.version.split()[0],
+        "videos": args.videos,
+        "slotted": not hasattr(Video.from_vimeo_response(responses[0]), "__dict__"),
+        "runs": [],
+    }
+    for lean in (False, True):
+        retained = measure(responses, lean)
+        results["runs"].append({
+            "mode": "lean" if lean else "full",
+            "bytes": retained,
+            "bytes_per_video": retained / args.videos,
+        })
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
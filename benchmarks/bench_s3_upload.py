@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark S3 feed uploads.
+
+Uploads a feed, its gzip artifact and a set of sidecar files with several
+transfer settings and reports throughput as JSON. Runs against an
+in-process moto S3 by default, or a real bucket with --bucket.
+
+Usage:
+    python benchmarks/bench_s3_upload.py                      # moto, bundled feed
+    python benchmarks/bench_s3_upload.py --bucket my-bucket --prefix bench/
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from vimeo_roku_sdk.config import RokuConfig
+from vimeo_roku_sdk.models import RokuFeed
+from vimeo_roku_sdk.roku_feed import RokuFeedUploader, S3Upload
+
+# (multipart threshold MB, chunk MB, max concurrency)
+SETTINGS = [
+    (1024, 8, 1),  # Single PUT per file, one thread
+    (8, 8, 10),    # Library defaults
+    (5, 5, 16),
+]
+
+
+@contextlib.contextmanager
+def moto_s3(bucket: str):
+    import boto3
+    import moto
+
+    mock_aws = getattr(moto, "mock_aws", None) or moto.mock_s3
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=bucket)
+        yield client
+
+
+def run(client, bucket: str, prefix: str, feed_path: Path, sidecars: int, size_mb: int) -> dict:
+    results = {"bucket": bucket, "runs": []}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(feed_path, encoding="utf-8") as f:
+            feed = RokuFeed.from_dict(json.load(f))
+        local_feed = Path(tmp) / "roku_feed.json"
+        feed.save(str(local_feed), encodings=["gzip"])
+
+        extra = []
+        for index in range(sidecars):
+            path = Path(tmp) / f"sidecar-{index}.bin"
+            path.write_bytes(os.urandom(size_mb * 1024 * 1024))
+            extra.append(S3Upload(str(path), f"{prefix}sidecars/{index}.bin"))
+
+        total_bytes = sum(
+            Path(p).stat().st_size
+            for p in [local_feed, f"{local_feed}.gz"] + [item.path for item in extra]
+        )
+
+        for threshold, chunk, concurrency in SETTINGS:
+            config = RokuConfig(
+                s3_bucket=bucket,
+                s3_key=f"{prefix}roku_feed.json",
+                feed_compression=["gzip"],
+                s3_multipart_threshold_mb=threshold,
+                s3_multipart_chunk_mb=chunk,
+                s3_max_concurrency=concurrency,
+            )
+            uploader = RokuFeedUploader(config, s3_client=client)
+
+            start = time.perf_counter()
+            uploader.upload_to_s3(str(local_feed), extra_uploads=extra)
+            seconds = time.perf_counter() - start
+
+            results["runs"].append({
+                "multipart_threshold_mb": threshold,
+                "multipart_chunk_mb": chunk,
+                "max_concurrency": concurrency,
+                "files": len(extra) + 2,
+                "bytes": total_bytes,
+                "seconds": seconds,
+                "mb_per_second": total_bytes / (1024 * 1024) / seconds,
+            })
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark S3 feed uploads")
+    parser.add_argument(
+        "--feed",
+        default=str(Path(__file__).parent.parent / "roku_feed.json"),
+        help="Feed JSON to upload (default: bundled roku_feed.json)"
+    )
+    parser.add_argument("--bucket", help="Real S3 bucket to upload to (default: moto)")
+    parser.add_argument("--prefix", default="", help="Key prefix for uploaded objects")
+    parser.add_argument("--sidecars", type=int, default=4, help="Extra files uploaded with the feed")
+    parser.add_argument("--sidecar-mb", type=int, default=16, help="Size of each extra file")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    if args.bucket:
+        import boto3
+
+        context = contextlib.nullcontext(boto3.client("s3"))
+        bucket = args.bucket
+    else:
+        bucket = "bench-feeds"
+        context = moto_s3(bucket)
+
+    with context as client:
+        results = run(client, bucket, args.prefix, Path(args.feed), args.sidecars, args.sidecar_mb)
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
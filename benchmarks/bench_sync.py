@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark sync throughput over synthetic catalogs.
+
+For each catalog size, runs these stages and reports wall-clock time and
+videos per second as JSON:
+- pagination: VimeoClient against a local mock of api.vimeo.com
+- parse: Video.from_vimeo_response
+- convert: RokuFeedGenerator.add_video
+- validate
+- save: RokuFeed.save
+- end_to_end: SyncManager.sync, both in memory and streaming
+
+Usage:
+    python benchmarks/bench_sync.py                         # 1k and 10k videos
+    python benchmarks/bench_sync.py --sizes 1k,10k,100k --latency 0.05 --output sync.json
+    python benchmarks/bench_sync.py --rate-limit 200 --window 10 --throttle-every 50
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from catalog import make_catalog, parse_size
+from mock_vimeo import MockVimeoServer
+from vimeo_roku_sdk import json_codec
+from vimeo_roku_sdk.config import Config, RokuConfig, SyncConfig, VimeoConfig
+from vimeo_roku_sdk.models import Video
+from vimeo_roku_sdk.roku_feed import RokuFeedGenerator
+from vimeo_roku_sdk.sync_manager import SyncManager
+from vimeo_roku_sdk.vimeo_client import VimeoClient
+
+
+def timed(func):
+    """Run once; returns (result, seconds)."""
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def stage(name: str, seconds: float, videos: int, **extra) -> dict:
+    return {
+        "stage": name,
+        "seconds": seconds,
+        "videos_per_second": videos / seconds if seconds else None,
+        **extra,
+    }
+
+
+def make_config(server: MockVimeoServer, tmp: Path, workers: int, streaming: bool = False) -> Config:
+    return Config(
+        vimeo=VimeoConfig(access_token="benchmark", api_base_url=server.url, max_workers=workers),
+        roku=RokuConfig(provider_name="Benchmark Channel", feed_output_path=str(tmp / "roku_feed.json")),
+        sync=SyncConfig(cache_path=str(tmp / "cache"), streaming=streaming),
+    )
+
+
+def run_size(size: int, args) -> dict:
+    catalog = make_catalog(size, args.seed)
+    stages = []
+
+    server = MockVimeoServer(
+        catalog,
+        latency=args.latency,
+        rate_limit=args.rate_limit,
+        window=args.window,
+        throttle_every=args.throttle_every
+    )
+    with server, tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+
+        client = VimeoClient(config=make_config(server, tmp, args.workers).vimeo)
+        videos, seconds = timed(client.get_all_videos)
+        stages.append(stage(
+            "pagination", seconds, len(videos),
+            requests=server.requests,
+            throttled=server.throttled
+        ))
+
+        videos, seconds = timed(lambda: [Video.from_vimeo_response(data) for data in catalog])
+        stages.append(stage("parse", seconds, size))
+
+        generator = RokuFeedGenerator(RokuConfig(provider_name="Benchmark Channel"))
+        _, seconds = timed(lambda: [generator.add_video(video) for video in videos])
+        stages.append(stage("convert", seconds, size))
+
+        errors, seconds = timed(generator.validate)
+        stages.append(stage("validate", seconds, size, errors=len(errors)))
+
+        feed_path = tmp / "feed.json"
+        _, seconds = timed(lambda: generator.feed.save(str(feed_path)))
+        stages.append(stage("save", seconds, size, bytes=feed_path.stat().st_size))
+
+        for streaming in (False, True):
+            run_dir = tmp / ("streaming" if streaming else "in_memory")
+            requests_before = server.requests
+            manager = SyncManager(config=make_config(server, run_dir, args.workers, streaming))
+            result, seconds = timed(manager.sync)
+            stages.append(stage(
+                "end_to_end_streaming" if streaming else "end_to_end",
+                seconds, result.videos_processed,
+                success=result.success,
+                requests=server.requests - requests_before
+            ))
+
+    return {"videos": size, "stages": stages}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sync throughput over synthetic catalogs")
+    parser.add_argument("--sizes", default="1k,10k", help="Catalog sizes, e.g. 1k,10k,100k")
+    parser.add_argument("--seed", type=int, default=0, help="Catalog seed")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent page fetches")
+    parser.add_argument("--latency", type=float, default=0.0, help="Mock API seconds per response")
+    parser.add_argument("--rate-limit", type=int, help="Mock API requests per window before 429s")
+    parser.add_argument("--window", type=float, default=60.0, help="Mock API rate-limit window in seconds")
+    parser.add_argument("--throttle-every", type=int, default=0, help="Mock API answers every Nth request with a 429")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    results = {
+        "python": sys.version.split()[0],
+        "json_backend": json_codec.get_backend(),
+        "settings": {
+            "workers": args.workers,
+            "latency": args.latency,
+            "rate_limit": args.rate_limit,
+            "window": args.window,
+            "throttle_every": args.throttle_every,
+        },
+        "runs": [run_size(parse_size(size), args) for size in args.sizes.split(",")],
+    }
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
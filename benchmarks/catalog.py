@@ -0,0 +1,169 @@
+"""
+Synthetic Vimeo catalogs for the benchmarks.
+
+Videos are shaped like full Vimeo API video objects (every picture size,
+every progressive file, HLS, embed HTML, stats) and take their titles,
+descriptions, durations, tags and genres from the bundled roku_feed.json,
+so text sizes and value distributions match a real channel. Generation is
+deterministic for a given size and seed.
+"""
+
+import json
+import math
+import random
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+SEED_FEED = Path(__file__).parent.parent / "roku_feed.json"
+
+# Catalog sizes the benchmarks run at by default
+SIZES = {"1k": 1000, "10k": 10000, "100k": 100000}
+
+PICTURE_WIDTHS = [100, 200, 295, 640, 960, 1280, 1920, 3840]
+FILE_HEIGHTS = [240, 360, 540, 720, 1080, 2160]
+
+_EPOCH = datetime(2020, 1, 1, tzinfo=timezone.utc)
+_seed_items: Optional[List[Dict[str, Any]]] = None
+
+
+def parse_size(value: str) -> int:
+    """Parse a catalog size given as '10k', '100k' or a plain number."""
+    value = value.strip().lower()
+    if value in SIZES:
+        return SIZES[value]
+    if value.endswith("k"):
+        return int(float(value[:-1]) * 1000)
+    return int(value)
+
+
+def seed_items() -> List[Dict[str, Any]]:
+    """Video items of the bundled feed, in feed order."""
+    global _seed_items
+    if _seed_items is None:
+        with open(SEED_FEED, encoding="utf-8") as f:
+            feed = json.load(f)
+        _seed_items = [
+            item
+            for key in ("shortFormVideos", "movies", "tvSpecials")
+            for item in feed.get(key, [])
+        ]
+    return _seed_items
+
+
+def _timestamp(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%S+00:00")
+
+
+def make_video(index: int, seed: int = 0) -> Dict[str, Any]:
+    """
+    Build the Vimeo video object at a position in a synthetic catalog.
+
+    Args:
+        index: Position in the catalog
+        seed: Seed for the values not taken from the bundled feed
+
+    Returns:
+        Video object as returned by the API with the full fields profile
+    """
+    items = seed_items()
+    template = items[index % len(items)]
+    rng = random.Random(seed * 1000003 + index)
+
+    video_id = 100000000 + index
+    title = template.get("title", "Untitled")
+    if index >= len(items):
+        title = f"{title} ({index // len(items) + 1})"
+
+    created = _EPOCH + timedelta(minutes=index * 37 + rng.randrange(30))
+    modified = created + timedelta(hours=rng.randrange(72))
+
+    return {
+        "uri": f"/videos/{video_id}",
+        "name": title,
+        "description": template.get("longDescription", ""),
+        "duration": template.get("content", {}).get("duration") or rng.randrange(60, 5400),
+        "created_time": _timestamp(created),
+        "modified_time": _timestamp(modified),
+        "release_time": _timestamp(created),
+        "link": f"https://vimeo.com/{video_id}",
+        "player_embed_url": f"https://player.vimeo.com/video/{video_id}",
+        "privacy": {"view": "anybody" if rng.random() < 0.95 else "unlisted"},
+        "embed": {
+            "html": (
+                f'<iframe src="https://player.vimeo.com/video/{video_id}?badge=0&amp;'
+                f'autopause=0&amp;player_id=0&amp;app_id=58479" width="1920" height="1080" '
+                f'frameborder="0" allow="autoplay; fullscreen; picture-in-picture" '
+                f'title="{title}"></iframe>'
+            )
+        },
+        "pictures": {
+            "sizes": [
+                {
+                    "width": width,
+                    "height": width * 9 // 16,
+                    "link": f"https://i.vimeocdn.com/video/{video_id}-{width}x{width * 9 // 16}?r=pad",
+                }
+                for width in PICTURE_WIDTHS
+            ]
+        },
+        "files": [
+            {
+                "quality": "hd" if height >= 720 else "sd",
+                "type": "video/mp4",
+                "width": height * 16 // 9,
+                "height": height,
+                "size": height * 100000,
+                "link": f"https://player.vimeo.com/progressive_redirect/playback/{video_id}/rendition/{height}p/file.mp4",
+            }
+            for height in FILE_HEIGHTS
+        ],
+        "play": {"hls": {"link": f"https://player.vimeo.com/play/{video_id}/hls.m3u8"}},
+        "tags": [{"name": tag} for tag in template.get("tags", [])],
+        "categories": [{"name": genre} for genre in template.get("genres", [])],
+        "stats": {"plays": rng.randrange(10000)},
+        "metadata": {"connections": {"likes": {"total": rng.randrange(500)}}},
+    }
+
+
+def make_catalog(size: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Build a synthetic catalog of ``size`` video objects."""
+    return [make_video(index, seed) for index in range(size)]
+
+
+def make_page(
+    catalog: List[Dict[str, Any]],
+    endpoint: str,
+    page: int = 1,
+    per_page: int = 100
+) -> Dict[str, Any]:
+    """
+    Build a listing page over a catalog, with Vimeo's paging block.
+
+    Args:
+        catalog: Video objects, in listing order
+        endpoint: Listing endpoint, used for the paging links
+        page: Page number (1-based)
+        per_page: Videos per page
+
+    Returns:
+        The listing response
+    """
+    last_page = max(1, math.ceil(len(catalog) / per_page))
+    start = (page - 1) * per_page
+
+    def link(number: int) -> str:
+        return f"{endpoint}?page={number}&per_page={per_page}"
+
+    return {
+        "total": len(catalog),
+        "page": page,
+        "per_page": per_page,
+        "paging": {
+            "next": link(page + 1) if page < last_page else None,
+            "previous": link(page - 1) if page > 1 else None,
+            "first": link(1),
+            "last": link(last_page),
+        },
+        "data": catalog[start:start + per_page],
+    }
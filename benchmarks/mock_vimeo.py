@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for api.vimeo.com over a synthetic catalog.
+
+Serves the endpoints the SDK uses (user, video listings, single videos)
+with Vimeo's paging, ``fields`` projection and X-RateLimit-* headers, plus
+configurable latency, a per-window request limit and injected 429s. Point
+a client at it with ``VimeoConfig(api_base_url=server.url)``.
+
+Usage:
+    python benchmarks/mock_vimeo.py --videos 10k --port 8765 --latency 0.05
+    VIMEO_API_BASE_URL=http://127.0.0.1:8765 VIMEO_ACCESS_TOKEN=x vimeo-roku sync
+"""
+
+import argparse
+import json
+import math
+import re
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from catalog import make_catalog, make_page, parse_size
+
+_LISTING = re.compile(r"^/(?:me|users/[^/]+)(?:/(?:albums|projects)/[^/]+)?/videos$|^/videos$")
+_VIDEO = re.compile(r"^/videos/(\d+)$")
+_USER = re.compile(r"^/(?:me|users/[^/]+)$")
+
+
+def project(data: Any, fields: List[str]) -> Dict[str, Any]:
+    """Apply a Vimeo ``fields`` projection (dotted paths) to an object."""
+    result: Dict[str, Any] = {}
+    for path in fields:
+        _copy_path(data, result, path.split("."))
+    return result
+
+
+def _copy_path(source: Any, target: Dict[str, Any], keys: List[str]):
+    key, rest = keys[0], keys[1:]
+    if not isinstance(source, dict) or key not in source:
+        return
+    value = source[key]
+    if not rest:
+        target[key] = value
+    elif isinstance(value, list):
+        items = target.setdefault(key, [{} for _ in value])
+        for item, sub_target in zip(value, items):
+            _copy_path(item, sub_target, rest)
+    elif isinstance(value, dict):
+        _copy_path(value, target.setdefault(key, {}), rest)
+
+
+class MockVimeoServer:
+    """
+    Threaded HTTP server answering like the Vimeo API.
+
+    Example:
+        with MockVimeoServer(make_catalog(10000), latency=0.02) as server:
+            client = VimeoClient(config=VimeoConfig(access_token="x", api_base_url=server.url))
+            videos = client.get_all_videos()
+    """
+
+    def __init__(
+        self,
+        catalog: List[Dict[str, Any]],
+        latency: float = 0.0,
+        rate_limit: Optional[int] = None,
+        window: float = 60.0,
+        throttle_every: int = 0,
+        retry_after: int = 1,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ):
+        """
+        Create the server (call start() or use it as a context manager).
+
+        Args:
+            catalog: Video objects, in default listing order
+            latency: Seconds added to every response
+            rate_limit: Requests allowed per window before answering 429 (None = unlimited)
+            window: Length of a rate-limit window in seconds
+            throttle_every: Answer every Nth request with a 429 regardless (0 = never)
+            retry_after: Retry-After seconds sent with injected 429s
+            host: Interface to listen on
+            port: Port to listen on (0 = any free port)
+        """
+        self.catalog = catalog
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.window = window
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+
+        self.requests = 0
+        self.throttled = 0
+        self._by_id = {video["uri"].split("/")[-1]: video for video in catalog}
+        self._by_modified: Optional[List[Dict[str, Any]]] = None
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._lock = threading.Lock()
+
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockVimeoServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "MockVimeoServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _admit(self) -> Dict[str, Any]:
+        """Count a request against the rate limit; returns the limit state."""
+        with self._lock:
+            self.requests += 1
+            now = time.monotonic()
+            if now - self._window_start >= self.window:
+                self._window_start = now
+                self._window_count = 0
+            self._window_count += 1
+
+            reset_in = self.window - (now - self._window_start)
+            limit = self.rate_limit or 1000000
+            state = {
+                "limit": limit,
+                "remaining": max(0, limit - self._window_count),
+                "reset_in": reset_in,
+                "retry_after": None,
+            }
+            if self.rate_limit and self._window_count > self.rate_limit:
+                state["retry_after"] = max(1, math.ceil(reset_in))
+            elif self.throttle_every and self.requests % self.throttle_every == 0:
+                state["retry_after"] = self.retry_after
+            if state["retry_after"] is not None:
+                self.throttled += 1
+            return state
+
+    def _listing(self, query: Dict[str, str]) -> List[Dict[str, Any]]:
+        if query.get("sort") != "modified_time":
+            return self.catalog
+        if self._by_modified is None:
+            self._by_modified = sorted(self.catalog, key=lambda v: v["modified_time"], reverse=True)
+        if query.get("direction") == "asc":
+            return self._by_modified[::-1]
+        return self._by_modified
+
+    def respond(self, path: str, query: Dict[str, str]) -> Tuple[int, Any]:
+        """Build the status and body for a GET request."""
+        fields = [f for f in query.get("fields", "").split(",") if f]
+
+        if _LISTING.match(path):
+            page = int(query.get("page", 1))
+            per_page = min(int(query.get("per_page", 25)), 100)
+            response = make_page(self._listing(query), path, page, per_page)
+            if fields:
+                response["data"] = [project(video, fields) for video in response["data"]]
+            return 200, response
+
+        match = _VIDEO.match(path)
+        if match:
+            video = self._by_id.get(match.group(1))
+            if video is None:
+                return 404, {"error": "The requested video couldn't be found."}
+            return 200, project(video, fields) if fields else video
+
+        if _USER.match(path):
+            return 200, {
+                "uri": "/users/1",
+                "name": "Benchmark Channel",
+                "metadata": {"connections": {"videos": {"total": len(self.catalog)}}},
+            }
+
+        return 404, {"error": f"Unknown endpoint {path}"}
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                if server.latency:
+                    time.sleep(server.latency)
+
+                if not self.headers.get("Authorization", "").startswith("Bearer "):
+                    self._send(401, {"error": "A valid user token must be passed."})
+                    return
+
+                state = server._admit()
+                reset = datetime.now(timezone.utc) + timedelta(seconds=state["reset_in"])
+                headers = {
+                    "X-RateLimit-Limit": str(state["limit"]),
+                    "X-RateLimit-Remaining": str(state["remaining"]),
+                    "X-RateLimit-Reset": reset.strftime("%Y-%m-%dT%H:%M:%S+00:00"),
+                }
+                if state["retry_after"] is not None:
+                    headers["Retry-After"] = str(state["retry_after"])
+                    self._send(429, {"error": "Too many API requests."}, headers)
+                    return
+
+                url = urlsplit(self.path)
+                query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+                status, body = server.respond(url.path, query)
+                self._send(status, body, headers)
+
+            def _send(self, status: int, body: Any, headers: Dict[str, str] = None):
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/vnd.vimeo.video+json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a synthetic Vimeo catalog locally")
+    parser.add_argument("--videos", default="1k", help="Catalog size (1k, 10k, 100k or a number)")
+    parser.add_argument("--seed", type=int, default=0, help="Catalog seed")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--rate-limit", type=int, help="Requests per window before answering 429")
+    parser.add_argument("--window", type=float, default=60.0, help="Rate-limit window in seconds")
+    parser.add_argument("--throttle-every", type=int, default=0, help="Answer every Nth request with a 429")
+    args = parser.parse_args()
+
+    server = MockVimeoServer(
+        make_catalog(parse_size(args.videos), args.seed),
+        latency=args.latency,
+        rate_limit=args.rate_limit,
+        window=args.window,
+        throttle_every=args.throttle_every,
+        host=args.host,
+        port=args.port
+    )
+    print(f"Serving {len(server.catalog)} videos at {server.url} (Ctrl+C to stop)")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ Usage:
     python daily_sync.py --time 06:00       # Run at 6 AM daily
     python daily_sync.py --once             # Run once and exit
     python daily_sync.py --config config.yaml  # Use custom config
+    python daily_sync.py --metrics-port 9464   # Serve Prometheus metrics at :9464/metrics
 """
 
 import argparse
@@ -24,6 +25,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from vimeo_roku_sdk import SyncManager, Config
+from vimeo_roku_sdk.metrics import MetricsServer, SyncMetrics
 
 
 def setup_logging(log_file: str = None, level: str = "INFO"):
@@ -41,10 +43,38 @@ def setup_logging(log_file: str = None, level: str = "INFO"):
     )
 
 
-def run_sync(config: Config, upload: bool = True, notify: bool = True) -> bool:
+def log_result(name: str, result):
+    """Log the outcome of a sync or of one channel's part of it."""
+    logger = logging.getLogger(__name__)
+    if result.success:
+        logger.info(
+            f"{name} completed successfully: "
+            f"{result.videos_added} added, "
+            f"{result.videos_skipped} skipped"
+        )
+        if result.feed_url:
+            logger.info(f"Feed published to: {result.feed_url}")
+    else:
+        logger.error(f"{name} failed with {len(result.errors)} errors")
+        for error in result.errors[:5]:
+            logger.error(f"  - {error}")
+
+
+def run_sync(
+    config: Config,
+    upload: bool = True,
+    notify: bool = True,
+    metrics: SyncMetrics = None
+) -> bool:
     """
     Run a single sync operation.
 
+    Args:
+        config: Configuration object
+        upload: Whether to upload to S3
+        notify: Whether to send webhook notification
+        metrics: Metrics to record the run on (optional)
+
     Returns:
         True if sync was successful
     """
@@ -61,33 +91,45 @@ def run_sync(config: Config, upload: bool = True, notify: bool = True) -> bool:
         elif config.vimeo.folder_id:
             source = "folder"
 
-        result = manager.sync(
-            source=source,
-            upload=upload,
-            notify=notify
-        )
-
-        if result.success:
-            logger.info(
-                f"Sync completed successfully: "
-                f"{result.videos_added} added, "
-                f"{result.videos_skipped} skipped"
+        if config.channels:
+            # Every channel is built from one crawl of the source
+            result = manager.sync_channels(
+                source=source,
+                upload=upload,
+                notify=notify
             )
-            if result.feed_url:
-                logger.info(f"Feed published to: {result.feed_url}")
+            results = result.channels
+            for error in result.errors:
+                logger.error(f"Fetching videos failed: {error}")
         else:
-            logger.error(f"Sync failed with {len(result.errors)} errors")
-            for error in result.errors[:5]:
-                logger.error(f"  - {error}")
+            result = manager.sync(
+                source=source,
+                upload=upload,
+                notify=notify
+            )
+            results = {"Sync": result}
+        if metrics:
+            metrics.record(result)
+
+        for name, channel_result in results.items():
+            log_result(name, channel_result)
 
         return result.success
 
     except Exception as e:
         logger.exception(f"Sync failed with exception: {e}")
+        if metrics:
+            metrics.record_failure()
         return False
 
 
-def run_scheduler(config: Config, sync_time: str, upload: bool, notify: bool):
+def run_scheduler(
+    config: Config,
+    sync_time: str,
+    upload: bool,
+    notify: bool,
+    metrics: SyncMetrics = None
+):
     """
     Run the scheduler that triggers sync at specified time.
 
@@ -96,6 +138,7 @@ def run_scheduler(config: Config, sync_time: str, upload: bool, notify: bool):
         sync_time: Time to run sync (HH:MM format)
         upload: Whether to upload to S3
         notify: Whether to send webhook notification
+        metrics: Metrics to record each run on (optional)
     """
     try:
         import schedule
@@ -112,7 +155,7 @@ def run_scheduler(config: Config, sync_time: str, upload: bool, notify: bool):
     # Define the job
     def sync_job():
         logger.info(f"Scheduled sync triggered at {datetime.now()}")
-        run_sync(config, upload, notify)
+        run_sync(config, upload, notify, metrics)
 
     # Schedule the job
     schedule.every().day.at(sync_time).do(sync_job)
@@ -170,6 +213,16 @@ def main():
         "--log-file",
         help="Log file path"
     )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        help="Serve Prometheus metrics of the last sync on this port (scheduler mode)"
+    )
+    parser.add_argument(
+        "--metrics-host",
+        default="0.0.0.0",
+        help="Interface for the metrics endpoint (default: 0.0.0.0)"
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -207,6 +260,11 @@ def main():
         # Run once and exit
         success = run_sync(config, upload, notify)
         sys.exit(0 if success else 1)
+    elif args.metrics_port is not None:
+        # Run scheduler, publishing metrics for scraping
+        metrics = SyncMetrics()
+        with MetricsServer(metrics, host=args.metrics_host, port=args.metrics_port):
+            run_scheduler(config, args.time, upload, notify, metrics)
     else:
         # Run scheduler
         run_scheduler(config, args.time, upload, notify)
@@ -41,10 +41,14 @@ setup(
     extras_require={
         "s3": ["boto3>=1.26.0"],
         "scheduler": ["schedule>=1.2.0"],
+        "async": ["aiohttp>=3.8.0"],
+        "brotli": ["brotli>=1.0.9"],
+        "fast-json": ["orjson>=3.9.0"],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
             "responses>=0.23.0",
+            "moto[s3]>=4.0.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
             "mypy>=1.0.0",
@@ -52,6 +56,9 @@ setup(
         "all": [
             "boto3>=1.26.0",
             "schedule>=1.2.0",
+            "aiohttp>=3.8.0",
+            "brotli>=1.0.9",
+            "orjson>=3.9.0",
         ],
     },
     entry_points={
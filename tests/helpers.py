@@ -0,0 +1,112 @@
+"""
+Shared fixtures for the tests: a Video factory, an in-memory library and a
+SyncManager wired to it.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+from vimeo_roku_sdk.config import Config, VimeoConfig, RokuConfig, SyncConfig
+from vimeo_roku_sdk.models import Thumbnail, Video, VideoFile, VideoQuality
+from vimeo_roku_sdk.sync_manager import SyncManager
+from vimeo_roku_sdk.video_filter import VideoFilter
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_video(
+    video_id: str,
+    title: str = None,
+    privacy: str = "anybody",
+    tags=(),
+    duration: int = 120,
+    days: int = 0,
+    categories=(),
+    playable: bool = False
+) -> Video:
+    """
+    Build a Video created ``days`` after NOW.
+
+    With ``playable`` the video gets a thumbnail and an HLS file, so it
+    passes the real filters.
+    """
+    moment = NOW + timedelta(days=days)
+    video = Video(
+        id=video_id,
+        title=title or f"Video {video_id}",
+        description="",
+        duration=duration,
+        created_time=moment,
+        modified_time=moment,
+        tags=list(tags),
+        categories=list(categories),
+        privacy=privacy
+    )
+    if playable:
+        video.thumbnails = [Thumbnail(url=f"https://i.vimeocdn.com/{video_id}.jpg", width=1280, height=720)]
+        video.video_files = [
+            VideoFile(url=f"https://player.vimeo.com/{video_id}.m3u8", quality=VideoQuality.HD, video_type="HLS")
+        ]
+    return video
+
+
+class FakeLibrary:
+    """Stands in for VimeoClient over an in-memory library."""
+
+    def __init__(self, videos):
+        self.videos = {video.id: video for video in videos}
+        self.changed = []
+        self.full_fetches = 0
+
+    def get_all_videos(self, limit=None):
+        self.full_fetches += 1
+        return list(self.videos.values())
+
+    def iter_all_videos(self, on_total=None):
+        self.full_fetches += 1
+        if on_total:
+            on_total(len(self.videos))
+        yield from list(self.videos.values())
+
+    def get_videos_modified_since(self, since):
+        return [self.videos[video_id] for video_id in self.changed if video_id in self.videos]
+
+    def get_video_ids(self):
+        return set(self.videos)
+
+
+def make_manager(tmp_path, library, detect_deletions=True) -> SyncManager:
+    config = Config(
+        vimeo=VimeoConfig(access_token="token"),
+        roku=RokuConfig(
+            provider_name="Test",
+            feed_output_path=str(tmp_path / "feed.json")
+        ),
+        sync=SyncConfig(
+            cache_path=str(tmp_path / "cache"),
+            detect_deletions=detect_deletions
+        )
+    )
+    manager = SyncManager(config=config, vimeo_client=library)
+    # Keep public videos, whether or not they have video files
+    manager._compile_filter = lambda: VideoFilter(require_playable=False)
+    return manager
+
+
+def feed_titles(tmp_path):
+    with open(tmp_path / "feed.json") as f:
+        feed = json.load(f)
+    return {item["id"]: item["title"] for item in feed.get("shortFormVideos", [])}
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, status_code, payload=None, headers=None):
+        self.status_code = status_code
+        self.content = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self.text = self.content.decode("utf-8")
+        self.headers = headers or {}
+
+    def json(self):
+        return json.loads(self.text)
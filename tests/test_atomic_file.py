@@ -0,0 +1,69 @@
+"""
+Tests for crash-safe file replacement.
+"""
+
+import os
+import stat
+
+import pytest
+
+from vimeo_roku_sdk.atomic_file import atomic_write, list_generations
+from vimeo_roku_sdk.models import RokuFeed
+
+
+class TestAtomicWrite:
+    """Tests for atomic_write."""
+
+    def test_replaces_file(self, tmp_path):
+        """The target holds the new contents and no temporary file is left."""
+        path = tmp_path / "feed.json"
+        path.write_text("old")
+
+        with atomic_write(path) as f:
+            f.write("new")
+
+        assert path.read_text() == "new"
+        assert os.listdir(tmp_path) == ["feed.json"]
+
+    def test_failure_keeps_previous_file(self, tmp_path):
+        """An error while writing leaves the old file untouched."""
+        path = tmp_path / "feed.json"
+        path.write_text("old")
+
+        with pytest.raises(RuntimeError):
+            with atomic_write(path) as f:
+                f.write("partial")
+                raise RuntimeError("crash")
+
+        assert path.read_text() == "old"
+        assert os.listdir(tmp_path) == ["feed.json"]
+
+    def test_keeps_generations(self, tmp_path):
+        """Previous versions are kept newest first up to the limit."""
+        path = tmp_path / "feed.json"
+        for version in range(5):
+            with atomic_write(path, keep=2) as f:
+                f.write(str(version))
+
+        assert path.read_text() == "4"
+        assert [p.read_text() for p in list_generations(path)] == ["3", "2"]
+
+    def test_preserves_permissions(self, tmp_path):
+        """A replaced file keeps the mode of the file it replaces."""
+        path = tmp_path / "feed.json"
+        path.write_text("old")
+        os.chmod(path, 0o644)
+
+        with atomic_write(path, "wb") as f:
+            f.write(b"new")
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o644
+
+    def test_feed_save(self, tmp_path):
+        """RokuFeed.save writes through the atomic layer."""
+        path = tmp_path / "out" / "feed.json"
+        RokuFeed(provider_name="Test").save(str(path), keep=1)
+        RokuFeed(provider_name="Other").save(str(path), keep=1)
+
+        assert '"Other"' in path.read_text()
+        assert '"Test"' in list_generations(path)[0].read_text()
@@ -0,0 +1,189 @@
+"""
+Tests for the local catalog mirror.
+"""
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from vimeo_roku_sdk.catalog_store import CatalogStore
+
+from .helpers import NOW, FakeLibrary, feed_titles, make_manager, make_video
+
+
+class TestCatalogStore:
+    """Tests for CatalogStore."""
+
+    def test_round_trip(self, tmp_path):
+        """Stored videos come back equal, with their media selected."""
+        video = make_video("1", tags=["Sermon"], playable=True)
+        video.release_date = NOW
+        catalog = CatalogStore(str(tmp_path / "catalog.db"))
+        catalog.upsert_videos([video])
+        catalog.close()
+
+        loaded = CatalogStore(str(tmp_path / "catalog.db")).get_video("1")
+
+        assert loaded == video
+        assert loaded.get_best_video_file().url == "https://player.vimeo.com/1.m3u8"
+        assert loaded.get_best_thumbnail().width == 1280
+
+    def test_query_filters(self):
+        """Filters run in SQL; results are newest first."""
+        catalog = CatalogStore(":memory:")
+        catalog.upsert_videos([
+            make_video("1", tags=["Sermon"], duration=30, days=1, categories=["Music"]),
+            make_video("2", tags=["sermon", "kids"], duration=600, days=2, categories=["Music"]),
+            make_video("3", tags=["music"], duration=600, days=3, categories=["Music"]),
+            make_video("4", tags=["sermon"], duration=900, days=4, categories=["Music"], privacy="nobody"),
+        ])
+
+        def ids(**filters):
+            return [video.id for video in catalog.query(**filters)]
+
+        assert ids() == ["4", "3", "2", "1"]
+        assert ids(include_tags=["SERMON"]) == ["4", "2", "1"]
+        assert ids(include_tags=["sermon"], exclude_tags=["kids"]) == ["4", "1"]
+        assert ids(min_duration=60, max_duration=600) == ["3", "2"]
+        assert ids(privacy="anybody", limit=2) == ["3", "2"]
+        assert ids(categories=["music"], modified_since=NOW + timedelta(days=2, seconds=1)) == ["4", "3"]
+
+    def test_modified_since_includes_the_boundary(self):
+        """A video modified in the same second as the cut-off counts as changed, as with the API."""
+        catalog = CatalogStore(":memory:")
+        catalog.upsert_videos([make_video("1", days=1), make_video("2", days=2)])
+
+        changed = catalog.query(modified_since=NOW + timedelta(days=2))
+
+        assert [video.id for video in changed] == ["2"]
+
+    def test_iterates_in_batches(self):
+        """Iteration pages through rows without skipping equal timestamps."""
+        catalog = CatalogStore(":memory:")
+        catalog.upsert_videos(make_video(str(i), days=i % 3, playable=True) for i in range(10))
+
+        videos = list(catalog.iter_videos(batch_size=3))
+
+        assert sorted(video.id for video in videos) == [str(i) for i in range(10)]
+        assert [video.created_time for video in videos] == sorted(
+            (video.created_time for video in videos), reverse=True
+        )
+
+    def test_replacing_a_video_replaces_its_tags(self):
+        """Upserts drop the previous version's tags."""
+        catalog = CatalogStore(":memory:")
+        catalog.upsert_videos([make_video("1", tags=["old"], playable=True)])
+
+        added = catalog.upsert_videos([make_video("1", tags=["new"], playable=True)])
+
+        assert added == 0
+        assert catalog.query(include_tags=["old"]) == []
+        assert [video.id for video in catalog.query(include_tags=["new"])] == ["1"]
+
+
+class TestCatalogRefresh:
+    """Tests for keeping the catalog in step with the library."""
+
+    def test_first_refresh_crawls_then_updates_incrementally(self):
+        """Later refreshes fetch only changes and drop deleted videos."""
+        library = FakeLibrary([make_video(str(i), playable=True) for i in range(3)])
+        catalog = CatalogStore(":memory:")
+
+        first = catalog.refresh(library)
+
+        assert (first.full, first.added) == (True, 3)
+        assert library.full_fetches == 1
+
+        library.videos["1"] = make_video("1", tags=["edited"], playable=True)
+        library.videos["7"] = make_video("7", playable=True)
+        del library.videos["2"]
+        library.changed = ["1", "7"]
+
+        second = catalog.refresh(library)
+
+        assert library.full_fetches == 1
+        assert (second.full, second.added, second.updated, second.removed) == (False, 1, 1, 1)
+        assert catalog.video_ids() == {"0", "1", "7"}
+        assert catalog.get_video("1").tags == ["edited"]
+
+    def test_crawl_does_not_hold_the_write_lock(self, tmp_path):
+        """Other writers get in between batches; an interrupted crawl records no refresh."""
+        path = str(tmp_path / "catalog.db")
+        catalog = CatalogStore(path)
+        catalog.BATCH_SIZE = 2
+        writes = []
+
+        def crawl(on_total=None):
+            for index in range(5):
+                if index == 3:
+                    other = sqlite3.connect(path, timeout=0)
+                    other.execute("INSERT INTO meta (key, value) VALUES ('other', 'writer')")
+                    other.commit()
+                    writes.append(index)
+                    raise RuntimeError("connection lost")
+                yield make_video(str(index), playable=True)
+
+        library = FakeLibrary([])
+        library.iter_all_videos = crawl
+
+        with pytest.raises(RuntimeError):
+            catalog.refresh(library)
+
+        assert writes == [3]
+        assert catalog.get_meta("other") == "writer"
+        assert catalog.count() == 2
+        assert catalog.last_refresh is None
+
+    def test_changed_client_settings_force_a_crawl(self):
+        """Videos parsed with other fields are fetched again in full."""
+        library = FakeLibrary([make_video("1", playable=True)])
+        catalog = CatalogStore(":memory:")
+        catalog.refresh(library)
+
+        library.fields = "uri,name"
+        result = catalog.refresh(library)
+
+        assert result.full
+        assert library.full_fetches == 2
+
+
+class TestCatalogSync:
+    """Tests for syncing from the catalog."""
+
+    def make_manager(self, tmp_path, library):
+        manager = make_manager(tmp_path, library)
+        manager.config.sync.catalog_enabled = True
+        return manager
+
+    def test_syncs_from_the_catalog(self, tmp_path):
+        """Only the first sync crawls; later ones read the mirror."""
+        library = FakeLibrary([make_video(str(i)) for i in range(3)])
+        self.make_manager(tmp_path, library).sync()
+
+        library.videos["1"] = make_video("1", title="Renamed")
+        library.changed = ["1"]
+        result = self.make_manager(tmp_path, library).sync(streaming=True)
+
+        assert result.success
+        assert library.full_fetches == 1
+        assert "catalog_refresh" in result.trace["stages"]
+        assert feed_titles(tmp_path)["vimeo-1"] == "Renamed"
+
+    def test_incremental_sync_reads_changes_from_the_catalog(self, tmp_path):
+        """Changes since the last sync and deletions come from the mirror."""
+        library = FakeLibrary([make_video(str(i)) for i in range(3)])
+        self.make_manager(tmp_path, library).sync()
+
+        renamed = make_video("1", title="Renamed")
+        renamed.modified_time = datetime.now(timezone.utc) + timedelta(hours=1)
+        library.videos["1"] = renamed
+        del library.videos["2"]
+        library.changed = ["1"]
+
+        result = self.make_manager(tmp_path, library).sync(incremental=True)
+
+        assert result.success
+        assert library.full_fetches == 1
+        assert (result.videos_updated, result.videos_removed) == (1, 1)
+        assert feed_titles(tmp_path) == {"vimeo-0": "Video 0", "vimeo-1": "Renamed"}
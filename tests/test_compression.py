@@ -0,0 +1,88 @@
+"""
+Tests for pre-compressed feed artifacts.
+"""
+
+import gzip
+import json
+import os
+import sys
+import types
+
+import pytest
+
+from vimeo_roku_sdk.atomic_file import Discard
+from vimeo_roku_sdk.compression import open_feed_output, resolve_encodings
+from vimeo_roku_sdk.config import RokuConfig
+from vimeo_roku_sdk.exceptions import ConfigurationError
+from vimeo_roku_sdk.models import RokuFeed
+from vimeo_roku_sdk.roku_feed import RokuFeedUploader
+
+
+class TestFeedOutput:
+    """Tests for writing a feed with compressed artifacts."""
+
+    def test_gzip_artifact_matches_feed(self, tmp_path):
+        """The .gz artifact decompresses to the saved JSON."""
+        path = tmp_path / "feed.json"
+        feed = RokuFeed(provider_name="Chaîne")
+
+        feed.save(str(path), encodings=["gzip"])
+
+        with gzip.open(f"{path}.gz", "rb") as f:
+            assert f.read() == path.read_bytes()
+        assert json.loads(path.read_text(encoding="utf-8"))["providerName"] == "Chaîne"
+
+    def test_gzip_output_is_reproducible(self, tmp_path):
+        """Identical feeds give byte-identical artifacts."""
+        path = tmp_path / "feed.json"
+        feed = RokuFeed(provider_name="Test")
+
+        feed.save(str(path), encodings=["gzip"])
+        first = (tmp_path / "feed.json.gz").read_bytes()
+        feed.save(str(path), encodings=["gzip"])
+
+        assert (tmp_path / "feed.json.gz").read_bytes() == first
+
+    def test_discard_drops_every_file(self, tmp_path):
+        """Discarding leaves neither the feed, the artifacts nor temporary files."""
+        with open_feed_output(tmp_path / "feed.json", ["gzip"]) as output:
+            output.write("{}")
+            raise Discard()
+
+        assert os.listdir(tmp_path) == []
+
+    def test_resolve_encodings(self, monkeypatch):
+        """Unknown encodings are rejected and missing Brotli is skipped."""
+        monkeypatch.setitem(sys.modules, "brotli", None)
+
+        assert resolve_encodings(["gzip", "br", "gzip"]) == ["gzip"]
+        with pytest.raises(ConfigurationError):
+            resolve_encodings(["zstd"])
+
+
+class TestCompressedUpload:
+    """Tests for uploading compressed artifacts."""
+
+    def test_uploads_artifacts_with_content_encoding(self, tmp_path, monkeypatch):
+        """Artifacts go up first with Content-Encoding and cache headers."""
+        uploads = []
+
+        class FakeS3:
+            def upload_file(self, path, bucket, key, ExtraArgs, Config):
+                uploads.append((key, ExtraArgs))
+
+        monkeypatch.setitem(
+            sys.modules, "boto3.s3.transfer", types.SimpleNamespace(TransferConfig=lambda **kwargs: kwargs)
+        )
+        path = tmp_path / "feed.json"
+        RokuFeed(provider_name="Test").save(str(path), encodings=["gzip"])
+        config = RokuConfig(s3_bucket="bucket", s3_key="feed.json", feed_compression=["gzip"])
+
+        url = RokuFeedUploader(config, s3_client=FakeS3()).upload_to_s3(str(path))
+
+        assert url == "https://bucket.s3.amazonaws.com/feed.json"
+        assert [key for key, _ in uploads] == ["feed.json.gz", "feed.json"]
+        assert uploads[0][1]["ContentEncoding"] == "gzip"
+        assert uploads[0][1]["ContentType"] == "application/json"
+        assert "ContentEncoding" not in uploads[1][1]
+        assert all(args["CacheControl"] == "max-age=300" for _, args in uploads)
@@ -8,6 +8,7 @@ import tempfile
 from pathlib import Path
 
 from vimeo_roku_sdk.config import (
+    ChannelConfig,
     Config,
     VimeoConfig,
     RokuConfig,
@@ -172,3 +173,74 @@ sync:
 
         assert valid_config.is_valid() is True
         assert invalid_config.is_valid() is False
+
+
+class TestChannelConfig:
+    """Tests for multi-channel configuration."""
+
+    def test_overrides_top_level_sections(self):
+        """A channel's sections override the top-level ones."""
+        channel = ChannelConfig.from_dict(
+            {"name": "kids", "roku": {"provider_name": "Kids"}, "sync": {"include_tags": ["kids"]}},
+            roku_defaults={"provider_name": "Main", "language": "es"},
+            sync_defaults={"min_duration": 30, "cache_path": "/tmp/cache", "trace_path": "/tmp/trace.json"}
+        )
+
+        assert channel.roku.provider_name == "Kids"
+        assert channel.roku.language == "es"
+        assert channel.sync.include_tags == ["kids"]
+        assert channel.sync.min_duration == 30
+        assert channel.sync.cache_path == str(Path("/tmp/cache") / "channels" / "kids")
+        assert channel.sync.trace_path is None
+
+    def test_requires_name(self):
+        """Channels must be named."""
+        with pytest.raises(ConfigurationError):
+            ChannelConfig.from_dict({"roku": {"provider_name": "Kids"}})
+
+    def test_from_yaml(self, tmp_path):
+        """Channels are read from the YAML file."""
+        path = tmp_path / "config.yaml"
+        path.write_text("""
+vimeo:
+  access_token: "token"
+roku:
+  language: "fr"
+channels:
+  - name: main
+    roku: {provider_name: "Main", feed_output_path: "main.json"}
+  - name: kids
+    roku: {provider_name: "Kids", feed_output_path: "kids.json"}
+""")
+
+        config = Config.from_yaml(str(path))
+
+        assert [channel.name for channel in config.channels] == ["main", "kids"]
+        assert config.channels[1].roku.language == "fr"
+        assert config.validate() == []
+
+    def test_validate_channels(self):
+        """Channels need providers and their own feed paths and state."""
+        config = Config(
+            vimeo=VimeoConfig(access_token="token"),
+            channels=[
+                ChannelConfig("a", RokuConfig(provider_name="A", feed_output_path="feed.json")),
+                ChannelConfig("b", RokuConfig(provider_name="", feed_output_path="feed.json")),
+            ]
+        )
+
+        errors = config.validate()
+
+        assert any("provider name is required for channel 'b'" in e for e in errors)
+        assert any("same feed_output_path" in e for e in errors)
+        assert any("cache_path" in e for e in errors)
+
+    @pytest.mark.parametrize("name", ["../escape", "a/b", ".hidden", "with space"])
+    def test_rejects_unsafe_names(self, name):
+        """Channel names must be plain slugs, since they name cache directories."""
+        config = Config(
+            vimeo=VimeoConfig(access_token="token"),
+            channels=[ChannelConfig.from_dict({"name": name, "roku": {"provider_name": "A"}})]
+        )
+
+        assert any("must contain only letters" in e for e in config.validate())
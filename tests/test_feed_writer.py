@@ -0,0 +1,143 @@
+"""
+Tests for the streaming feed writer.
+"""
+
+import io
+import json
+import tracemalloc
+from datetime import datetime, timezone
+
+import pytest
+
+from vimeo_roku_sdk.feed_writer import FeedWriter, SectionSpool, serialize_item
+from vimeo_roku_sdk.models import RokuFeed, RokuVideo, VideoType
+from vimeo_roku_sdk.exceptions import RokuFeedError
+
+
+def make_video(index: int, video_type: VideoType = VideoType.SHORT_FORM) -> RokuVideo:
+    return RokuVideo(
+        id=f"vimeo-{index}",
+        title=f"Vidéo {index} — \"quoted\"",
+        short_description="Short\nline",
+        long_description="Long " * 40,
+        release_date="2025-01-01",
+        duration=60,
+        thumbnail=f"https://example.com/{index}.jpg",
+        content={
+            "dateAdded": "2025-01-01T00:00:00Z",
+            "duration": 60,
+            "videos": [{"url": f"https://example.com/{index}.m3u8", "quality": "HD", "videoType": "HLS"}]
+        },
+        tags=["a", "b"],
+        genres=["Entertainment"],
+        video_type=video_type,
+        rating={"rating": "TV-G", "ratingSource": "USA_TV"} if index % 2 else None
+    )
+
+
+class TestFeedWriter:
+    """Tests for FeedWriter."""
+
+    def test_matches_json_dumps(self):
+        """Every section and value type is written exactly as json.dumps would."""
+        feed = RokuFeed(
+            provider_name="Chaîne",
+            last_updated=datetime(2025, 1, 2, 3, 4, 5),
+            series=[{"id": "s1", "seasons": [{"episodes": []}], "meta": {}}],
+            playlists=[{"name": "p", "itemIds": ["vimeo-1"]}],
+            categories=[{"name": "All", "query": "a OR b", "order": "most_recent"}]
+        )
+        for index in range(5):
+            feed.add_video(make_video(index, VideoType.SHORT_FORM))
+        feed.add_video(make_video(10, VideoType.MOVIE))
+        feed.add_video(make_video(20, VideoType.TV_SPECIAL))
+
+        buffer = io.StringIO()
+        feed.write_json(buffer)
+
+        assert buffer.getvalue() == json.dumps(feed.to_dict(), indent=2, ensure_ascii=False)
+
+    def test_header_only_and_empty_section(self):
+        """Feeds without videos and explicitly empty sections stay compatible."""
+        buffer = io.StringIO()
+        writer = FeedWriter(buffer)
+        writer.write_header("Test", "en", datetime(2025, 1, 1, tzinfo=timezone.utc))
+        writer.begin_section("movies")
+        writer.end_section()
+        writer.close()
+
+        assert buffer.getvalue() == json.dumps(
+            {"providerName": "Test", "language": "en", "lastUpdated": "2025-01-01T00:00:00Z", "movies": []},
+            indent=2
+        )
+
+    def test_rejects_keys_out_of_order(self):
+        """Keys must follow the feed layout so the output stays canonical."""
+        writer = FeedWriter(io.StringIO())
+        writer.write_header("Test", "en", datetime(2025, 1, 1))
+        writer.begin_section("movies")
+        writer.end_section()
+
+        with pytest.raises(RokuFeedError):
+            writer.begin_section("shortFormVideos")
+
+    def test_digest_ignores_last_updated(self):
+        """The digest covers the content but not the generation time."""
+        feed = RokuFeed(provider_name="Test", last_updated=datetime(2025, 1, 1))
+        feed.add_video(make_video(1))
+        first = feed.write_json(io.StringIO())
+
+        feed.last_updated = datetime(2026, 6, 1)
+        second = feed.write_json(io.StringIO())
+        feed.add_video(make_video(2))
+        third = feed.write_json(io.StringIO())
+
+        assert first == second
+        assert third != first
+
+    def test_save_memory_stays_flat(self, tmp_path):
+        """Saving never holds more than a small part of the feed in memory."""
+        feed = RokuFeed(provider_name="Test")
+        for index in range(3000):
+            feed.add_video(make_video(index))
+        path = tmp_path / "feed.json"
+
+        tracemalloc.start()
+        try:
+            feed.save(str(path))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert path.stat().st_size > 2_000_000
+        assert peak < path.stat().st_size / 10
+
+
+class TestSectionSpool:
+    """Tests for SectionSpool."""
+
+    def test_spooled_sections_match_json_dumps(self):
+        """Items added in any order are written grouped by section."""
+        feed = RokuFeed(provider_name="Test", last_updated=datetime(2025, 1, 1))
+        buffer = io.StringIO()
+
+        with SectionSpool() as spool:
+            for index, video_type in enumerate([VideoType.MOVIE, VideoType.SHORT_FORM, VideoType.MOVIE]):
+                video = make_video(index, video_type)
+                feed.add_video(video)
+                spool.add(RokuFeed.SECTIONS[video_type], serialize_item(video.to_dict()))
+
+            writer = FeedWriter(buffer)
+            writer.write_header(feed.provider_name, feed.language, feed.last_updated)
+            for key in spool.sections:
+                writer.write_spooled_section(key, spool)
+            writer.close()
+
+        assert spool.sections == []
+        assert buffer.getvalue() == json.dumps(feed.to_dict(), indent=2, ensure_ascii=False)
+
+    def test_rejects_unknown_section(self):
+        """Only feed section keys can be spooled."""
+        with SectionSpool() as spool:
+            with pytest.raises(RokuFeedError):
+                spool.add("clips", "{}")
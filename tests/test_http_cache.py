@@ -0,0 +1,110 @@
+"""
+Tests for the conditional request response cache.
+"""
+
+import os
+import time
+
+from vimeo_roku_sdk.http_cache import ResponseCache
+from vimeo_roku_sdk.vimeo_client import VimeoClient
+
+from .helpers import FakeResponse
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_put_and_get(self, tmp_path):
+        """Responses with a validator are stored and returned."""
+        cache = ResponseCache(str(tmp_path))
+
+        stored = cache.put("/me/videos", {"page": 1}, {"ETag": '"abc"'}, b'{"data": []}')
+        entry = cache.get("/me/videos", {"page": 1})
+
+        assert stored is True
+        assert entry.etag == '"abc"'
+        assert entry.json() == {"data": []}
+        assert entry.conditional_headers() == {"If-None-Match": '"abc"'}
+
+    def test_key_includes_params(self, tmp_path):
+        """Different query parameters are cached separately."""
+        cache = ResponseCache(str(tmp_path))
+
+        cache.put("/me/videos", {"page": 1}, {"ETag": '"1"'}, b"{}")
+
+        assert cache.get("/me/videos", {"page": 2}) is None
+        assert cache.get("/me/videos", {"page": 1}) is not None
+
+    def test_skips_responses_without_validators(self, tmp_path):
+        """Responses without ETag or Last-Modified are not cached."""
+        cache = ResponseCache(str(tmp_path))
+
+        assert cache.put("/me", {}, {}, b"{}") is False
+        assert cache.get("/me", {}) is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """The cache stays within its size bound, dropping the oldest entries."""
+        cache = ResponseCache(str(tmp_path), max_bytes=250)
+        body = b"x" * 100
+
+        cache.put("/a", {}, {"ETag": "a"}, body)
+        cache.put("/b", {}, {"ETag": "b"}, body)
+        old = time.time() - 60
+        os.utime(tmp_path / f"{cache.make_key('/a')}.body", (old, old))
+        os.utime(tmp_path / f"{cache.make_key('/b')}.body", (old + 1, old + 1))
+        cache.get("/a")  # Touch /a so /b becomes the oldest
+        cache.put("/c", {}, {"ETag": "c"}, body)
+
+        assert cache.total_bytes <= 250
+        assert cache.get("/b") is None
+        assert cache.get("/a") is not None
+        assert cache.get("/c") is not None
+
+    def test_hit_survives_entry_removed_after_read(self, tmp_path, monkeypatch):
+        """A body removed between the read and the touch is still a hit."""
+        cache = ResponseCache(str(tmp_path))
+        cache.put("/me/videos", {}, {"ETag": '"abc"'}, b'{"data": []}')
+
+        def removed(path, *args, **kwargs):
+            raise FileNotFoundError(path)
+
+        monkeypatch.setattr(os, "utime", removed)
+
+        assert cache.get("/me/videos", {}).body == b'{"data": []}'
+
+    def test_reloads_from_disk(self, tmp_path):
+        """Entries survive across cache instances."""
+        ResponseCache(str(tmp_path)).put("/me", {}, {"Last-Modified": "yesterday"}, b"{}")
+
+        entry = ResponseCache(str(tmp_path)).get("/me", {})
+
+        assert entry.conditional_headers() == {"If-Modified-Since": "yesterday"}
+
+
+class TestConditionalRequests:
+    """Tests for VimeoClient's use of the cache."""
+
+    def test_not_modified_served_from_cache(self, tmp_path):
+        """A 304 reply returns the cached body."""
+        payload = {"total": 1, "data": [{"uri": "/videos/1"}]}
+        sent_headers = []
+        responses = [
+            FakeResponse(200, payload, {"ETag": '"v1"'}),
+            FakeResponse(304, None, {"ETag": '"v1"'}),
+        ]
+
+        client = VimeoClient(access_token="token", response_cache=ResponseCache(str(tmp_path)))
+
+        def request(**kwargs):
+            sent_headers.append(kwargs.get("headers"))
+            return responses.pop(0)
+
+        client.session.request = request
+
+        first = client.get_videos(page=1)
+        second = client.get_videos(page=1)
+
+        assert first == payload
+        assert second == payload
+        assert sent_headers[0] is None
+        assert sent_headers[1] == {"If-None-Match": '"v1"'}
@@ -0,0 +1,91 @@
+"""
+Tests for the JSON codec layer.
+"""
+
+import json
+
+import pytest
+
+from vimeo_roku_sdk import json_codec
+from vimeo_roku_sdk.exceptions import ConfigurationError
+from vimeo_roku_sdk.models import RokuFeed, RokuVideo
+
+
+def installed_backends():
+    backends = ["json"]
+    for name in ("orjson", "msgspec"):
+        try:
+            __import__(name)
+        except ImportError:
+            continue
+        backends.append(name)
+    return backends
+
+
+@pytest.fixture(params=installed_backends())
+def backend(request):
+    previous = json_codec.get_backend()
+    json_codec.set_backend(request.param)
+    yield request.param
+    json_codec.set_backend(previous)
+
+
+FEED_ITEM = {
+    "id": "123",
+    "title": "Café   \"quoted\" \\ tab\t",
+    "content": {
+        "duration": 120,
+        "videos": [{"url": "https://example.com/v.m3u8", "quality": "HD", "videoType": "HLS"}],
+    },
+    "tags": [],
+    "genres": ["faith"],
+    "rating": None,
+    "extra": {},
+    "flag": True,
+}
+
+
+class TestJsonCodec:
+    """Tests for encoding and decoding with each installed backend."""
+
+    def test_round_trip(self, backend):
+        """Compact output decodes back to the same value, from bytes or text."""
+        encoded = json_codec.dumps(FEED_ITEM)
+
+        assert isinstance(encoded, bytes)
+        assert json_codec.loads(encoded) == FEED_ITEM
+        assert json_codec.loads(encoded.decode("utf-8")) == FEED_ITEM
+
+    def test_indented_matches_stdlib(self, backend):
+        """Feed-style output is byte-identical to json.dumps(indent=2)."""
+        for value in (FEED_ITEM, [], {}, "x", [1, [2, {}]]):
+            assert json_codec.dumps_indented(value) == json.dumps(value, indent=2, ensure_ascii=False)
+
+    def test_feed_is_backend_independent(self, backend):
+        """Saved feeds, and so their digests, do not depend on the backend."""
+        feed = RokuFeed(provider_name="Test")
+        feed.add_video(RokuVideo.from_dict(FEED_ITEM))
+
+        assert feed.to_json() == json.dumps(feed.to_dict(), indent=2, ensure_ascii=False)
+
+    def test_invalid_json_raises_value_error(self, backend):
+        with pytest.raises(ValueError):
+            json_codec.loads(b"{not json")
+
+    def test_unsupported_keys_fall_back(self, backend):
+        """Values the fast backends reject are encoded by the standard library."""
+        assert json_codec.loads(json_codec.dumps({1: "a"})) == {"1": "a"}
+
+    def test_unknown_backend(self):
+        with pytest.raises(ConfigurationError):
+            json_codec.set_backend("simplejson")
+
+    def test_auto_prefers_fast_backend(self):
+        """'auto' picks orjson, then msgspec, then the standard library."""
+        installed = installed_backends()
+        expected = next(name for name in json_codec.BACKENDS if name in installed)
+        previous = json_codec.get_backend()
+        try:
+            assert json_codec.set_backend("auto") == expected
+        finally:
+            json_codec.set_backend(previous)
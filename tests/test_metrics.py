@@ -0,0 +1,139 @@
+"""
+Tests for the Prometheus metrics endpoint.
+"""
+
+import urllib.error
+import urllib.request
+
+import pytest
+
+from vimeo_roku_sdk.metrics import MetricsServer, SyncMetrics, metric_name
+from vimeo_roku_sdk.sync_manager import MultiChannelResult, SyncResult
+
+from .helpers import FakeLibrary, make_manager, make_video
+
+
+def sample(text, name):
+    """Value of the sample line starting with ``name``."""
+    for line in text.splitlines():
+        if line.startswith(name + " "):
+            return float(line.split()[-1])
+    raise AssertionError(f"{name} not found")
+
+
+class TestSyncMetrics:
+    """Tests for SyncMetrics."""
+
+    def test_metric_name(self):
+        """Dotted trace names become valid metric names."""
+        assert metric_name("last_sync", "http.latency_seconds") == "last_sync_http_latency_seconds"
+
+    def test_before_first_run(self):
+        """Only run totals are published until a sync finishes."""
+        text = SyncMetrics().render()
+
+        assert sample(text, "vimeo_roku_sync_runs_total") == 0
+        assert "vimeo_roku_last_sync_success" not in text
+
+    def test_renders_last_result(self):
+        """Counts, stage times, counters, gauges and histograms are published."""
+        result = SyncResult(
+            success=True, videos_processed=5, videos_added=4, videos_skipped=1,
+            skip_reasons={"private": 1}, duration_seconds=2.5
+        )
+        result.trace = {
+            "stages": {"fetch": {"count": 1, "seconds": 1.5}, "upload": {"count": 1, "seconds": 0.25}},
+            "counters": {"http.requests": 3, "http.bytes": 4096},
+            "gauges": {"rate_limit.remaining": 240, "feed.bytes": 1234},
+            "histograms": {
+                "http.latency_seconds": {
+                    "count": 3, "sum": 0.4, "min": 0.1, "max": 0.2,
+                    "buckets": {"0.1": 1, "0.25": 2, "+Inf": 0},
+                }
+            },
+        }
+        metrics = SyncMetrics()
+        metrics.record(result)
+
+        text = metrics.render()
+
+        assert sample(text, "vimeo_roku_last_sync_success") == 1
+        assert sample(text, "vimeo_roku_last_sync_duration_seconds") == 2.5
+        assert sample(text, 'vimeo_roku_last_sync_videos{outcome="added"}') == 4
+        assert sample(text, 'vimeo_roku_last_sync_stage_seconds{stage="upload"}') == 0.25
+        assert sample(text, 'vimeo_roku_last_sync_skipped_videos{reason="private"}') == 1
+        assert sample(text, "vimeo_roku_last_sync_http_bytes") == 4096
+        assert sample(text, "vimeo_roku_rate_limit_remaining") == 240
+        assert sample(text, "vimeo_roku_feed_bytes") == 1234
+        assert sample(text, 'vimeo_roku_last_sync_http_latency_seconds_bucket{le="0.25"}') == 3
+        assert sample(text, 'vimeo_roku_last_sync_http_latency_seconds_bucket{le="+Inf"}') == 3
+        assert sample(text, "vimeo_roku_last_sync_http_latency_seconds_count") == 3
+        assert "# TYPE vimeo_roku_last_sync_http_latency_seconds histogram" in text
+
+    def test_failures_keep_last_success_time(self):
+        """A failed run is counted without moving the last success time."""
+        metrics = SyncMetrics()
+        metrics.record(SyncResult(success=True))
+        succeeded_at = metrics.last_success_time
+        metrics.record_failure()
+
+        text = metrics.render()
+
+        assert sample(text, "vimeo_roku_sync_runs_total") == 2
+        assert sample(text, "vimeo_roku_sync_failures_total") == 1
+        assert sample(text, "vimeo_roku_last_successful_sync_timestamp_seconds") == succeeded_at
+        assert sample(text, "vimeo_roku_last_sync_success") == 0
+
+    def test_from_real_sync(self, tmp_path):
+        """A sync records its feed size for the metrics."""
+        result = make_manager(tmp_path, FakeLibrary([make_video("1")])).sync()
+        metrics = SyncMetrics()
+        metrics.record(result)
+
+        text = metrics.render()
+
+        assert sample(text, "vimeo_roku_feed_bytes") == (tmp_path / "feed.json").stat().st_size
+        assert sample(text, 'vimeo_roku_last_sync_stage_count{stage="save"}') == 1
+
+    def test_multi_channel_result(self):
+        """Channel results are labelled, with each family listed once."""
+        result = MultiChannelResult(
+            success=True,
+            videos_fetched=10,
+            channels={
+                "main": SyncResult(success=True, videos_added=10),
+                "kids": SyncResult(success=True, videos_added=4, videos_skipped=6),
+            },
+            trace={"counters": {"http.requests": 2}},
+        )
+        metrics = SyncMetrics()
+        metrics.record(result)
+
+        text = metrics.render()
+
+        assert sample(text, "vimeo_roku_last_sync_videos_fetched") == 10
+        assert sample(text, "vimeo_roku_last_sync_http_requests") == 2
+        assert sample(text, 'vimeo_roku_last_sync_videos{channel="kids",outcome="added"}') == 4
+        assert sample(text, 'vimeo_roku_last_sync_success{channel="main"}') == 1
+        assert text.count("# TYPE vimeo_roku_last_sync_videos gauge") == 1
+
+
+class TestMetricsServer:
+    """Tests for MetricsServer."""
+
+    def test_serves_metrics(self):
+        """/metrics returns the rendered metrics; other paths are not found."""
+        metrics = SyncMetrics()
+        metrics.record(SyncResult(success=True, videos_added=7))
+
+        with MetricsServer(metrics, host="127.0.0.1", port=0) as server:
+            with urllib.request.urlopen(server.url) as response:
+                body = response.read().decode("utf-8")
+                content_type = response.headers["Content-Type"]
+
+            with pytest.raises(urllib.error.HTTPError) as error:
+                urllib.request.urlopen(server.url.replace("/metrics", "/other"))
+
+        assert content_type.startswith("text/plain; version=0.0.4")
+        assert sample(body, 'vimeo_roku_last_sync_videos{outcome="added"}') == 7
+        assert error.value.code == 404
@@ -2,9 +2,15 @@
 Tests for data models.
 """
 
+import json
 import pytest
-from datetime import datetime
+from dataclasses import field
+from datetime import datetime, timezone
+from typing import List
+from vimeo_roku_sdk import models
 from vimeo_roku_sdk.models import (
+    slotted_dataclass,
+    MediaPolicy,
     Video,
     RokuVideo,
     RokuFeed,
@@ -35,6 +41,8 @@ class TestVideo:
         assert video.title == "Test Video"
         assert video.description == "A test video"
         assert video.duration == 120
+        assert video.release_date == video.created_time
+        assert video.date_errors == ()
 
     def test_from_vimeo_response_with_pictures(self):
         """Test creating Video with thumbnail pictures."""
@@ -83,6 +91,125 @@ class TestVideo:
         thumb = video.get_best_thumbnail(min_width=500)
         assert thumb.width == 640
 
+    def test_lean_parse_keeps_selected_media(self):
+        """Lean parsing keeps only what the feed uses and converts identically."""
+        data = {
+            "uri": "/videos/123456",
+            "name": "Test Video",
+            "duration": 120,
+            "created_time": "2025-01-01T00:00:00Z",
+            "modified_time": "2025-01-01T00:00:00Z",
+            "embed": {"html": "<iframe></iframe>"},
+            "pictures": {
+                "sizes": [
+                    {"link": "https://example.com/thumb_640.jpg", "width": 640, "height": 360},
+                    {"link": "https://example.com/thumb_960.jpg", "width": 960, "height": 540},
+                    {"link": "https://example.com/thumb_1920.jpg", "width": 1920, "height": 1080}
+                ]
+            },
+            "files": [
+                {"link": "https://example.com/360.mp4", "type": "video/mp4", "height": 360},
+                {"link": "https://example.com/1080.mp4", "type": "video/mp4", "height": 1080}
+            ]
+        }
+
+        full = Video.from_vimeo_response(data)
+        lean = Video.from_vimeo_response(data, lean=True)
+
+        assert [t.width for t in lean.thumbnails] == [960]
+        assert [f.url for f in lean.video_files] == ["https://example.com/1080.mp4"]
+        assert lean.embed_html is None
+        assert lean.content_fingerprint() == full.content_fingerprint()
+        assert RokuVideo.from_video(lean) == RokuVideo.from_video(full)
+
+    def test_models_are_slotted(self):
+        """Per-video models carry no instance __dict__."""
+        video = Video(
+            id="1", title="T", description="", duration=1,
+            created_time=datetime.now(), modified_time=datetime.now()
+        )
+
+        assert not hasattr(video, "__dict__")
+        assert not hasattr(RokuVideo.from_video(video), "__dict__")
+
+    def test_slotted_fallback(self, monkeypatch):
+        """The pre-3.10 fallback builds an equivalent slotted dataclass."""
+        monkeypatch.setattr(models.sys, "version_info", (3, 8, 0))
+
+        @slotted_dataclass
+        class Point:
+            x: int
+            y: int = 0
+            tags: List[str] = field(default_factory=list)
+
+        point = Point(1)
+        assert Point.__slots__ == ("x", "y", "tags")
+        assert not hasattr(point, "__dict__")
+        assert point == Point(1, 0, [])
+        with pytest.raises(AttributeError):
+            point.z = 1
+
+    def test_best_video_file(self):
+        """HLS is preferred, otherwise the highest quality file comes first."""
+        def video_with(files):
+            return Video(
+                id="1", title="T", description="", duration=1,
+                created_time=datetime.now(), modified_time=datetime.now(),
+                video_files=files
+            )
+
+        sd = VideoFile(url="sd", quality=VideoQuality.SD, video_type="MP4")
+        fhd = VideoFile(url="fhd", quality=VideoQuality.FHD, video_type="MP4")
+        fhd2 = VideoFile(url="fhd2", quality=VideoQuality.FHD, video_type="MP4")
+        hls = VideoFile(url="hls", quality=VideoQuality.HD, video_type="HLS")
+
+        assert video_with([sd, fhd, hls]).get_best_video_file() is hls
+        assert video_with([sd, fhd, fhd2]).get_best_video_file() is fhd
+        assert video_with([]).get_best_video_file() is None
+
+    def test_selection_is_memoized_at_parse_time(self):
+        """The choice made while parsing is reused and follows the policy."""
+        data = {
+            "uri": "/videos/1",
+            "pictures": {"sizes": [
+                {"link": "small", "width": 640, "height": 360},
+                {"link": "large", "width": 1280, "height": 720}
+            ]},
+            "files": [{"link": "file.mp4", "type": "video/mp4", "height": 1080}],
+            "play": {"hls": {"link": "stream.m3u8"}}
+        }
+
+        default = Video.from_vimeo_response(data)
+        custom = Video.from_vimeo_response(
+            data, policy=MediaPolicy(min_thumbnail_width=600, preferred_video_type="MP4")
+        )
+
+        assert default.selected_media is not None
+        assert default.get_best_thumbnail() is default.selected_media[0]
+        assert (default.get_best_thumbnail().url, default.get_best_video_file().url) == ("large", "stream.m3u8")
+        assert (custom.get_best_thumbnail().url, custom.get_best_video_file().url) == ("small", "file.mp4")
+        assert RokuVideo.from_video(custom).thumbnail == "small"
+
+    def test_invalid_dates_are_reported(self):
+        """Malformed dates fall back to the video's other dates, not the current time."""
+        video = Video.from_vimeo_response({
+            "uri": "/videos/1",
+            "created_time": "not a date",
+            "modified_time": "2025-01-05T10:00:00+00:00",
+            "release_time": "2025-13-40"
+        })
+
+        assert video.created_time == datetime(2025, 1, 5, 10, tzinfo=timezone.utc)
+        assert video.release_date == video.created_time
+        assert video.date_errors == (
+            "created_time 'not a date' is not a valid timestamp",
+            "release_time '2025-13-40' is not a valid timestamp",
+        )
+
+        undated = Video.from_vimeo_response({"uri": "/videos/2"})
+        assert undated.created_time == undated.modified_time == datetime(1970, 1, 1, tzinfo=timezone.utc)
+        assert undated.date_errors == ("created_time is missing", "modified_time is missing")
+
     def test_determine_quality(self):
         """Test video quality determination."""
         assert Video._determine_quality(2160) == VideoQuality.UHD
@@ -209,3 +336,72 @@ class TestRokuFeed:
 
         assert "Test Provider" in json_str
         assert "providerName" in json_str
+
+    def test_from_dict_round_trip(self):
+        """A saved feed loads back with its videos in their sections."""
+        feed = RokuFeed(provider_name="Test Provider")
+        feed.add_video(make_roku_video("a", VideoType.SHORT_FORM))
+        feed.add_video(make_roku_video("b", VideoType.MOVIE))
+
+        loaded = RokuFeed.from_dict(feed.to_dict())
+
+        assert loaded.to_dict() == feed.to_dict()
+        assert loaded.movies[0].video_type == VideoType.MOVIE
+
+    def test_merge_videos(self):
+        """Merging upserts by ID, moves retyped videos and drops removed ones."""
+        feed = RokuFeed(provider_name="Test Provider")
+        for video_id in ("a", "b", "c"):
+            feed.add_video(make_roku_video(video_id, VideoType.SHORT_FORM))
+
+        counts = feed.merge_videos(
+            [
+                make_roku_video("b", VideoType.SHORT_FORM, title="B2"),
+                make_roku_video("c", VideoType.MOVIE),
+                make_roku_video("d", VideoType.SHORT_FORM),
+            ],
+            removed_ids=["a", "missing"]
+        )
+
+        assert counts == {"added": 1, "updated": 2, "removed": 1}
+        assert [v.id for v in feed.short_form_videos] == ["d", "b"]
+        assert feed.short_form_videos[1].title == "B2"
+        assert [v.id for v in feed.movies] == ["c"]
+
+
+    def test_to_json_matches_json_dumps(self):
+        """Spliced fragments produce exactly what json.dumps would."""
+        feed = RokuFeed(provider_name="Tést \u2603", series=[{"id": "s", "seasons": []}])
+        feed.add_video(make_roku_video("a", VideoType.SHORT_FORM, title="Café \"quoted\"\n"))
+        feed.add_video(make_roku_video("b", VideoType.MOVIE))
+        cached = make_roku_video("c", VideoType.MOVIE)
+        feed.add_video(RokuVideo.from_fragment(cached.to_json_fragment(), VideoType.MOVIE))
+
+        expected = json.dumps(feed.to_dict(), indent=2, ensure_ascii=False)
+
+        assert feed.to_json() == expected
+
+    def test_fragment_round_trip(self):
+        """A video restored from its fragment equals the original."""
+        video = make_roku_video("a", VideoType.MOVIE)
+        video.rating = {"rating": "TV-G", "ratingSource": "USA_TV"}
+
+        restored = RokuVideo.from_fragment(video.to_json_fragment(), VideoType.MOVIE)
+
+        assert restored == video
+        assert restored.json_fragment == video.json_fragment
+
+
+def make_roku_video(video_id, video_type, title="Test"):
+    """Build a minimal RokuVideo."""
+    return RokuVideo(
+        id=video_id,
+        title=title,
+        short_description="Test",
+        long_description="Test",
+        release_date="2025-01-01",
+        duration=60,
+        thumbnail="https://example.com/thumb.jpg",
+        content={"duration": 60, "videos": []},
+        video_type=video_type
+    )
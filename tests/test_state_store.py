@@ -0,0 +1,148 @@
+"""
+Tests for the sync state stores.
+"""
+
+import json
+import sqlite3
+from datetime import datetime, timezone
+
+import pytest
+
+from vimeo_roku_sdk.state_store import (
+    JSONStateStore,
+    SQLiteStateStore,
+    StateStore,
+    VideoRecord,
+    open_state_store,
+)
+from vimeo_roku_sdk.exceptions import ConfigurationError
+
+
+@pytest.fixture(params=["sqlite", "json"])
+def store_factory(request, tmp_path):
+    """Opens a store of each backend on the same path."""
+    if request.param == "sqlite":
+        return lambda: SQLiteStateStore(str(tmp_path / "state.db"))
+    return lambda: JSONStateStore(str(tmp_path / "state.json"))
+
+
+def make_record(video_id: str, run: int = 1) -> VideoRecord:
+    return VideoRecord(
+        video_id=video_id,
+        modified_time=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        content_hash="abc",
+        section="shortFormVideos",
+        last_seen_run=run
+    )
+
+
+class TestStateStores:
+    """Behaviour shared by every backend."""
+
+    def test_incomplete_backend_cannot_be_created(self):
+        """A backend missing part of the interface fails when instantiated."""
+        class PartialStore(StateStore):
+            def get(self, key, default=None):
+                return default
+
+        with pytest.raises(TypeError, match="abstract"):
+            PartialStore()
+
+    def test_values_persist(self, store_factory):
+        """Stored values survive reopening the store."""
+        store = store_factory()
+        store.set("last_sync", "2025-01-01T00:00:00+00:00")
+        store.close()
+
+        assert store_factory().get("last_sync") == "2025-01-01T00:00:00+00:00"
+
+    def test_upsert_and_get_video(self, store_factory):
+        """Records are upserted by ID."""
+        store = store_factory()
+        store.upsert_videos([make_record("1"), make_record("2")])
+        store.upsert_videos([make_record("1", run=2)])
+
+        assert store.video_count() == 2
+        assert store_factory().get_video("1") == make_record("1", run=2)
+        assert store.get_video("missing") is None
+
+    def test_prune_and_delete(self, store_factory):
+        """Stale records are pruned and deleted records removed."""
+        store = store_factory()
+        store.upsert_videos([make_record("1", run=1), make_record("2", run=2), make_record("3", run=2)])
+
+        assert store.prune(2) == 1
+        assert store.delete_videos(["2", "missing"]) == 1
+        assert [record.video_id for record in store.iter_videos()] == ["3"]
+
+    def test_transaction_rolls_back(self, store_factory):
+        """A failed transaction leaves the store unchanged."""
+        store = store_factory()
+        store.upsert_videos([make_record("1")])
+
+        with pytest.raises(RuntimeError):
+            with store.transaction():
+                store.delete_videos(["1"])
+                store.set("run", "5")
+                raise RuntimeError("boom")
+
+        assert store.get_video("1") is not None
+        assert store.get("run") is None
+        assert store_factory().get_video("1") is not None
+
+    def test_clear(self, store_factory):
+        """Clearing removes values and records."""
+        store = store_factory()
+        store.set("run", "1")
+        store.upsert_videos([make_record("1")])
+
+        store.clear()
+
+        assert store.get("run") is None
+        assert store.video_count() == 0
+
+
+class TestOpenStateStore:
+    """Tests for choosing and migrating backends."""
+
+    def test_migrates_legacy_json(self, tmp_path):
+        """An old sync_state.json is imported into the SQLite store once."""
+        legacy = tmp_path / "sync_state.json"
+        legacy.write_text(json.dumps({
+            "last_sync": "2025-01-01T00:00:00",
+            "last_video_count": 2,
+            "synced_video_ids": ["1", "2", "2"]
+        }))
+
+        store = open_state_store(str(tmp_path))
+
+        assert isinstance(store, SQLiteStateStore)
+        assert store.get("last_sync") == "2025-01-01T00:00:00"
+        assert store.get("last_video_count") == "2"
+        assert store.video_count() == 2
+        assert not legacy.exists()
+        assert (tmp_path / "sync_state.json.migrated").exists()
+
+    def test_unknown_backend(self, tmp_path):
+        """An unknown backend name is a configuration error."""
+        with pytest.raises(ConfigurationError):
+            open_state_store(str(tmp_path), "redis")
+
+    def test_upgrades_version_1_database(self, tmp_path):
+        """Databases created before fragments were stored gain the column."""
+        path = str(tmp_path / "sync_state.db")
+        conn = sqlite3.connect(path)
+        conn.executescript(
+            "CREATE TABLE state (key TEXT PRIMARY KEY, value TEXT NOT NULL);"
+            "CREATE TABLE videos (video_id TEXT PRIMARY KEY, modified_time TEXT,"
+            " content_hash TEXT, section TEXT, last_seen_run INTEGER NOT NULL DEFAULT 0);"
+            "INSERT INTO videos (video_id) VALUES ('1');"
+            "PRAGMA user_version = 1;"
+        )
+        conn.close()
+
+        store = SQLiteStateStore(path)
+        store.upsert_videos([VideoRecord(video_id="2", fragment="{}")])
+
+        assert store.get_video("1").fragment is None
+        assert store.get_video("2").fragment == "{}"
@@ -0,0 +1,456 @@
+"""
+Tests for the sync manager.
+"""
+
+import asyncio
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from vimeo_roku_sdk.sync_manager import SyncManager, SyncState
+from vimeo_roku_sdk.state_store import open_state_store
+from vimeo_roku_sdk.config import ChannelConfig, Config, VimeoConfig, SyncConfig
+from vimeo_roku_sdk.exceptions import SyncError
+
+from .helpers import FakeLibrary, feed_titles, make_manager, make_video
+
+
+class FakeAlbumLibrary(FakeLibrary):
+    """A FakeLibrary whose album holds some of the library's videos."""
+
+    def __init__(self, videos, album_ids):
+        super().__init__(videos)
+        self.album_ids = list(album_ids)
+        self.fetched_ids = []
+
+    def iter_album_videos(self, album_id=None, on_total=None):
+        self.full_fetches += 1
+        yield from [self.videos[video_id] for video_id in self.album_ids]
+
+    def get_album_video_ids(self, album_id=None):
+        return set(self.album_ids)
+
+    def get_video(self, video_id):
+        self.fetched_ids.append(video_id)
+        return self.videos[video_id]
+
+
+class FakeUploader:
+    """Records uploads and notifications instead of sending them."""
+
+    def __init__(self):
+        self.uploads = []
+        self.notifications = []
+
+    def upload_to_s3(self, feed_path):
+        with open(feed_path) as f:
+            self.uploads.append(f.read())
+        return "https://bucket.example.com/feed.json"
+
+    def notify_webhook(self, feed_url):
+        self.notifications.append(feed_url)
+        return True
+
+
+def without_timestamp(feed_text):
+    return "\n".join(line for line in feed_text.splitlines() if '"lastUpdated"' not in line)
+
+
+class TestIncrementalSync:
+    """Tests for merging changes into the previous feed."""
+
+    def test_merges_changes_into_previous_feed(self, tmp_path):
+        """Changed videos are upserted, deleted and private ones removed."""
+        library = FakeLibrary([make_video(str(i)) for i in range(5)])
+        make_manager(tmp_path, library).sync()
+
+        library.videos["1"] = make_video("1", title="Renamed")
+        library.videos["2"] = make_video("2", privacy="nobody")
+        library.videos["9"] = make_video("9")
+        del library.videos["3"]
+        library.changed = ["1", "2", "9"]
+
+        result = make_manager(tmp_path, library).sync(incremental=True)
+
+        assert result.success
+        assert library.full_fetches == 1
+        assert result.videos_processed == 3
+        assert (result.videos_added, result.videos_updated, result.videos_removed) == (1, 1, 2)
+        assert feed_titles(tmp_path) == {
+            "vimeo-9": "Video 9",
+            "vimeo-0": "Video 0",
+            "vimeo-1": "Renamed",
+            "vimeo-4": "Video 4",
+        }
+
+    def test_keeps_unlisted_videos_without_deletion_detection(self, tmp_path):
+        """With detect_deletions off, only changed videos affect the feed."""
+        library = FakeLibrary([make_video(str(i)) for i in range(3)])
+        make_manager(tmp_path, library).sync()
+
+        del library.videos["0"]
+        result = make_manager(tmp_path, library, detect_deletions=False).sync(incremental=True)
+
+        assert result.videos_removed == 0
+        assert "vimeo-0" in feed_titles(tmp_path)
+
+    def test_unmodified_video_joining_album_is_added(self, tmp_path):
+        """A video added to the album without being modified is fetched and merged."""
+        library = FakeAlbumLibrary([make_video(str(i)) for i in range(4)], album_ids=["0", "1"])
+        make_manager(tmp_path, library).sync(source="album", album_id="album")
+
+        library.album_ids = ["0", "1", "3"]
+        library.changed = []
+
+        result = make_manager(tmp_path, library).sync(source="album", album_id="album", incremental=True)
+
+        assert result.success
+        assert library.full_fetches == 1
+        assert library.fetched_ids == ["3"]
+        assert result.videos_added == 1
+        assert set(feed_titles(tmp_path)) == {"vimeo-0", "vimeo-1", "vimeo-3"}
+
+    def test_full_sync_without_previous_feed(self, tmp_path):
+        """An incremental sync with no saved feed rebuilds from scratch."""
+        library = FakeLibrary([make_video(str(i)) for i in range(3)])
+        manager = make_manager(tmp_path, library)
+        manager._state = SyncState(last_sync=datetime.now(timezone.utc) - timedelta(days=1))
+
+        result = manager.sync(incremental=True)
+
+        assert library.full_fetches == 1
+        assert result.videos_added == 3
+
+    def test_records_sync_start_in_utc(self, tmp_path):
+        """The saved last_sync is timezone-aware and reloads as such."""
+        library = FakeLibrary([make_video("1")])
+        before = datetime.now(timezone.utc)
+
+        make_manager(tmp_path, library).sync()
+        state = SyncState.load(open_state_store(str(tmp_path / "cache")))
+
+        assert state.last_sync.tzinfo is not None
+        assert state.last_sync >= before
+        assert state.last_video_count == 1
+        assert state.run == 1
+
+
+    def test_reports_invalid_dates(self, tmp_path):
+        """A video published with fallback dates is listed in the result's errors."""
+        video = make_video("1")
+        video.date_errors = ("created_time is missing",)
+
+        result = make_manager(tmp_path, FakeLibrary([video])).sync()
+
+        assert result.success
+        assert result.videos_added == 1
+        assert "Video 1: created_time is missing" in result.errors
+
+
+class TestSyncStateRecords:
+    """Tests for the per-video records kept between syncs."""
+
+    def test_full_sync_replaces_records(self, tmp_path):
+        """A full sync records the feed's videos and prunes the rest."""
+        library = FakeLibrary([make_video(str(i)) for i in range(3)])
+        make_manager(tmp_path, library).sync()
+
+        del library.videos["0"]
+        manager = make_manager(tmp_path, library)
+        manager.sync()
+
+        store = manager.state_store
+        assert sorted(record.video_id for record in store.iter_videos()) == ["1", "2"]
+        assert store.get_video("1").last_seen_run == 2
+        assert store.get_video("1").section == "shortFormVideos"
+
+    def test_incremental_sync_updates_changed_rows(self, tmp_path):
+        """An incremental sync touches only changed and removed videos."""
+        library = FakeLibrary([make_video(str(i)) for i in range(3)])
+        make_manager(tmp_path, library).sync()
+        first_hash = make_manager(tmp_path, library).state_store.get_video("1").content_hash
+
+        library.videos["1"] = make_video("1", title="Renamed")
+        del library.videos["2"]
+        library.changed = ["1"]
+        manager = make_manager(tmp_path, library)
+        manager.sync(incremental=True)
+
+        store = manager.state_store
+        assert store.video_count() == 2
+        assert store.get_video("0").last_seen_run == 1
+        assert store.get_video("1").last_seen_run == 2
+        assert store.get_video("1").content_hash != first_hash
+        assert manager.get_last_sync_info()["synced_ids_count"] == 2
+
+
+class TestConversionCache:
+    """Tests for reusing converted videos between syncs."""
+
+    def test_unchanged_videos_reuse_fragments(self, tmp_path):
+        """A second sync reuses every unchanged conversion and writes the same feed."""
+        library = FakeLibrary([make_video(str(i)) for i in range(4)])
+        make_manager(tmp_path, library).sync()
+        first = without_timestamp((tmp_path / "feed.json").read_text())
+
+        result = make_manager(tmp_path, library).sync()
+
+        assert result.conversions_reused == 4
+        assert without_timestamp((tmp_path / "feed.json").read_text()) == first
+
+    def test_changed_video_is_converted_again(self, tmp_path):
+        """Only videos whose content changed are converted again."""
+        library = FakeLibrary([make_video(str(i)) for i in range(4)])
+        make_manager(tmp_path, library).sync()
+
+        library.videos["2"] = make_video("2", title="Renamed")
+        result = make_manager(tmp_path, library).sync()
+
+        assert result.conversions_reused == 3
+        assert feed_titles(tmp_path)["vimeo-2"] == "Renamed"
+
+    def test_settings_change_invalidates_cache(self, tmp_path):
+        """Changing a conversion setting rebuilds every video."""
+        library = FakeLibrary([make_video(str(i)) for i in range(2)])
+        make_manager(tmp_path, library).sync()
+
+        manager = make_manager(tmp_path, library)
+        manager.feed_generator.config.default_rating = "TV-PG"
+        result = manager.sync()
+
+        assert result.conversions_reused == 0
+        assert '"TV-PG"' in (tmp_path / "feed.json").read_text()
+
+    def test_incremental_sync_reuses_loaded_feed(self, tmp_path):
+        """Unchanged videos of a loaded feed are written from their cached fragments."""
+        library = FakeLibrary([make_video(str(i)) for i in range(3)])
+        make_manager(tmp_path, library).sync()
+
+        library.changed = ["1"]
+        manager = make_manager(tmp_path, library)
+        manager.sync(incremental=True)
+
+        fragments = [video.json_fragment for video in manager.feed_generator.feed.iter_videos()]
+        assert all(fragments)
+
+
+class TestStreamingSync:
+    """Tests for syncs that convert and write videos as they are listed."""
+
+    def test_matches_in_memory_feed(self, tmp_path):
+        """A streamed feed is identical to one built in memory."""
+        library = FakeLibrary([make_video(str(i)) for i in range(5)] + [make_video("9", privacy="nobody")])
+        make_manager(tmp_path, library).sync()
+        expected = without_timestamp((tmp_path / "feed.json").read_text())
+
+        result = make_manager(tmp_path, library).sync(streaming=True)
+
+        assert result.success
+        assert (result.videos_added, result.videos_skipped) == (5, 1)
+        assert result.conversions_reused == 5
+        assert without_timestamp((tmp_path / "feed.json").read_text()) == expected
+
+    def test_records_state(self, tmp_path):
+        """Streamed videos are recorded and later syncs can merge into the feed."""
+        library = FakeLibrary([make_video(str(i)) for i in range(3)])
+        manager = make_manager(tmp_path, library)
+        manager.sync(streaming=True)
+
+        assert manager.state_store.video_count() == 3
+        assert manager.get_last_sync_info()["video_count"] == 3
+
+        library.videos["1"] = make_video("1", title="Renamed")
+        library.changed = ["1"]
+        result = make_manager(tmp_path, library).sync(incremental=True, streaming=True)
+
+        assert result.videos_updated == 1
+        assert feed_titles(tmp_path)["vimeo-1"] == "Renamed"
+
+    def test_progress_uses_listing_total(self, tmp_path):
+        """Progress is reported against the total from the first page."""
+        library = FakeLibrary([make_video(str(i)) for i in range(3)])
+        manager = make_manager(tmp_path, library)
+        progress = []
+        manager.set_callbacks(on_progress=lambda current, total: progress.append((current, total)))
+
+        manager.sync(streaming=True)
+
+        assert progress == [(1, 3), (2, 3), (3, 3)]
+
+    def test_failure_rolls_back_records(self, tmp_path):
+        """A sync that fails mid-stream leaves the previous state in place."""
+        library = FakeLibrary([make_video(str(i)) for i in range(3)])
+        make_manager(tmp_path, library).sync()
+
+        def broken(on_total=None):
+            yield make_video("7")
+            raise RuntimeError("connection lost")
+
+        library.iter_all_videos = broken
+        manager = make_manager(tmp_path, library)
+        result = manager.sync(streaming=True)
+
+        assert not result.success
+        assert manager.state_store.get_video("7") is None
+        assert manager.get_last_sync_info()["synced_ids_count"] == 3
+        assert SyncState.load(manager.state_store).run == 1
+
+
+class TestUnchangedFeed:
+    """Tests for skipping work when the feed content has not changed."""
+
+    def publish(self, tmp_path, library, uploader, **kwargs):
+        manager = make_manager(tmp_path, library)
+        manager.config.roku.s3_bucket = "bucket"
+        manager.uploader = uploader
+        return manager.sync(upload=True, notify=True, **kwargs)
+
+    def test_unchanged_feed_is_not_republished(self, tmp_path):
+        """A repeat sync leaves the file, the upload and the webhook alone."""
+        library = FakeLibrary([make_video(str(i)) for i in range(3)])
+        uploader = FakeUploader()
+        first = self.publish(tmp_path, library, uploader)
+        os.utime(tmp_path / "feed.json", (0, 0))
+
+        second = self.publish(tmp_path, library, uploader)
+
+        assert first.feed_changed and not second.feed_changed
+        assert second.success
+        assert (tmp_path / "feed.json").stat().st_mtime == 0
+        assert len(uploader.uploads) == len(uploader.notifications) == 1
+
+    def test_changed_feed_is_published(self, tmp_path):
+        """A content change is written, uploaded and announced."""
+        library = FakeLibrary([make_video(str(i)) for i in range(3)])
+        uploader = FakeUploader()
+        self.publish(tmp_path, library, uploader)
+
+        library.videos["1"] = make_video("1", title="Renamed")
+        result = self.publish(tmp_path, library, uploader, streaming=True)
+
+        assert result.feed_changed
+        assert len(uploader.uploads) == len(uploader.notifications) == 2
+        assert "Renamed" in uploader.uploads[-1]
+
+    def test_unchanged_feed_is_uploaded_once(self, tmp_path):
+        """A feed saved without uploading is still uploaded by a later run."""
+        library = FakeLibrary([make_video(str(i)) for i in range(3)])
+        make_manager(tmp_path, library).sync()
+        uploader = FakeUploader()
+
+        result = self.publish(tmp_path, library, uploader, streaming=True)
+
+        assert not result.feed_changed
+        assert len(uploader.uploads) == 1
+
+    def test_missing_file_is_rewritten(self, tmp_path):
+        """The feed is written again if it was removed since the last run."""
+        library = FakeLibrary([make_video("1")])
+        make_manager(tmp_path, library).sync()
+        os.remove(tmp_path / "feed.json")
+
+        make_manager(tmp_path, library).sync()
+
+        assert feed_titles(tmp_path) == {"vimeo-1": "Video 1"}
+
+
+def make_channel_manager(tmp_path, library, streaming=False) -> SyncManager:
+    sync_data = {"cache_path": str(tmp_path / "cache"), "streaming": streaming}
+    config = Config(
+        vimeo=VimeoConfig(access_token="token"),
+        sync=SyncConfig.from_dict(sync_data),
+        channels=[
+            ChannelConfig.from_dict(
+                {"name": "main", "roku": {"provider_name": "Main", "feed_output_path": str(tmp_path / "main.json")}},
+                sync_defaults=sync_data
+            ),
+            ChannelConfig.from_dict(
+                {
+                    "name": "kids",
+                    "roku": {"provider_name": "Kids", "feed_output_path": str(tmp_path / "kids.json")},
+                    "sync": {"include_tags": ["kids"]},
+                },
+                sync_defaults=sync_data
+            ),
+        ]
+    )
+    return SyncManager(config=config, vimeo_client=library)
+
+
+def feed_ids(path):
+    with open(path) as f:
+        feed = json.load(f)
+    return sorted(item["id"] for key in ("shortFormVideos", "movies") for item in feed.get(key, []))
+
+
+class TestMultiChannelSync:
+    """Tests for building several channel feeds from one crawl."""
+
+    def library(self):
+        return FakeLibrary([
+            make_video("1", tags=["kids"], playable=True),
+            make_video("2", playable=True),
+            make_video("3", tags=["Kids", "music"], duration=2000, playable=True),
+        ])
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_one_crawl_feeds_every_channel(self, tmp_path, streaming):
+        """The library is fetched once and each channel applies its own filters."""
+        library = self.library()
+
+        result = make_channel_manager(tmp_path, library, streaming).sync_channels()
+
+        assert result.success
+        assert library.full_fetches == 1
+        assert result.videos_fetched == 3
+        assert feed_ids(tmp_path / "main.json") == ["vimeo-1", "vimeo-2", "vimeo-3"]
+        assert feed_ids(tmp_path / "kids.json") == ["vimeo-1", "vimeo-3"]
+        assert result.channels["kids"].videos_skipped == 1
+        assert result.channels["kids"].skip_reasons == {"missing_tag": 1}
+        assert result.to_dict()["channels"]["main"]["videos_added"] == 3
+
+    def test_channels_keep_separate_state(self, tmp_path):
+        """Each channel records its own videos and reuses its own conversions."""
+        manager = make_channel_manager(tmp_path, self.library())
+        manager.sync_channels()
+
+        result = make_channel_manager(tmp_path, self.library()).sync_channels()
+
+        managers = manager.channel_managers()
+        assert managers["main"].state_store.video_count() == 3
+        assert managers["kids"].state_store.video_count() == 2
+        assert result.channels["main"].conversions_reused == 3
+        assert result.channels["kids"].conversions_reused == 2
+        assert not result.channels["kids"].feed_changed
+
+    def test_channel_failure_is_isolated(self, tmp_path):
+        """A channel that fails to save does not stop the others."""
+        manager = make_channel_manager(tmp_path, self.library())
+        kids = manager.channel_managers()["kids"]
+        (tmp_path / "blocker").write_text("")
+        kids.config.roku.feed_output_path = str(tmp_path / "blocker" / "kids.json")
+
+        result = manager.sync_channels()
+
+        assert not result.success
+        assert result.channels["main"].success
+        assert not result.channels["kids"].success
+        assert (tmp_path / "main.json").exists()
+
+    def test_requires_channels(self, tmp_path):
+        """sync_channels() needs channels in the config."""
+        manager = make_manager(tmp_path, self.library())
+
+        with pytest.raises(SyncError):
+            manager.sync_channels()
+
+    def test_single_feed_sync_needs_top_level_feed(self, tmp_path):
+        """With only channels configured, sync() explains what to call instead."""
+        manager = make_channel_manager(tmp_path, self.library())
+
+        with pytest.raises(ValueError, match="Incremental"):
+            manager.sync(incremental=True)
+        with pytest.raises(ValueError, match="sync_channels"):
+            asyncio.run(manager.sync_async())
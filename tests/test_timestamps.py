@@ -0,0 +1,44 @@
+"""
+Tests for feed timestamp parsing and formatting.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from vimeo_roku_sdk.timestamps import as_utc, format_date, format_timestamp, parse_timestamp
+
+
+class TestTimestamps:
+    """Tests for the memoized timestamp helpers."""
+
+    def test_parses_vimeo_timestamps(self):
+        """Offsets and a 'Z' suffix both give aware UTC datetimes."""
+        expected = datetime(2025, 1, 5, 10, 0, 0, tzinfo=timezone.utc)
+
+        assert parse_timestamp("2025-01-05T10:00:00+00:00") == expected
+        assert parse_timestamp("2025-01-05T10:00:00Z") == expected
+
+    def test_repeated_values_are_memoized(self):
+        assert parse_timestamp("2025-02-01T00:00:00+00:00") is parse_timestamp("2025-02-01T00:00:00+00:00")
+
+    @pytest.mark.parametrize("value", ["", "yesterday", "2025-13-01T00:00:00+00:00", 1736071200, None])
+    def test_invalid_values_raise(self, value):
+        with pytest.raises(ValueError):
+            parse_timestamp(value)
+
+    def test_formats_in_utc(self):
+        """Aware datetimes are converted to UTC; naive ones are taken as local time."""
+        eastern = datetime(2025, 1, 5, 21, 30, tzinfo=timezone(timedelta(hours=-5)))
+        naive = datetime(2025, 1, 5, 21, 30)
+
+        assert format_timestamp(eastern) == "2025-01-06T02:30:00Z"
+        assert format_date(eastern) == "2025-01-06"
+        assert format_timestamp(naive) == naive.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def test_as_utc_reads_naive_values_as_local_time(self):
+        """Naive values, like those in older state files, are local time."""
+        naive = datetime(2025, 1, 5, 21, 30)
+
+        assert as_utc(naive) == naive.astimezone()
+        assert as_utc(naive).utcoffset() == timedelta(0)
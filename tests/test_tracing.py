@@ -0,0 +1,147 @@
+"""
+Tests for sync tracing.
+"""
+
+import json
+
+from vimeo_roku_sdk.tracing import NULL_TRACER, Tracer
+from vimeo_roku_sdk.vimeo_client import VimeoClient
+
+from .helpers import FakeLibrary, FakeResponse, make_manager, make_video
+
+
+class TestTracer:
+    """Tests for Tracer."""
+
+    def test_spans_are_summed_per_name(self):
+        """Spans with the same name add up in the summary."""
+        tracer = Tracer()
+        for _ in range(3):
+            with tracer.span("convert"):
+                pass
+        with tracer.timed("parse"):
+            pass
+
+        stages = tracer.summary()["stages"]
+
+        assert stages["convert"]["count"] == 3
+        assert stages["parse"]["count"] == 1
+        assert len(tracer.events) == 3  # timed() keeps no span
+
+    def test_counters_and_histograms(self):
+        """Counters accumulate and histogram values land in their buckets."""
+        tracer = Tracer()
+        tracer.count("http.bytes", 100)
+        tracer.count("http.bytes", 50)
+        tracer.observe("http.latency_seconds", 0.07)
+        tracer.observe("http.latency_seconds", 30)
+
+        summary = tracer.summary()
+        histogram = summary["histograms"]["http.latency_seconds"]
+
+        assert summary["counters"]["http.bytes"] == 150
+        assert histogram["count"] == 2
+        assert histogram["buckets"]["0.1"] == 1
+        assert histogram["buckets"]["+Inf"] == 1
+        assert histogram["max"] == 30
+
+    def test_event_limit(self):
+        """Spans past max_events are dropped but still counted."""
+        tracer = Tracer(max_events=2)
+        for _ in range(5):
+            with tracer.span("http"):
+                pass
+
+        assert len(tracer.events) == 2
+        assert tracer.summary()["dropped_events"] == 3
+        assert tracer.summary()["stages"]["http"]["count"] == 5
+
+    def test_disabled_records_nothing(self):
+        """The null tracer ignores everything."""
+        with NULL_TRACER.span("sync") as args:
+            args["videos"] = 1
+        NULL_TRACER.count("http.requests")
+
+        assert NULL_TRACER.summary()["stages"] == {}
+        assert NULL_TRACER.summary()["counters"] == {}
+
+    def test_chrome_trace_export(self, tmp_path):
+        """Spans are written as complete events with their args."""
+        tracer = Tracer()
+        with tracer.span("http", category="http", page=2) as args:
+            args["status"] = 200
+
+        path = tmp_path / "trace.json"
+        tracer.export_chrome_trace(path)
+        events = json.loads(path.read_text())["traceEvents"]
+
+        assert len(events) == 1
+        assert events[0]["ph"] == "X"
+        assert events[0]["cat"] == "http"
+        assert events[0]["args"] == {"page": 2, "status": 200}
+
+
+class TestClientTracing:
+    """Tests for the HTTP instrumentation of VimeoClient."""
+
+    def test_requests_bytes_and_retries(self):
+        """Each attempt is a span; 429s count as throttled retries."""
+        responses = [
+            FakeResponse(429, {"error": "Too many API requests."}, {"Retry-After": "0"}),
+            FakeResponse(200, {"total": 0, "data": []}),
+        ]
+        client = VimeoClient(access_token="token")
+        client.session.request = lambda **kwargs: responses.pop(0)
+        client.tracer = Tracer()
+
+        client.get_videos(page=3)
+
+        summary = client.tracer.summary()
+        assert summary["stages"]["http"]["count"] == 2
+        assert summary["counters"]["http.requests"] == 2
+        assert summary["counters"]["http.retries"] == 1
+        assert summary["counters"]["http.throttled"] == 1
+        assert summary["counters"]["http.bytes"] > 0
+        assert summary["histograms"]["http.latency_seconds"]["count"] == 2
+        assert "rate_limit_wait" in summary["stages"]
+        assert [event["args"]["attempt"] for event in client.tracer.events] == [1, 2]
+        assert client.tracer.events[0]["args"]["page"] == 3
+
+
+class TestSyncTracing:
+    """Tests for the trace recorded on sync results."""
+
+    def test_result_carries_stage_times(self, tmp_path):
+        """A sync result reports time spent in each stage."""
+        library = FakeLibrary([make_video(str(i)) for i in range(3)])
+        manager = make_manager(tmp_path, library)
+
+        result = manager.sync()
+
+        stages = result.to_dict()["trace"]["stages"]
+        for name in ("sync", "fetch", "convert", "validate", "save", "state"):
+            assert stages[name]["count"] == 1
+        assert manager.tracer is NULL_TRACER
+        assert library.tracer is NULL_TRACER
+
+    def test_streaming_stages(self, tmp_path):
+        """Streaming syncs time conversions as they go."""
+        library = FakeLibrary([make_video(str(i)) for i in range(3)])
+
+        result = make_manager(tmp_path, library).sync(streaming=True)
+
+        stages = result.trace["stages"]
+        assert stages["stream"]["count"] == 1
+        assert stages["convert_video"]["count"] == 3
+        assert stages["save"]["count"] == 1
+
+    def test_exports_trace(self, tmp_path):
+        """sync.trace_path receives a Chrome trace of the run."""
+        library = FakeLibrary([make_video("1")])
+        manager = make_manager(tmp_path, library)
+        manager.config.sync.trace_path = str(tmp_path / "sync.trace.json")
+
+        manager.sync()
+
+        trace = json.loads((tmp_path / "sync.trace.json").read_text())
+        assert {event["name"] for event in trace["traceEvents"]} >= {"sync", "fetch", "save"}
@@ -0,0 +1,149 @@
+"""
+Tests for S3 feed uploads, against a stub client and a local S3 stand-in (moto).
+"""
+
+import gzip
+import threading
+
+import pytest
+
+from vimeo_roku_sdk.config import RokuConfig
+from vimeo_roku_sdk.models import RokuFeed
+from vimeo_roku_sdk.roku_feed import RokuFeedUploader, S3Upload
+
+
+class StubS3:
+    """Records upload_file calls instead of talking to S3."""
+
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def upload_file(self, path, bucket, key, ExtraArgs=None, Config=None):
+        with self._lock:
+            self.calls.append({"path": path, "bucket": bucket, "key": key, "extra_args": ExtraArgs, "config": Config})
+
+
+class TestUploaderWithStub:
+    """Tests for RokuFeedUploader that need neither boto3 nor moto."""
+
+    def make_uploader(self, **kwargs):
+        s3 = StubS3()
+        uploader = RokuFeedUploader(RokuConfig(s3_bucket="feeds", s3_key="roku.json", **kwargs), s3_client=s3)
+        uploader.transfer_config = lambda: "transfer-config"
+        return uploader, s3
+
+    def test_sidecars_go_first_with_headers(self, tmp_path):
+        """Artifacts and extra uploads precede the feed, all with the transfer config."""
+        path = tmp_path / "feed.json"
+        RokuFeed(provider_name="Test").save(str(path), encodings=["gzip"])
+        shard = tmp_path / "shard.json"
+        shard.write_text("{}")
+        uploader, s3 = self.make_uploader(feed_compression=["gzip"], s3_cache_control="max-age=60")
+
+        uploader.upload_to_s3(str(path), extra_uploads=[S3Upload(str(shard), "shards/0.json")])
+
+        assert [call["key"] for call in s3.calls][-1] == "roku.json"
+        assert sorted(call["key"] for call in s3.calls[:-1]) == ["roku.json.gz", "shards/0.json"]
+        assert all(call["config"] == "transfer-config" for call in s3.calls)
+        by_key = {call["key"]: call["extra_args"] for call in s3.calls}
+        assert by_key["roku.json.gz"]["ContentEncoding"] == "gzip"
+        assert by_key["roku.json.gz"]["CacheControl"] == "max-age=60"
+        assert by_key["roku.json"]["CacheControl"] == "max-age=60"
+        assert "ContentEncoding" not in by_key["roku.json"]
+
+    def test_records_throughput(self, tmp_path):
+        """The files and bytes of the last upload are kept."""
+        path = tmp_path / "feed.json"
+        RokuFeed(provider_name="Test").save(str(path))
+        uploader, _ = self.make_uploader()
+
+        uploader.upload_to_s3(str(path), encodings=[])
+
+        assert uploader.last_upload.files == 1
+        assert uploader.last_upload.bytes == path.stat().st_size
+        assert uploader.last_upload.to_dict()["seconds"] >= 0
+
+    def test_transfer_config(self):
+        """Multipart settings come from the Roku config."""
+        pytest.importorskip("boto3")
+        uploader = RokuFeedUploader(RokuConfig(
+            s3_multipart_threshold_mb=16, s3_multipart_chunk_mb=4, s3_max_concurrency=1
+        ))
+
+        config = uploader.transfer_config()
+
+        assert config.multipart_threshold == 16 * 1024 * 1024
+        assert config.multipart_chunksize == 4 * 1024 * 1024
+        assert config.max_concurrency == 1
+        assert config.use_threads is False
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    boto3 = pytest.importorskip("boto3")
+    moto = pytest.importorskip("moto")
+    # moto 5 replaced the per-service decorators with mock_aws
+    mock_aws = getattr(moto, "mock_aws", None) or moto.mock_s3
+
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket="feeds")
+        yield client
+
+
+def make_uploader(s3, **kwargs) -> RokuFeedUploader:
+    config = RokuConfig(s3_bucket="feeds", s3_key="roku.json", **kwargs)
+    return RokuFeedUploader(config, s3_client=s3)
+
+
+class TestS3Upload:
+    """Tests for RokuFeedUploader against moto."""
+
+    def test_uploads_feed_and_artifacts(self, s3, tmp_path):
+        """The feed and its gzip artifact are stored with their headers."""
+        path = tmp_path / "feed.json"
+        RokuFeed(provider_name="Test").save(str(path), encodings=["gzip"])
+
+        url = make_uploader(s3, feed_compression=["gzip"]).upload_to_s3(str(path))
+
+        feed = s3.get_object(Bucket="feeds", Key="roku.json")
+        compressed = s3.get_object(Bucket="feeds", Key="roku.json.gz")
+        assert url == "https://feeds.s3.amazonaws.com/roku.json"
+        assert feed["Body"].read() == path.read_bytes()
+        assert feed["CacheControl"] == "max-age=300"
+        assert compressed["ContentEncoding"] == "gzip"
+        assert gzip.decompress(compressed["Body"].read()) == path.read_bytes()
+
+    def test_multipart_upload(self, s3, tmp_path):
+        """Files above the threshold are uploaded in parts and reassembled."""
+        path = tmp_path / "large.json"
+        data = b"x" * (12 * 1024 * 1024)
+        path.write_bytes(data)
+
+        uploader = make_uploader(s3, s3_multipart_threshold_mb=5, s3_multipart_chunk_mb=5)
+        uploader.upload_files([S3Upload(str(path), "large.json")])
+
+        head = s3.head_object(Bucket="feeds", Key="large.json")
+        assert head["ContentLength"] == len(data)
+        assert head["ETag"].strip('"').endswith("-3")  # Multipart ETags end in -<parts>
+
+    def test_uploads_many_files(self, s3, tmp_path):
+        """Several sidecar files are uploaded together with the feed."""
+        path = tmp_path / "feed.json"
+        RokuFeed(provider_name="Test").save(str(path))
+        extra = []
+        for index in range(6):
+            shard = tmp_path / f"shard-{index}.json"
+            shard.write_text(f'{{"shard": {index}}}')
+            extra.append(S3Upload(str(shard), f"shards/{index}.json"))
+
+        make_uploader(s3).upload_to_s3(str(path), extra_uploads=extra)
+
+        listing = s3.list_objects_v2(Bucket="feeds")
+        assert sorted(item["Key"] for item in listing["Contents"]) == sorted(
+            ["roku.json"] + [f"shards/{index}.json" for index in range(6)]
+        )
@@ -0,0 +1,76 @@
+"""
+Tests for video filtering.
+"""
+
+from vimeo_roku_sdk.config import SyncConfig
+from vimeo_roku_sdk import video_filter as video_filter_module
+from vimeo_roku_sdk.video_filter import VideoFilter
+
+from .helpers import make_video
+
+
+class TestVideoFilter:
+    """Tests for VideoFilter."""
+
+    def test_compiles_config(self):
+        """Tags are normalized once and disabled checks are left out."""
+        video_filter = VideoFilter.from_config(SyncConfig(include_tags=["Kids", "KIDS"], min_duration=60))
+
+        assert video_filter.include_tags == frozenset({"kids"})
+        assert [reason for reason, _ in video_filter._checks] == [
+            "missing_tag", "private", "too_short", "not_playable"
+        ]
+
+    def test_skip_reasons(self):
+        """Each video is skipped for the first check it fails."""
+        video_filter = VideoFilter(
+            min_duration=60,
+            max_duration=1800,
+            include_tags=["Sermon"],
+            exclude_tags=["draft"]
+        )
+
+        assert video_filter.skip_reason(make_video("1", tags=["SERMON"], playable=True)) is None
+        assert video_filter.skip_reason(make_video("2", tags=["music"], playable=True)) == "missing_tag"
+        assert video_filter.skip_reason(make_video("3", tags=["sermon"], duration=30, playable=True)) == "too_short"
+        assert video_filter.skip_reason(make_video("4", tags=["sermon"], duration=4000, playable=True)) == "too_long"
+        assert video_filter.skip_reason(make_video("5", tags=["sermon", "Draft"], playable=True)) == "excluded_tag"
+        assert video_filter.skip_reason(make_video("6", privacy="nobody")) == "missing_tag"
+        assert not video_filter(make_video("7"))
+
+    def test_partition_counts_reasons(self):
+        """A batch keeps video order and counts skips by reason."""
+        videos = [
+            make_video("1", playable=True),
+            make_video("2", privacy="nobody"),
+            make_video("3"),
+            make_video("4", playable=True),
+            make_video("5", privacy="password"),
+        ]
+
+        batch = VideoFilter().partition(videos)
+
+        assert [video.id for video in batch.included] == ["1", "4"]
+        assert [video.id for video in batch.skipped] == ["2", "3", "5"]
+        assert batch.reasons == {"private": 2, "not_playable": 1}
+
+    def test_tags_are_normalized_once_per_video(self, monkeypatch):
+        """Both tag checks share one normalized copy of the video's tags."""
+        calls = []
+
+        def normalize_tag(tag):
+            calls.append(tag)
+            return tag.lower()
+
+        monkeypatch.setattr(video_filter_module, "normalize_tag", normalize_tag)
+        video_filter = VideoFilter(include_tags=["sermon"], exclude_tags=["draft"])
+        calls.clear()
+
+        batch = video_filter.partition([
+            make_video("1", tags=["Sermon", "Easter", "Choir"], playable=True),
+            make_video("2", tags=["Sermon", "DRAFT"], playable=True),
+        ])
+
+        assert [video.id for video in batch.included] == ["1"]
+        assert batch.reasons == {"excluded_tag": 1}
+        assert calls == ["Sermon", "Easter", "Choir", "Sermon", "DRAFT"]
@@ -0,0 +1,672 @@
+"""
+Tests for the Vimeo API client.
+"""
+
+import asyncio
+import dataclasses
+import json
+import math
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from vimeo_roku_sdk.vimeo_client import VimeoClient, FEED_FIELDS
+from vimeo_roku_sdk.async_client import AsyncVimeoClient
+from vimeo_roku_sdk.rate_limit import TokenBucket, AdaptiveRateLimiter
+from vimeo_roku_sdk.sync_manager import SyncManager
+from vimeo_roku_sdk.video_filter import VideoFilter
+from vimeo_roku_sdk.config import Config, VimeoConfig, RokuConfig, SyncConfig
+from vimeo_roku_sdk.models import Video, RokuVideo
+from vimeo_roku_sdk.exceptions import ConfigurationError
+
+
+def make_video_data(index: int) -> dict:
+    """Build a minimal Vimeo video payload."""
+    return {
+        "uri": f"/videos/{1000 + index}",
+        "name": f"Video {index}",
+        "description": "",
+        "duration": 120,
+        "created_time": "2025-01-01T00:00:00+00:00",
+        "modified_time": "2025-01-01T00:00:00+00:00",
+    }
+
+
+class FakeVimeoAPI:
+    """Stands in for VimeoClient._make_request over a synthetic catalog."""
+
+    def __init__(self, total: int, per_page: int = 100, latency: float = 0):
+        self.catalog = [make_video_data(i) for i in range(total)]
+        self.per_page = per_page
+        self.latency = latency
+        self.pages_requested = []
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def page_response(self, endpoint, params=None):
+        """Build the listing response for the requested page."""
+        params = params or {}
+        page = params.get("page", 1)
+        per_page = self.per_page
+        self.pages_requested.append(page)
+
+        start = (page - 1) * per_page
+        items = self.catalog[start:start + per_page]
+        last_page = max(1, math.ceil(len(self.catalog) / per_page))
+        return {
+            "total": len(self.catalog),
+            "page": page,
+            "per_page": per_page,
+            "paging": {
+                "next": f"{endpoint}?page={page + 1}" if page < last_page else None,
+            },
+            "data": items,
+        }
+
+    def __call__(self, method, endpoint, params=None, data=None, retry_count=3):
+        with self._lock:
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            with self._lock:
+                return self.page_response(endpoint, params)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+
+def make_client(api: FakeVimeoAPI, max_workers: int = 4) -> VimeoClient:
+    client = VimeoClient(access_token="token", max_workers=max_workers)
+    client._make_request = api
+    return client
+
+
+class TestPagination:
+    """Tests for page iteration."""
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_iter_all_videos_preserves_order(self, max_workers):
+        """Videos come out in API order regardless of fetch concurrency."""
+        api = FakeVimeoAPI(total=950, latency=0.01)
+        client = make_client(api, max_workers=max_workers)
+
+        ids = [video.id for video in client.iter_all_videos()]
+
+        assert ids == [str(1000 + i) for i in range(950)]
+        assert sorted(api.pages_requested) == list(range(1, 11))
+
+    def test_pages_fetched_concurrently(self):
+        """Pages after the first are requested in parallel."""
+        api = FakeVimeoAPI(total=800, latency=0.05)
+        client = make_client(api, max_workers=4)
+
+        list(client.iter_all_videos())
+
+        assert api.max_in_flight > 1
+        assert api.max_in_flight <= 4
+
+    def test_sequential_when_single_worker(self):
+        """A single worker follows paging.next one page at a time."""
+        api = FakeVimeoAPI(total=300, latency=0.01)
+        client = make_client(api, max_workers=1)
+
+        list(client.iter_all_videos())
+
+        assert api.pages_requested == [1, 2, 3]
+        assert api.max_in_flight == 1
+
+    def test_follows_next_when_catalog_grows(self):
+        """Pages beyond the initial total are still picked up."""
+        api = FakeVimeoAPI(total=250)
+        client = make_client(api)
+        original_call = api.__call__
+
+        def growing(method, endpoint, params=None, **kwargs):
+            response = original_call(method, endpoint, params, **kwargs)
+            if params.get("page") == 1:
+                api.catalog.extend(make_video_data(i) for i in range(250, 320))
+                response["total"] = 250
+            return response
+
+        client._make_request = growing
+
+        videos = list(client.iter_all_videos())
+
+        assert len(videos) == 320
+
+    def test_limit_stops_early(self):
+        """Stopping early does not fetch the whole listing."""
+        api = FakeVimeoAPI(total=5000)
+        client = make_client(api, max_workers=2)
+
+        videos = client.get_all_videos(limit=150)
+
+        assert len(videos) == 150
+        assert len(api.pages_requested) < 50
+
+    def test_album_and_folder_use_same_engine(self):
+        """Album and folder listings paginate through the shared engine."""
+        api = FakeVimeoAPI(total=420)
+        client = make_client(api)
+
+        assert len(list(client.iter_album_videos(album_id="1"))) == 420
+        assert len(list(client.iter_folder_videos(folder_id="2"))) == 420
+
+    def test_empty_listing(self):
+        """An empty listing yields nothing."""
+        api = FakeVimeoAPI(total=0)
+        client = make_client(api)
+
+        assert list(client.iter_all_videos()) == []
+
+
+class FakeAsyncVimeoAPI(FakeVimeoAPI):
+    """Coroutine version of FakeVimeoAPI for AsyncVimeoClient."""
+
+    async def __call__(self, method, endpoint, params=None, data=None, retry_count=3):
+        self._in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            return self.page_response(endpoint, params)
+        finally:
+            self._in_flight -= 1
+
+
+class TestAsyncVimeoClient:
+    """Tests for the asyncio client."""
+
+    def test_iter_all_videos_preserves_order(self):
+        """Async pagination yields videos in API order."""
+        api = FakeAsyncVimeoAPI(total=730, latency=0.01)
+        client = AsyncVimeoClient(access_token="token", max_concurrency=4)
+        client._make_request = api
+
+        async def collect():
+            return [video.id async for video in client.iter_all_videos()]
+
+        ids = asyncio.run(collect())
+
+        assert ids == [str(1000 + i) for i in range(730)]
+        assert sorted(api.pages_requested) == list(range(1, 9))
+        assert api.max_in_flight > 1
+
+    def test_get_all_videos_limit(self):
+        """Stopping early cancels the remaining page fetches."""
+        api = FakeAsyncVimeoAPI(total=5000)
+        client = AsyncVimeoClient(access_token="token", max_concurrency=2)
+        client._make_request = api
+
+        videos = asyncio.run(client.get_all_videos(limit=150))
+
+        assert len(videos) == 150
+        assert len(api.pages_requested) < 50
+
+    @pytest.mark.parametrize("method, args", [
+        ("iter_all_videos", ()),
+        ("iter_album_videos", ("42",)),
+        ("iter_folder_videos", ("42",)),
+    ])
+    def test_closing_iterator_cancels_page_fetches(self, method, args):
+        """Closing an iterator early cancels the pages fetched ahead."""
+        api = FakeAsyncVimeoAPI(total=5000, latency=0.05)
+        client = AsyncVimeoClient(access_token="token", max_concurrency=4)
+        client._make_request = api
+
+        async def read_ahead_then_close():
+            videos = getattr(client, method)(*args)
+            for _ in range(250):  # Into the third page, with refills still in flight
+                await videos.__anext__()
+            pending = {task for task in asyncio.all_tasks() if not task.done()} - {asyncio.current_task()}
+            await videos.aclose()
+            return pending, asyncio.all_tasks() - {asyncio.current_task()}
+
+        pending, left = asyncio.run(read_ahead_then_close())
+
+        assert pending
+        assert all(task.cancelled() for task in pending)
+        assert left == set()
+
+    def test_sync_async(self, tmp_path):
+        """SyncManager.sync_async builds the feed from the async client."""
+        api = FakeAsyncVimeoAPI(total=250)
+        client = AsyncVimeoClient(access_token="token")
+        client._make_request = api
+
+        config = Config(
+            vimeo=VimeoConfig(access_token="token"),
+            roku=RokuConfig(
+                provider_name="Test",
+                feed_output_path=str(tmp_path / "feed.json")
+            ),
+            sync=SyncConfig(cache_path=str(tmp_path / "cache"))
+        )
+        manager = SyncManager(config=config, async_vimeo_client=client)
+        manager._compile_filter = lambda: VideoFilter(include_private=True, require_playable=False)
+
+        result = asyncio.run(manager.sync_async())
+
+        assert result.success
+        assert result.videos_added == 250
+        assert (tmp_path / "feed.json").exists()
+
+    def test_sync_async_streaming(self, tmp_path):
+        """A streaming async sync writes every listed video."""
+        api = FakeAsyncVimeoAPI(total=250)
+        client = AsyncVimeoClient(access_token="token")
+        client._make_request = api
+
+        config = Config(
+            vimeo=VimeoConfig(access_token="token"),
+            roku=RokuConfig(
+                provider_name="Test",
+                feed_output_path=str(tmp_path / "feed.json")
+            ),
+            sync=SyncConfig(cache_path=str(tmp_path / "cache"), streaming=True)
+        )
+        manager = SyncManager(config=config, async_vimeo_client=client)
+        manager._compile_filter = lambda: VideoFilter(include_private=True, require_playable=False)
+        progress = []
+        manager.set_callbacks(on_progress=lambda current, total: progress.append(total))
+
+        result = asyncio.run(manager.sync_async())
+
+        assert result.success
+        assert result.videos_added == 250
+        assert set(progress) == {250}
+        with open(tmp_path / "feed.json") as f:
+            assert len(json.load(f)["shortFormVideos"]) == 250
+
+
+class SortedVimeoAPI(FakeVimeoAPI):
+    """
+    FakeVimeoAPI that honours ``sort``/``direction`` like the live API.
+
+    Every page is cut from the catalog as it is at request time, so edits
+    made between page requests reorder the listing just as they would on
+    Vimeo.
+    """
+
+    EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    def __init__(self, total: int, per_page: int = 100):
+        super().__init__(total=0, per_page=per_page)
+        for i in range(total):
+            video = make_video_data(i)
+            stamp = (self.EPOCH + timedelta(hours=i)).isoformat()
+            video["created_time"] = video["modified_time"] = stamp
+            self.catalog.append(video)
+        self.sorts = []
+        self.on_page = None
+
+    def edit(self, index: int, when: datetime):
+        """Mark a catalog video as modified at the given time."""
+        self.catalog[index]["modified_time"] = when.isoformat()
+
+    def page_response(self, endpoint, params=None):
+        params = params or {}
+        sort = params.get("sort", "date")
+        key = "modified_time" if sort == "modified_time" else "created_time"
+        self.sorts.append(sort)
+
+        listing = FakeVimeoAPI(total=0, per_page=self.per_page)
+        listing.catalog = sorted(
+            self.catalog,
+            key=lambda video: video[key],
+            reverse=params.get("direction", "desc") == "desc"
+        )
+        response = listing.page_response(endpoint, params)
+        self.pages_requested.append(response["page"])
+
+        if self.on_page:
+            self.on_page(response["page"])
+        return response
+
+
+class TestModifiedSince:
+    """Harness proving get_videos_modified_since finds every edit."""
+
+    SINCE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    def test_finds_old_videos_edited_recently(self):
+        """Editing an old video surfaces it even though it was created long ago."""
+        api = SortedVimeoAPI(total=500, per_page=50)
+        api.edit(3, self.SINCE + timedelta(minutes=5))
+        client = make_client(api)
+
+        videos = client.get_videos_modified_since(self.SINCE)
+
+        assert [video.id for video in videos] == ["1003"]
+        assert set(api.sorts) == {"modified_time"}
+        assert api.pages_requested == [1]
+
+    @pytest.mark.parametrize("per_page", [1, 3, 10])
+    def test_no_edits_missed_across_page_boundaries(self, per_page):
+        """Every edit is found, and scanning stops at the first unchanged page."""
+        for changes in range(2 * per_page + 2):
+            api = SortedVimeoAPI(total=100, per_page=per_page)
+            edited = list(range(0, 100, 3))[:changes]
+            for offset, index in enumerate(edited):
+                api.edit(index, self.SINCE + timedelta(minutes=offset))
+            client = make_client(api)
+
+            videos = client.get_videos_modified_since(self.SINCE)
+
+            assert sorted(video.id for video in videos) == sorted(str(1000 + i) for i in edited)
+            assert api.pages_requested == list(range(1, changes // per_page + 2))
+
+    def test_includes_edit_at_exact_boundary(self):
+        """A video modified exactly at ``since`` counts as changed."""
+        api = SortedVimeoAPI(total=20, per_page=5)
+        api.edit(7, self.SINCE)
+        client = make_client(api)
+
+        assert [video.id for video in client.get_videos_modified_since(self.SINCE)] == ["1007"]
+
+    def test_edits_during_scan(self):
+        """
+        Videos edited mid-scan are listed once, and any the scan passes over
+        were modified after it started, so the next scan picks them up.
+        """
+        api = SortedVimeoAPI(total=30, per_page=2)
+        edited = [2, 4, 6, 8, 10]
+        for offset, index in enumerate(edited):
+            api.edit(index, self.SINCE + timedelta(minutes=offset))
+        scan_started = self.SINCE + timedelta(hours=1)
+
+        def edit_during_scan(page):
+            if page == 1:
+                # Jumps ahead of the cursor, pushing the listing down one place
+                api.edit(2, scan_started + timedelta(minutes=1))
+
+        api.on_page = edit_during_scan
+        client = make_client(api)
+
+        videos = client.get_videos_modified_since(self.SINCE)
+        api.on_page = None
+        next_scan = client.get_videos_modified_since(scan_started)
+
+        ids = [video.id for video in videos]
+        assert len(ids) == len(set(ids))
+        assert set(ids) | {video.id for video in next_scan} == {str(1000 + i) for i in edited}
+
+    def test_naive_since_treated_as_local_time(self):
+        """A naive ``since`` is compared as local time rather than failing."""
+        api = SortedVimeoAPI(total=10, per_page=5)
+        api.edit(1, self.SINCE + timedelta(days=1))
+        client = make_client(api)
+
+        videos = client.get_videos_modified_since(self.SINCE.astimezone().replace(tzinfo=None))
+
+        assert [video.id for video in videos] == ["1001"]
+
+    def test_async_client_matches(self):
+        """The async client uses the same ordering and stopping rule."""
+        api = SortedVimeoAPI(total=60, per_page=4)
+        edited = [0, 13, 27, 41, 59]
+        for offset, index in enumerate(edited):
+            api.edit(index, self.SINCE + timedelta(minutes=offset))
+
+        async def fake_request(method, endpoint, params=None, data=None, retry_count=3):
+            return api.page_response(endpoint, params)
+
+        client = AsyncVimeoClient(access_token="token")
+        client._make_request = fake_request
+
+        videos = asyncio.run(client.get_videos_modified_since(self.SINCE))
+
+        assert sorted(video.id for video in videos) == sorted(str(1000 + i) for i in edited)
+        assert api.pages_requested == [1, 2]
+
+
+class TestTokenBucket:
+    """Tests for the shared token bucket."""
+
+    def test_burst_then_paced(self):
+        """Requests beyond the burst capacity are spaced at the refill rate."""
+        bucket = TokenBucket(rate=10, capacity=2)
+
+        delays = [bucket.reserve() for _ in range(4)]
+
+        assert delays[0] == 0 and delays[1] == 0
+        assert delays[2] == pytest.approx(0.1, abs=0.02)
+        assert delays[3] == pytest.approx(0.2, abs=0.02)
+
+
+class TestAdaptiveRateLimiter:
+    """Tests for header-driven pacing."""
+
+    def test_spreads_budget_until_reset(self):
+        """The refill rate spends the remaining budget evenly over the window."""
+        limiter = AdaptiveRateLimiter(rate=10, capacity=1)
+
+        limiter.update({
+            "X-RateLimit-Limit": "500",
+            "X-RateLimit-Remaining": "302",
+            "X-RateLimit-Reset": "60",
+        })
+
+        assert limiter.limit == 500
+        assert limiter.remaining == 302
+        assert limiter.rate == pytest.approx(300 / 60, rel=0.05)
+
+    def test_iso_reset_header(self):
+        """Vimeo's ISO 8601 reset timestamp is understood."""
+        limiter = AdaptiveRateLimiter(rate=10, capacity=1)
+        reset = datetime.now(timezone.utc) + timedelta(seconds=100)
+
+        limiter.update({
+            "X-RateLimit-Remaining": "102",
+            "X-RateLimit-Reset": reset.isoformat(),
+        })
+
+        assert limiter.rate == pytest.approx(1.0, rel=0.05)
+        assert limiter.seconds_until_reset == pytest.approx(100, abs=2)
+
+    def test_pauses_when_budget_exhausted(self):
+        """Callers wait for the window to reset once the budget is spent."""
+        limiter = AdaptiveRateLimiter(rate=10, capacity=1)
+
+        limiter.update({"X-RateLimit-Remaining": "1", "X-RateLimit-Reset": "30"})
+
+        assert limiter.reserve() == pytest.approx(30, abs=1)
+
+    def test_retry_after_pause_outlasts_later_responses(self):
+        """Headers of requests already in flight do not cut a 429 pause short."""
+        limiter = AdaptiveRateLimiter(rate=10, capacity=1)
+        limiter.update({"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "30"})
+
+        limiter.pause(60)
+        limiter.update({"X-RateLimit-Remaining": "500", "X-RateLimit-Reset": "60"})
+
+        assert limiter.reserve() == pytest.approx(60, abs=1)
+
+    def test_new_window_ends_budget_pause(self):
+        """A pause for a spent budget ends once a new window's headers arrive."""
+        limiter = AdaptiveRateLimiter(rate=10, capacity=1)
+        limiter.update({"X-RateLimit-Remaining": "1", "X-RateLimit-Reset": "30"})
+
+        limiter.update({"X-RateLimit-Remaining": "500", "X-RateLimit-Reset": "60"})
+
+        assert limiter.reserve() == 0
+
+    def test_ignores_stale_remaining_in_same_window(self):
+        """Out-of-order responses cannot raise the remaining count."""
+        limiter = AdaptiveRateLimiter(rate=10, capacity=1)
+
+        limiter.update({"X-RateLimit-Remaining": "100", "X-RateLimit-Reset": "60"})
+        limiter.update({"X-RateLimit-Remaining": "150", "X-RateLimit-Reset": "60"})
+
+        assert limiter.remaining == 100
+
+    def test_max_rate_caps_pacing(self):
+        """A configured ceiling bounds the adapted rate."""
+        limiter = AdaptiveRateLimiter(rate=10, capacity=1, max_rate=20)
+
+        limiter.update({"X-RateLimit-Remaining": "10000", "X-RateLimit-Reset": "10"})
+
+        assert limiter.rate == 20
+
+    def test_client_updates_from_response_headers(self):
+        """VimeoClient feeds every response's headers to its limiter."""
+        client = VimeoClient(access_token="token")
+
+        class FakeResponse:
+            status_code = 200
+            text = "{}"
+            content = b"{}"
+            headers = {"X-RateLimit-Remaining": "62", "X-RateLimit-Reset": "60"}
+
+        client.session.request = lambda **kwargs: FakeResponse()
+        client.get_user()
+
+        assert client.rate_limiter.remaining == 62
+        assert client.rate_limiter.rate == pytest.approx(
+            (62 - client.rate_limiter.headroom) / 60, rel=0.05
+        )
+
+    def test_api_base_url_override(self):
+        """Requests go to the configured API root instead of api.vimeo.com."""
+        client = VimeoClient(config=VimeoConfig(access_token="token", api_base_url="http://127.0.0.1:8765/"))
+        urls = []
+
+        class FakeResponse:
+            status_code = 200
+            text = "{}"
+            content = b"{}"
+            headers = {}
+
+        def request(**kwargs):
+            urls.append(kwargs["url"])
+            return FakeResponse()
+
+        client.session.request = request
+        client.get_user()
+
+        assert urls == ["http://127.0.0.1:8765/me"]
+        assert VimeoClient(access_token="token").base_url == "https://api.vimeo.com"
+
+
+def project(data, paths):
+    """Apply a Vimeo ``fields`` projection to a full payload."""
+    result = {}
+    for path in paths:
+        _copy_path(data, result, path.split("."))
+    return result
+
+
+def _copy_path(source, target, keys):
+    key, rest = keys[0], keys[1:]
+    if not isinstance(source, dict) or key not in source:
+        return
+    value = source[key]
+    if not rest:
+        target[key] = value
+    elif isinstance(value, list):
+        items = target.setdefault(key, [{} for _ in value])
+        for item, sub_target in zip(value, items):
+            _copy_path(item, sub_target, rest)
+    elif isinstance(value, dict):
+        _copy_path(value, target.setdefault(key, {}), rest)
+
+
+FULL_VIDEO_DATA = {
+    "uri": "/videos/987654",
+    "name": "Full Payload",
+    "description": "Everything Vimeo can send",
+    "duration": 1800,
+    "created_time": "2025-01-01T10:00:00+00:00",
+    "modified_time": "2025-01-05T10:00:00+00:00",
+    "release_time": "2025-01-02T10:00:00+00:00",
+    "pictures": {
+        "uri": "/videos/987654/pictures/1",
+        "sizes": [
+            {"width": 640, "height": 360, "link": "https://i.vimeocdn.com/640.jpg"},
+            {"width": 960, "height": 540, "link": "https://i.vimeocdn.com/960.jpg"},
+            {"width": 1920, "height": 1080, "link": "https://i.vimeocdn.com/1920.jpg"},
+        ],
+    },
+    "files": [
+        {"quality": "hd", "type": "video/mp4", "width": 1920, "height": 1080,
+         "link": "https://player.vimeo.com/1080.mp4", "size": 123456},
+        {"quality": "sd", "type": "video/mp4", "width": 640, "height": 360,
+         "link": "https://player.vimeo.com/360.mp4", "size": 23456},
+    ],
+    "play": {"hls": {"link": "https://player.vimeo.com/hls.m3u8", "link_expiration_time": "x"}},
+    "tags": [{"name": "featured", "uri": "/tags/featured"}],
+    "categories": [{"name": "Documentary", "uri": "/categories/doc"}],
+    "privacy": {"view": "anybody", "embed": "public"},
+    "embed": {"html": "<iframe></iframe>"},
+    "link": "https://vimeo.com/987654",
+    "stats": {"plays": 42},
+    "metadata": {"connections": {"likes": {"total": 7}}},
+    "player_embed_url": "https://player.vimeo.com/video/987654",
+}
+
+
+class TestFieldProfiles:
+    """Tests for the fields projection sent to Vimeo."""
+
+    def test_feed_profile_is_sufficient_for_feed(self):
+        """The feed profile yields the same Roku item as the full payload."""
+        projected = project(FULL_VIDEO_DATA, FEED_FIELDS)
+
+        full = RokuVideo.from_video(Video.from_vimeo_response(FULL_VIDEO_DATA))
+        lean = RokuVideo.from_video(Video.from_vimeo_response(projected))
+
+        assert lean.to_dict() == full.to_dict()
+        assert "embed" not in projected
+        assert "stats" not in projected
+
+    def test_feed_profile_parses_like_full_payload(self):
+        """Every Video attribute outside the embed and stats survives the feed projection."""
+        skipped = {"embed_html", "plays", "likes", "vimeo_embed_url"}
+
+        full = Video.from_vimeo_response(FULL_VIDEO_DATA)
+        lean = Video.from_vimeo_response(project(FULL_VIDEO_DATA, FEED_FIELDS))
+
+        for name in (f.name for f in dataclasses.fields(Video)):
+            if name not in skipped:
+                assert getattr(lean, name) == getattr(full, name), name
+        assert lean.link == "https://vimeo.com/987654"
+        assert [thumbnail.height for thumbnail in lean.thumbnails] == [360, 540, 1080]
+        assert (lean.video_files[0].width, lean.video_files[0].bitrate) == (1920, 123456)
+
+    def test_default_profile_is_feed(self):
+        """Requests use the trimmed feed projection by default."""
+        client = VimeoClient(access_token="token")
+
+        endpoint, params = client._videos_request()
+
+        assert params["fields"] == ",".join(FEED_FIELDS)
+        assert client._video_params()["fields"] == params["fields"]
+
+    def test_stats_profile_and_extra_fields(self):
+        """Callers can opt back in to stats and extra field paths."""
+        config = VimeoConfig(
+            access_token="token",
+            fields_profile="stats",
+            extra_fields=["player_embed_url", "stats.plays"]
+        )
+        client = VimeoClient(config=config)
+
+        fields = client.fields.split(",")
+
+        assert "stats.plays" in fields
+        assert "metadata.connections.likes.total" in fields
+        assert fields.count("stats.plays") == 1
+        assert fields[-1] == "player_embed_url"
+
+        video = Video.from_vimeo_response(project(FULL_VIDEO_DATA, fields))
+        assert video.plays == 42
+        assert video.likes == 7
+
+    def test_unknown_profile(self):
+        """An unknown profile name is a configuration error."""
+        with pytest.raises(ConfigurationError):
+            VimeoClient(config=VimeoConfig(access_token="token", fields_profile="nope"))
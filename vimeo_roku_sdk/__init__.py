@@ -8,6 +8,7 @@ __version__ = "1.0.0"
 __author__ = "Knox Media Group"
 
 from .vimeo_client import VimeoClient
+from .async_client import AsyncVimeoClient
 from .roku_feed import RokuFeedGenerator
 from .sync_manager import SyncManager
 from .models import Video, RokuVideo, RokuFeed
@@ -15,6 +16,7 @@ from .config import Config
 
 __all__ = [
     "VimeoClient",
+    "AsyncVimeoClient",
     "RokuFeedGenerator",
     "SyncManager",
     "Video",
@@ -0,0 +1,615 @@
+"""
+Asyncio Vimeo API client for fetching video content.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from datetime import datetime
+from typing import Optional, List, Dict, Any, AsyncGenerator, Awaitable, Callable, Set
+
+from . import json_codec
+from .models import Video
+from .config import VimeoConfig
+from .rate_limit import AdaptiveRateLimiter
+from .http_cache import ResponseCache
+from .timestamps import as_utc
+from .vimeo_client import _VimeoClientBase
+from .exceptions import VimeoAPIError, VimeoRateLimitError
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncVimeoClient(_VimeoClientBase):
+    """
+    Asyncio client for the Vimeo API.
+
+    Mirrors the public API of VimeoClient with coroutines and async
+    generators. Requests share a pooled aiohttp session and a token-bucket
+    rate limiter paced from Vimeo's rate-limit headers, so one event loop
+    can keep many requests in flight.
+
+    Use as an async context manager, or call close() when done:
+
+        async with AsyncVimeoClient(access_token="...") as vimeo:
+            async for video in vimeo.iter_all_videos():
+                ...
+    """
+
+    def __init__(
+        self,
+        access_token: str = None,
+        client_id: str = None,
+        client_secret: str = None,
+        config: VimeoConfig = None,
+        max_concurrency: int = None,
+        rate_limiter: AdaptiveRateLimiter = None,
+        response_cache: ResponseCache = None
+    ):
+        """
+        Initialize the async Vimeo client.
+
+        Args:
+            access_token: Vimeo API access token
+            client_id: Vimeo app client ID (optional, for generating tokens)
+            client_secret: Vimeo app client secret (optional, for generating tokens)
+            config: VimeoConfig object (alternative to individual parameters)
+            max_concurrency: Maximum requests in flight (defaults to config.max_workers)
+            rate_limiter: Limiter to share with other clients, including a
+                VimeoClient, so they draw on the same budget (optional)
+            response_cache: Cache for conditional GET requests (optional)
+        """
+        default_concurrency = self._init_credentials(
+            access_token, client_id, client_secret, config
+        )
+        self.max_concurrency = max(1, max_concurrency or default_concurrency or 1)
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter(
+            rate=self.DEFAULT_REQUESTS_PER_SECOND
+        )
+
+        self.response_cache = response_cache
+
+        self._session = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "AsyncVimeoClient":
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _get_session(self):
+        """Create the pooled HTTP session on first use."""
+        if self._session is None or self._session.closed:
+            try:
+                import aiohttp
+            except ImportError:
+                raise VimeoAPIError(
+                    "aiohttp is required for AsyncVimeoClient. Install with: pip install aiohttp"
+                )
+
+            self._session = aiohttp.ClientSession(
+                headers=self._default_headers(),
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def close(self):
+        """Close the underlying HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Dict[str, Any] = None,
+        data: Dict[str, Any] = None,
+        retry_count: int = 3
+    ) -> Dict[str, Any]:
+        """
+        Make a request to the Vimeo API with rate limiting and retry logic.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint (without base URL)
+            params: Query parameters
+            data: Request body data
+            retry_count: Number of retries on failure
+
+        Returns:
+            API response as dictionary
+
+        Raises:
+            VimeoAPIError: On API errors
+            VimeoAuthError: On authentication errors
+            VimeoRateLimitError: On rate limit errors
+        """
+        session = await self._get_session()
+        import aiohttp  # Importable once the session exists
+
+        url = f"{self.base_url}{endpoint}"
+
+        cached = None
+        if self.response_cache is not None and method == "GET":
+            cached = self.response_cache.get(endpoint, params)
+
+        for attempt in range(retry_count):
+            with self.tracer.timed("rate_limit_wait"):
+                await self.rate_limiter.acquire_async()
+
+            try:
+                async with self._semaphore:
+                    with self._http_span(method, endpoint, params, attempt) as span:
+                        async with session.request(
+                            method,
+                            url,
+                            params=params,
+                            json=data,
+                            headers=cached.conditional_headers() if cached else None
+                        ) as response:
+                            status = response.status
+                            headers = response.headers
+                            body = await response.read()
+                        self._trace_response(span, status, body)
+                self.rate_limiter.update(headers)
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt < retry_count - 1:
+                    wait_time = 2 ** attempt  # Exponential backoff
+                    logger.warning(f"Request failed, retrying in {wait_time}s: {e}")
+                    self._trace_retry(wait_time, throttled=False)
+                    await asyncio.sleep(wait_time)
+                    continue
+                raise VimeoAPIError(f"Request failed after {retry_count} attempts: {e}")
+
+            # Unchanged since the cached copy
+            if status == 304 and cached is not None:
+                logger.debug(f"Not modified, serving cached response for {endpoint}")
+                return cached.json()
+
+            # Handle rate limiting
+            if status == 429:
+                retry_after = int(headers.get("Retry-After", 60))
+                if attempt < retry_count - 1:
+                    logger.warning(f"Rate limited, waiting {retry_after} seconds...")
+                    self._trace_retry(retry_after, throttled=True)
+                    self.rate_limiter.pause(retry_after)
+                    continue
+                raise VimeoRateLimitError(
+                    "Rate limit exceeded",
+                    retry_after=retry_after
+                )
+
+            # Handle authentication and other errors
+            text = body.decode("utf-8", errors="replace")
+            self._raise_for_status(status, text)
+
+            if self.response_cache is not None and method == "GET":
+                self.response_cache.put(endpoint, params, headers, body)
+
+            return json_codec.loads(body) if body else {}
+
+    async def _iter_pages(
+        self,
+        fetch_page: Callable[[int], Awaitable[Dict[str, Any]]],
+        concurrent: bool = True,
+        on_total: Callable[[int], None] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Iterate over the pages of a paginated listing, in page order.
+
+        After the first page, up to ``2 * max_concurrency`` further pages are
+        requested ahead of the consumer as concurrent tasks.
+
+        Args:
+            fetch_page: Coroutine function returning the response for a page number
+            concurrent: Fetch ahead of the consumer (disable for scans that
+                usually stop after a page or two)
+            on_total: Called with the listing's total item count once known
+
+        Yields:
+            API responses, one per non-empty page
+        """
+        response = await fetch_page(1)
+        page = 1
+        if on_total and response.get("total") is not None:
+            on_total(response["total"])
+        if not response.get("data"):
+            return
+        yield response
+
+        last_page = self._last_page(response)
+        if concurrent and last_page and response.get("paging", {}).get("next"):
+            window = self.max_concurrency * 2
+            pending = deque()
+            next_page = page + 1
+
+            try:
+                while next_page <= last_page or pending:
+                    while next_page <= last_page and len(pending) < window:
+                        pending.append(asyncio.ensure_future(fetch_page(next_page)))
+                        next_page += 1
+                    response = await pending.popleft()
+                    if not response.get("data"):
+                        return
+                    yield response
+            finally:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+            page = max(page, last_page)
+
+        # Follow the remaining links (the catalog may have grown while paging)
+        while response.get("paging", {}).get("next"):
+            page += 1
+            logger.debug(f"Fetching page {page}...")
+            response = await fetch_page(page)
+            if not response.get("data"):
+                break
+            yield response
+
+    async def get_user(self, user_id: str = None) -> Dict[str, Any]:
+        """
+        Get user information.
+
+        Args:
+            user_id: User ID or 'me' for authenticated user
+
+        Returns:
+            User data dictionary
+        """
+        return await self._make_request("GET", self._user_endpoint(user_id))
+
+    async def get_video(self, video_id: str) -> Video:
+        """
+        Get a single video by ID.
+
+        Args:
+            video_id: Vimeo video ID
+
+        Returns:
+            Video object
+        """
+        data = await self._make_request("GET", f"/videos/{video_id}", params=self._video_params())
+        return self._parse_video(data)
+
+    async def get_videos(
+        self,
+        user_id: str = None,
+        per_page: int = None,
+        page: int = 1,
+        sort: str = "date",
+        direction: str = "desc",
+        filter_playable: bool = True,
+        fields: str = None
+    ) -> Dict[str, Any]:
+        """
+        Get videos for a user.
+
+        Args:
+            user_id: User ID or 'me' for authenticated user
+            per_page: Number of videos per page (max 100)
+            page: Page number
+            sort: Sort field (date, alphabetical, plays, likes, duration)
+            direction: Sort direction (asc, desc)
+            filter_playable: Only return videos that are playable
+            fields: Override the configured fields projection
+
+        Returns:
+            API response with video data and pagination info
+        """
+        endpoint, params = self._videos_request(
+            user_id, per_page, page, sort, direction, filter_playable, fields
+        )
+        return await self._make_request("GET", endpoint, params=params)
+
+    async def iter_all_videos(
+        self,
+        user_id: str = None,
+        sort: str = "date",
+        direction: str = "desc",
+        filter_playable: bool = True,
+        on_total: Callable[[int], None] = None
+    ) -> AsyncGenerator[Video, None]:
+        """
+        Iterate over all videos for a user with automatic pagination.
+
+        Args:
+            user_id: User ID or 'me' for authenticated user
+            sort: Sort field
+            direction: Sort direction
+            filter_playable: Only return playable videos
+            on_total: Called with the total number of videos once known
+
+        Yields:
+            Video objects
+        """
+        pages = self._iter_pages(lambda page: self.get_videos(
+            user_id=user_id,
+            page=page,
+            sort=sort,
+            direction=direction,
+            filter_playable=filter_playable
+        ), on_total=on_total)
+
+        try:
+            async for response in pages:
+                for video_data in response["data"]:
+                    yield self._parse_video(video_data)
+        finally:
+            # Cancel pages still in flight when the consumer stops early
+            await pages.aclose()
+
+    async def get_all_videos(
+        self,
+        user_id: str = None,
+        sort: str = "date",
+        direction: str = "desc",
+        filter_playable: bool = True,
+        limit: int = None
+    ) -> List[Video]:
+        """
+        Get all videos for a user.
+
+        Args:
+            user_id: User ID or 'me' for authenticated user
+            sort: Sort field
+            direction: Sort direction
+            filter_playable: Only return playable videos
+            limit: Maximum number of videos to return
+
+        Returns:
+            List of Video objects
+        """
+        videos = []
+        pages = self.iter_all_videos(user_id, sort, direction, filter_playable)
+        try:
+            async for video in pages:
+                videos.append(video)
+                if limit and len(videos) >= limit:
+                    break
+        finally:
+            await pages.aclose()
+        return videos
+
+    async def get_video_ids(
+        self,
+        user_id: str = None,
+        filter_playable: bool = True
+    ) -> Set[str]:
+        """
+        Get the IDs of all videos for a user.
+
+        Only each video's URI is requested, so this is a cheap way to find
+        videos that were deleted since the last sync.
+
+        Args:
+            user_id: User ID or 'me' for authenticated user
+            filter_playable: Only return playable videos
+
+        Returns:
+            Set of video IDs
+        """
+        pages = self._iter_pages(lambda page: self.get_videos(
+            user_id=user_id,
+            page=page,
+            filter_playable=filter_playable,
+            fields="uri"
+        ))
+        return {video_id async for response in pages for video_id in self._video_ids(response)}
+
+    async def get_album_videos(
+        self,
+        album_id: str = None,
+        user_id: str = None,
+        per_page: int = None,
+        page: int = 1,
+        fields: str = None
+    ) -> Dict[str, Any]:
+        """
+        Get videos from an album/showcase.
+
+        Args:
+            album_id: Album ID
+            user_id: User ID or 'me' for authenticated user
+            per_page: Number of videos per page
+            page: Page number
+            fields: Override the configured fields projection
+
+        Returns:
+            API response with video data
+        """
+        endpoint, params = self._album_videos_request(
+            album_id, user_id, per_page, page, fields
+        )
+        return await self._make_request("GET", endpoint, params=params)
+
+    async def iter_album_videos(
+        self,
+        album_id: str = None,
+        user_id: str = None,
+        on_total: Callable[[int], None] = None
+    ) -> AsyncGenerator[Video, None]:
+        """
+        Iterate over all videos in an album with automatic pagination.
+
+        Args:
+            album_id: Album ID
+            user_id: User ID
+            on_total: Called with the total number of videos once known
+
+        Yields:
+            Video objects
+        """
+        pages = self._iter_pages(lambda page: self.get_album_videos(
+            album_id=album_id,
+            user_id=user_id,
+            page=page
+        ), on_total=on_total)
+
+        try:
+            async for response in pages:
+                for video_data in response["data"]:
+                    yield self._parse_video(video_data)
+        finally:
+            # Cancel pages still in flight when the consumer stops early
+            await pages.aclose()
+
+    async def get_album_video_ids(self, album_id: str = None, user_id: str = None) -> Set[str]:
+        """
+        Get the IDs of all videos in an album.
+
+        Args:
+            album_id: Album ID
+            user_id: User ID
+
+        Returns:
+            Set of video IDs
+        """
+        pages = self._iter_pages(lambda page: self.get_album_videos(
+            album_id=album_id,
+            user_id=user_id,
+            page=page,
+            fields="uri"
+        ))
+        return {video_id async for response in pages for video_id in self._video_ids(response)}
+
+    async def get_folder_videos(
+        self,
+        folder_id: str = None,
+        user_id: str = None,
+        per_page: int = None,
+        page: int = 1,
+        fields: str = None
+    ) -> Dict[str, Any]:
+        """
+        Get videos from a folder/project.
+
+        Args:
+            folder_id: Folder/project ID
+            user_id: User ID
+            per_page: Number of videos per page
+            page: Page number
+            fields: Override the configured fields projection
+
+        Returns:
+            API response with video data
+        """
+        endpoint, params = self._folder_videos_request(
+            folder_id, user_id, per_page, page, fields
+        )
+        return await self._make_request("GET", endpoint, params=params)
+
+    async def iter_folder_videos(
+        self,
+        folder_id: str = None,
+        user_id: str = None,
+        on_total: Callable[[int], None] = None
+    ) -> AsyncGenerator[Video, None]:
+        """
+        Iterate over all videos in a folder with automatic pagination.
+
+        Args:
+            folder_id: Folder ID
+            user_id: User ID
+            on_total: Called with the total number of videos once known
+
+        Yields:
+            Video objects
+        """
+        pages = self._iter_pages(lambda page: self.get_folder_videos(
+            folder_id=folder_id,
+            user_id=user_id,
+            page=page
+        ), on_total=on_total)
+
+        try:
+            async for response in pages:
+                for video_data in response["data"]:
+                    yield self._parse_video(video_data)
+        finally:
+            # Cancel pages still in flight when the consumer stops early
+            await pages.aclose()
+
+    async def get_folder_video_ids(self, folder_id: str = None, user_id: str = None) -> Set[str]:
+        """
+        Get the IDs of all videos in a folder.
+
+        Args:
+            folder_id: Folder ID
+            user_id: User ID
+
+        Returns:
+            Set of video IDs
+        """
+        pages = self._iter_pages(lambda page: self.get_folder_videos(
+            folder_id=folder_id,
+            user_id=user_id,
+            page=page,
+            fields="uri"
+        ))
+        return {video_id async for response in pages for video_id in self._video_ids(response)}
+
+    async def get_videos_modified_since(
+        self,
+        since: datetime,
+        user_id: str = None
+    ) -> List[Video]:
+        """
+        Get videos modified since a specific date.
+
+        Useful for incremental syncs. The listing is requested newest
+        modification first and paged one page at a time, so the scan stops
+        at the first page that reaches an unchanged video.
+
+        Args:
+            since: Datetime to filter from
+            user_id: User ID
+
+        Returns:
+            List of videos modified since the given date, most recent first
+        """
+        since = as_utc(since)
+        videos: Dict[str, Video] = {}
+        pages = self._iter_pages(lambda page: self.get_videos(
+            user_id=user_id,
+            page=page,
+            sort="modified_time",
+            direction="desc"
+        ), concurrent=False)
+
+        try:
+            async for response in pages:
+                if self._take_modified_since(response, since, videos):
+                    break
+        finally:
+            await pages.aclose()
+
+        return list(videos.values())
+
+    async def search_videos(
+        self,
+        query: str,
+        user_id: str = None,
+        per_page: int = None,
+        page: int = 1
+    ) -> Dict[str, Any]:
+        """
+        Search videos by query.
+
+        Args:
+            query: Search query
+            user_id: User ID to search within
+            per_page: Number of results per page
+            page: Page number
+
+        Returns:
+            API response with search results
+        """
+        endpoint, params = self._search_request(query, user_id, per_page, page)
+        return await self._make_request("GET", endpoint, params=params)
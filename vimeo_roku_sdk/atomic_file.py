@@ -0,0 +1,191 @@
+"""
+Crash-safe file replacement.
+
+Files are written to a temporary sibling, flushed to disk and renamed over
+the target, so readers (and a restarted process) only ever see the old or
+the new contents, never a partial write.
+"""
+
+import logging
+import os
+import shutil
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator, List, Union
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+
+class Discard(Exception):
+    """Raise inside an atomic_write() block to drop the new contents quietly."""
+
+
+def generation_path(path: PathLike, generation: int) -> Path:
+    """Path of a previous generation of a file (``feed.json.1`` is the newest)."""
+    path = Path(path)
+    return path.with_name(f"{path.name}.{generation}")
+
+
+def list_generations(path: PathLike) -> List[Path]:
+    """Previous generations of a file that exist on disk, newest first."""
+    generations = []
+    generation = 1
+    while generation_path(path, generation).exists():
+        generations.append(generation_path(path, generation))
+        generation += 1
+    return generations
+
+
+class AtomicFile:
+    """
+    A temporary sibling of ``path`` that replaces it when committed.
+
+    Use atomic_write() for a single file; this class is for writers that
+    must commit or discard several files together.
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        mode: str = "w",
+        encoding: str = "utf-8",
+        keep: int = 0,
+        fsync: bool = True
+    ):
+        """
+        Create the temporary file.
+
+        Args:
+            path: File to write
+            mode: 'w' for text or 'wb' for binary
+            encoding: Text encoding (ignored for binary mode)
+            keep: Previous generations to keep as ``path.1`` .. ``path.N``
+            fsync: Flush the data and the rename to disk on commit
+        """
+        if mode not in ("w", "wb"):
+            raise ValueError(f"Unsupported mode '{mode}'")
+
+        self.path = Path(path)
+        self.keep = keep
+        self.fsync = fsync
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Unlike mkstemp, opening with 'x' creates the file with the usual
+        # umask-based permissions, so a replaced feed stays readable by others
+        self.tmp_path = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex[:12]}.tmp")
+        self.file: IO = open(
+            self.tmp_path,
+            mode.replace("w", "x"),
+            encoding=None if "b" in mode else encoding
+        )
+
+    def commit(self):
+        """Flush the temporary file and rename it over the target."""
+        try:
+            self.file.flush()
+            if self.fsync:
+                os.fsync(self.file.fileno())
+            self.file.close()
+
+            if self.path.exists():
+                shutil.copymode(self.path, self.tmp_path)
+                if self.keep > 0:
+                    _rotate(self.path, self.keep)
+            os.replace(self.tmp_path, self.path)
+        except BaseException:
+            self.discard()
+            raise
+
+        if self.fsync:
+            _fsync_dir(self.path.parent)
+
+    def discard(self):
+        """Remove the temporary file, leaving the target untouched."""
+        self.file.close()
+        try:
+            os.unlink(self.tmp_path)
+        except OSError:
+            pass
+
+
+@contextmanager
+def atomic_write(
+    path: PathLike,
+    mode: str = "w",
+    encoding: str = "utf-8",
+    keep: int = 0,
+    fsync: bool = True
+) -> Iterator[IO]:
+    """
+    Open a file for writing that replaces ``path`` only once complete.
+
+    If the block raises, the temporary file is removed and ``path`` is left
+    untouched. Raising Discard does the same without propagating an error,
+    for writers that only find out at the end that nothing changed.
+
+    Args:
+        path: File to write
+        mode: 'w' for text or 'wb' for binary
+        encoding: Text encoding (ignored for binary mode)
+        keep: Previous generations to keep as ``path.1`` .. ``path.N``
+        fsync: Flush the data and the rename to disk before returning
+
+    Yields:
+        File object for the temporary file
+
+    Example:
+        with atomic_write("feed.json", keep=3) as f:
+            f.write(data)
+    """
+    target = AtomicFile(path, mode, encoding, keep, fsync)
+    try:
+        yield target.file
+    except Discard:
+        target.discard()
+        return
+    except BaseException:
+        target.discard()
+        raise
+    target.commit()
+
+
+def _rotate(path: Path, keep: int):
+    """
+    Shift previous generations up by one and keep the current file as ``path.1``.
+
+    The current file is hard-linked (or copied where links are unsupported)
+    rather than moved, so ``path`` exists throughout.
+    """
+    oldest = generation_path(path, keep)
+    if oldest.exists():
+        oldest.unlink()
+    for generation in range(keep - 1, 0, -1):
+        previous = generation_path(path, generation)
+        if previous.exists():
+            os.replace(previous, generation_path(path, generation + 1))
+
+    newest = generation_path(path, 1)
+    try:
+        os.link(path, newest)
+    except OSError:
+        shutil.copy2(path, newest)
+
+
+def _fsync_dir(directory: Path):
+    """Persist a rename by syncing its directory (not supported on Windows)."""
+    if os.name == "nt":
+        return
+    try:
+        fd = os.open(str(directory), os.O_RDONLY)
+    except OSError as e:
+        logger.debug(f"Cannot open {directory} to sync it: {e}")
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -0,0 +1,457 @@
+"""
+Local mirror of the Vimeo library.
+
+CatalogStore keeps every parsed Video in an SQLite database under the
+cache directory, with indexed columns for the fields feeds are filtered
+on, so feeds can be rebuilt, filters run and videos listed without
+paging through the whole library again. refresh() keeps it current with
+one "modified since" scan and one ID listing per run.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from . import json_codec
+from .models import DEFAULT_MEDIA_POLICY, MediaPolicy, Video
+from .timestamps import parse_timestamp, utc_now
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FILENAME = "catalog.db"
+
+
+@dataclass
+class RefreshResult:
+    """What a catalog refresh changed."""
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+    full: bool = False
+    duration_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "added": self.added,
+            "updated": self.updated,
+            "removed": self.removed,
+            "full": self.full,
+            "duration_seconds": self.duration_seconds
+        }
+
+
+class CatalogStore:
+    """
+    Videos of the Vimeo library, mirrored in an SQLite database.
+
+    Each video is stored whole (as Video.to_dict() JSON) next to indexed
+    columns for modified/created time, privacy and duration, and tags and
+    categories get lookup tables of their own, so query() filters in SQL
+    and only decodes the videos it returns.
+
+    Example:
+        catalog = CatalogStore("./cache/catalog.db")
+        catalog.refresh(vimeo_client)
+        for video in catalog.query(include_tags=["sermon"], min_duration=60):
+            print(video.title)
+    """
+
+    SCHEMA_VERSION = 1
+    BATCH_SIZE = 500  # Videos written per transaction while crawling
+
+    def __init__(self, path: str, policy: MediaPolicy = DEFAULT_MEDIA_POLICY):
+        """
+        Open (and create if needed) the catalog database.
+
+        Args:
+            path: Database file path, or ":memory:"
+            policy: How to choose each loaded video's thumbnail and video file
+        """
+        self.path = path
+        self.policy = policy
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._migrate()
+
+    def _migrate(self):
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= self.SCHEMA_VERSION:
+            return
+
+        with self.transaction():
+            if version < 1:
+                self._create_tables()
+            self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+    def _create_tables(self):
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS videos (
+                video_id TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                duration INTEGER NOT NULL,
+                privacy TEXT NOT NULL,
+                created_time REAL NOT NULL,
+                modified_time REAL NOT NULL,
+                data TEXT NOT NULL
+            )
+            """
+        )
+        for column in ("modified_time", "created_time", "privacy", "duration"):
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_videos_{column} ON videos ({column})"
+            )
+        for table, column in (("video_tags", "tag"), ("video_categories", "category")):
+            self._conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    {column} TEXT NOT NULL,
+                    video_id TEXT NOT NULL,
+                    PRIMARY KEY ({column}, video_id)
+                ) WITHOUT ROWID
+                """
+            )
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{table}_video_id ON {table} (video_id)"
+            )
+
+    @contextmanager
+    def transaction(self):
+        """Group changes so they are saved atomically."""
+        with self._lock:
+            outermost = self._depth == 0
+            if outermost:
+                self._conn.execute("BEGIN IMMEDIATE")
+            self._depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._depth -= 1
+                if outermost:
+                    self._conn.execute("ROLLBACK")
+                raise
+            self._depth -= 1
+            if outermost:
+                self._conn.execute("COMMIT")
+
+    def get_meta(self, key: str, default: str = None) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key: str, value: Optional[str]):
+        with self.transaction():
+            if value is None:
+                self._conn.execute("DELETE FROM meta WHERE key = ?", (key,))
+            else:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    (key, value)
+                )
+
+    @property
+    def last_refresh(self) -> Optional[datetime]:
+        """When the last successful refresh started, if there was one."""
+        value = self.get_meta("last_refresh")
+        return parse_timestamp(value) if value else None
+
+    def upsert_videos(self, videos: Iterable[Video]) -> int:
+        """
+        Insert or replace videos by ID.
+
+        Returns:
+            Number of videos that were not in the catalog before
+        """
+        added = 0
+        with self.transaction():
+            for video in videos:
+                exists = self._conn.execute(
+                    "SELECT 1 FROM videos WHERE video_id = ?", (video.id,)
+                ).fetchone()
+                if exists:
+                    self._delete_labels([video.id])
+                else:
+                    added += 1
+                self._conn.execute(
+                    """
+                    INSERT OR REPLACE INTO videos
+                        (video_id, title, duration, privacy, created_time, modified_time, data)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        video.id,
+                        video.title,
+                        video.duration,
+                        video.privacy,
+                        video.created_time.timestamp(),
+                        video.modified_time.timestamp(),
+                        json_codec.dumps(video.to_dict()).decode("utf-8")
+                    )
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO video_tags (tag, video_id) VALUES (?, ?)",
+                    ((tag.lower(), video.id) for tag in video.tags)
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO video_categories (category, video_id) VALUES (?, ?)",
+                    ((category.lower(), video.id) for category in video.categories)
+                )
+        return added
+
+    def delete_videos(self, video_ids: Iterable[str]) -> int:
+        """
+        Delete videos by ID.
+
+        Returns:
+            Number of videos deleted
+        """
+        video_ids = list(video_ids)
+        with self.transaction():
+            self._delete_labels(video_ids)
+            cursor = self._conn.executemany(
+                "DELETE FROM videos WHERE video_id = ?",
+                ((video_id,) for video_id in video_ids)
+            )
+            return max(cursor.rowcount, 0)
+
+    def _delete_labels(self, video_ids: List[str]):
+        for table in ("video_tags", "video_categories"):
+            self._conn.executemany(
+                f"DELETE FROM {table} WHERE video_id = ?",
+                ((video_id,) for video_id in video_ids)
+            )
+
+    def clear(self):
+        """Remove every video and the refresh history."""
+        with self.transaction():
+            for table in ("videos", "video_tags", "video_categories", "meta"):
+                self._conn.execute(f"DELETE FROM {table}")
+
+    def refresh(self, client, full: bool = False) -> RefreshResult:
+        """
+        Bring the catalog up to date with the Vimeo library.
+
+        The first refresh crawls the whole library. Later ones fetch only
+        the videos modified since the previous refresh started, then drop
+        videos whose IDs the library no longer lists. A change to the
+        client's fields, lean_models or media settings forces a full
+        crawl, since stored videos were parsed with the old ones.
+
+        Args:
+            client: VimeoClient to fetch with
+            full: Crawl the whole library even if an incremental refresh would do
+
+        Returns:
+            RefreshResult with the number of videos added, updated and removed
+        """
+        start = time.perf_counter()
+        started_at = utc_now()
+        result = RefreshResult()
+        settings = self._client_settings(client)
+        last_refresh = self.last_refresh
+
+        full = full or last_refresh is None or self.get_meta("client_settings") != settings
+        if full:
+            logger.info("Crawling the Vimeo library into the catalog...")
+            # Each batch is committed on its own, so the database is not
+            # locked while pages are fetched; an interrupted crawl records
+            # no refresh and the next one starts over.
+            current_ids: Set[str] = set()
+            known_ids = self.video_ids()
+            batch: List[Video] = []
+            for video in client.iter_all_videos():
+                current_ids.add(video.id)
+                batch.append(video)
+                if len(batch) >= self.BATCH_SIZE:
+                    result.added += self.upsert_videos(batch)
+                    batch.clear()
+            result.added += self.upsert_videos(batch)
+            result.updated = len(current_ids) - result.added
+            with self.transaction():
+                result.removed = self.delete_videos(known_ids - current_ids)
+                self._finish_refresh(started_at, settings)
+        else:
+            logger.info(f"Refreshing the catalog with changes since {last_refresh}")
+            changed = client.get_videos_modified_since(last_refresh)
+            current_ids = client.get_video_ids()
+            with self.transaction():
+                result.added = self.upsert_videos(changed)
+                result.updated = len(changed) - result.added
+                result.removed = self.delete_videos(self.video_ids() - current_ids)
+                self._finish_refresh(started_at, settings)
+
+        result.full = full
+        result.duration_seconds = time.perf_counter() - start
+        logger.info(
+            f"Catalog refreshed: {result.added} added, {result.updated} updated, "
+            f"{result.removed} removed ({self.count()} videos)"
+        )
+        return result
+
+    def _finish_refresh(self, started_at: datetime, settings: str):
+        self.set_meta("last_refresh", started_at.isoformat())
+        self.set_meta("client_settings", settings)
+
+    @staticmethod
+    def _client_settings(client) -> str:
+        """What determines how a client parses videos, to spot stale records."""
+        return "|".join([
+            str(getattr(client, "fields", "")),
+            str(getattr(client, "lean_models", False)),
+            repr(getattr(client, "media_policy", DEFAULT_MEDIA_POLICY))
+        ])
+
+    def count(self) -> int:
+        """Number of videos in the catalog."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM videos").fetchone()[0]
+
+    def video_ids(self) -> Set[str]:
+        """IDs of every video in the catalog."""
+        with self._lock:
+            return {row[0] for row in self._conn.execute("SELECT video_id FROM videos")}
+
+    def get_video(self, video_id: str) -> Optional[Video]:
+        """Look up a video by ID."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM videos WHERE video_id = ?", (video_id,)
+            ).fetchone()
+        return self._to_video(row[0]) if row else None
+
+    def query(
+        self,
+        privacy: str = None,
+        min_duration: int = None,
+        max_duration: int = None,
+        include_tags: List[str] = None,
+        exclude_tags: List[str] = None,
+        categories: List[str] = None,
+        modified_since: datetime = None,
+        limit: int = None
+    ) -> List[Video]:
+        """
+        Find videos, newest first.
+
+        Tags and categories match case-insensitively.
+
+        Args:
+            privacy: Only videos with this privacy setting (e.g. 'anybody')
+            min_duration: Minimum duration in seconds
+            max_duration: Maximum duration in seconds
+            include_tags: Only videos with at least one of these tags
+            exclude_tags: Skip videos with any of these tags
+            categories: Only videos in at least one of these categories
+            modified_since: Only videos modified at or after this time (like
+                VimeoClient.get_videos_modified_since)
+            limit: Maximum number of videos
+
+        Returns:
+            Matching videos, most recently created first
+        """
+        videos = self.iter_videos(
+            privacy=privacy,
+            min_duration=min_duration,
+            max_duration=max_duration,
+            include_tags=include_tags,
+            exclude_tags=exclude_tags,
+            categories=categories,
+            modified_since=modified_since
+        )
+        return list(islice(videos, limit) if limit else videos)
+
+    def iter_videos(self, batch_size: int = 500, **filters) -> Iterator[Video]:
+        """
+        Iterate over videos newest first, loading batch_size rows at a time.
+
+        Args:
+            batch_size: Rows read per query
+            **filters: Same filters as query()
+        """
+        clauses, params = self._filters(**filters)
+        after = None  # (created_time, video_id) of the last row read
+        while True:
+            page_clauses = list(clauses)
+            page_params = list(params)
+            if after:
+                page_clauses.append("(created_time < ? OR (created_time = ? AND video_id > ?))")
+                page_params.extend([after[0], after[0], after[1]])
+
+            sql = "SELECT created_time, video_id, data FROM videos"
+            if page_clauses:
+                sql += " WHERE " + " AND ".join(page_clauses)
+            sql += " ORDER BY created_time DESC, video_id LIMIT ?"
+            page_params.append(batch_size)
+
+            with self._lock:
+                rows = self._conn.execute(sql, page_params).fetchall()
+            for _, _, data in rows:
+                yield self._to_video(data)
+            if len(rows) < batch_size:
+                return
+            after = rows[-1][:2]
+
+    @staticmethod
+    def _filters(
+        privacy: str = None,
+        min_duration: int = None,
+        max_duration: int = None,
+        include_tags: List[str] = None,
+        exclude_tags: List[str] = None,
+        categories: List[str] = None,
+        modified_since: datetime = None
+    ) -> Tuple[List[str], List[Any]]:
+        """SQL conditions and parameters for query() filters."""
+        clauses: List[str] = []
+        params: List[Any] = []
+
+        if privacy is not None:
+            clauses.append("privacy = ?")
+            params.append(privacy)
+        if min_duration:
+            clauses.append("duration >= ?")
+            params.append(min_duration)
+        if max_duration:
+            clauses.append("duration <= ?")
+            params.append(max_duration)
+        if modified_since is not None:
+            clauses.append("modified_time >= ?")
+            params.append(modified_since.timestamp())
+        for values, table, column, negate in (
+            (include_tags, "video_tags", "tag", False),
+            (exclude_tags, "video_tags", "tag", True),
+            (categories, "video_categories", "category", False),
+        ):
+            if values:
+                placeholders = ", ".join("?" for _ in values)
+                clauses.append(
+                    f"video_id {'NOT IN' if negate else 'IN'} "
+                    f"(SELECT video_id FROM {table} WHERE {column} IN ({placeholders}))"
+                )
+                params.extend(value.lower() for value in values)
+
+        return clauses, params
+
+    def _to_video(self, data: str) -> Video:
+        return Video.from_dict(json_codec.loads(data), policy=self.policy)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
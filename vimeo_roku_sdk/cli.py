@@ -3,13 +3,19 @@ Command-line interface for the Vimeo to Roku SDK.
 """
 
 import argparse
+import cProfile
 import logging
+import pstats
 import sys
 import os
 from pathlib import Path
 from datetime import datetime
+from itertools import islice
+from typing import List
 
-from .config import Config
+from .catalog_store import CATALOG_FILENAME, CatalogStore
+from .config import Config, SyncConfig, VimeoConfig
+from .models import DEFAULT_MEDIA_POLICY
 from .sync_manager import SyncManager, create_sync_manager
 from .vimeo_client import VimeoClient
 from .roku_feed import RokuFeedGenerator
@@ -41,6 +47,55 @@ def print_progress(current: int, total: int):
         print()  # New line when complete
 
 
+def print_sync_result(result):
+    """Print the counts, stage times and errors of a sync."""
+    print(f"Videos processed: {result.videos_processed}")
+    print(f"Videos added: {result.videos_added}")
+    print(f"Videos skipped: {result.videos_skipped}")
+    for reason, count in sorted(result.skip_reasons.items()):
+        print(f"  {reason}: {count}")
+    print(f"Videos failed: {result.videos_failed}")
+    print(f"Duration: {result.duration_seconds:.2f} seconds")
+
+    print_stages(result.trace)
+
+    if result.feed_path:
+        print(f"Feed saved to: {result.feed_path}")
+    if result.feed_url:
+        print(f"Feed URL: {result.feed_url}")
+
+    print_errors(result.errors)
+
+
+def print_errors(errors):
+    """Print the first errors of a sync."""
+    if errors:
+        print()
+        print("Errors:")
+        for error in errors[:10]:
+            print(f"  - {error}")
+        if len(errors) > 10:
+            print(f"  ... and {len(errors) - 10} more")
+
+
+def print_stages(trace):
+    """Print the time spent in the main stages of a sync."""
+    stages = trace.get("stages", {})
+    if stages:
+        print("Stages: " + ", ".join(
+            f"{name} {stages[name]['seconds']:.2f}s"
+            for name in ("fetch", "fetch_changes", "list_ids", "convert", "stream", "save", "upload")
+            if name in stages
+        ))
+
+
+def create_vimeo_client(access_token: str) -> VimeoClient:
+    """Vimeo client for the list and test commands, honouring the other VIMEO_* settings."""
+    vimeo_config = VimeoConfig.from_env()
+    vimeo_config.access_token = access_token
+    return VimeoClient(config=vimeo_config)
+
+
 def cmd_sync(args):
     """Execute the sync command."""
     print("Vimeo to Roku Sync")
@@ -61,6 +116,8 @@ def cmd_sync(args):
         config.roku.provider_name = args.provider_name
     if args.output:
         config.roku.feed_output_path = args.output
+    if args.trace:
+        config.sync.trace_path = args.trace
 
     # Validate configuration
     errors = config.validate()
@@ -70,6 +127,10 @@ def cmd_sync(args):
             print(f"  - {error}")
         sys.exit(1)
 
+    if config.channels and args.incremental:
+        print("Error: --incremental cannot be used with channels (channel feeds are always rebuilt in full)")
+        sys.exit(1)
+
     # Setup logging
     setup_logging(config.sync.log_level, config.sync.log_file)
 
@@ -80,8 +141,12 @@ def cmd_sync(args):
     if not args.quiet:
         manager.set_callbacks(on_progress=print_progress)
 
-    print(f"Provider: {config.roku.provider_name}")
-    print(f"Output: {config.roku.feed_output_path}")
+    if config.channels:
+        for channel in config.channels:
+            print(f"Channel {channel.name}: {channel.roku.provider_name} -> {channel.roku.feed_output_path}")
+    else:
+        print(f"Provider: {config.roku.provider_name}")
+        print(f"Output: {config.roku.feed_output_path}")
     print()
 
     # Determine source
@@ -101,38 +166,52 @@ def cmd_sync(args):
     print()
 
     # Run sync
-    result = manager.sync(
+    sync_kwargs = dict(
         source=source,
         album_id=album_id,
         folder_id=folder_id,
-        incremental=args.incremental,
         upload=args.upload,
         notify=args.notify
     )
+    if config.channels:
+        # Channels share one crawl and always rebuild their feeds (--incremental is rejected above)
+        run = manager.sync_channels
+    else:
+        run = manager.sync
+        sync_kwargs["incremental"] = args.incremental
+
+    if args.profile:
+        profiler = cProfile.Profile()
+        result = profiler.runcall(run, **sync_kwargs)
+        profiler.dump_stats(args.profile)
+    else:
+        result = run(**sync_kwargs)
 
     # Print results
     print()
     print("Sync Results")
     print("-" * 30)
     print(f"Status: {'SUCCESS' if result.success else 'FAILED'}")
-    print(f"Videos processed: {result.videos_processed}")
-    print(f"Videos added: {result.videos_added}")
-    print(f"Videos skipped: {result.videos_skipped}")
-    print(f"Videos failed: {result.videos_failed}")
-    print(f"Duration: {result.duration_seconds:.2f} seconds")
 
-    if result.feed_path:
-        print(f"Feed saved to: {result.feed_path}")
-    if result.feed_url:
-        print(f"Feed URL: {result.feed_url}")
+    if config.channels:
+        print(f"Videos fetched: {result.videos_fetched}")
+        print(f"Duration: {result.duration_seconds:.2f} seconds")
+        print_stages(result.trace)
+        print_errors(result.errors)
+        for name, channel_result in result.channels.items():
+            print()
+            print(f"Channel {name}: {'SUCCESS' if channel_result.success else 'FAILED'}")
+            print_sync_result(channel_result)
+    else:
+        print_sync_result(result)
 
-    if result.errors:
+    if config.sync.trace_path:
+        print(f"Trace saved to: {config.sync.trace_path}")
+
+    if args.profile:
         print()
-        print("Errors:")
-        for error in result.errors[:10]:
-            print(f"  - {error}")
-        if len(result.errors) > 10:
-            print(f"  ... and {len(result.errors) - 10} more")
+        print(f"Profile saved to: {args.profile}")
+        pstats.Stats(args.profile).sort_stats("cumulative").print_stats(20)
 
     return 0 if result.success else 1
 
@@ -145,11 +224,10 @@ def cmd_validate(args):
         print(f"Error: File not found: {args.feed_file}")
         return 1
 
-    import json
+    from .json_codec import load
     try:
-        with open(args.feed_file, "r") as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
+        data = load(args.feed_file)
+    except ValueError as e:
         print(f"Error: Invalid JSON - {e}")
         return 1
 
@@ -204,20 +282,42 @@ def cmd_validate(args):
 
 
 def cmd_list_videos(args):
-    """List videos from Vimeo."""
-    print("Fetching videos from Vimeo...")
+    """List videos from Vimeo, or from the local catalog when there is one."""
+    catalog_path = Path(SyncConfig.from_env().cache_path) / CATALOG_FILENAME
+    use_catalog = not args.live and (args.refresh or catalog_path.exists())
+    filters = {
+        "include_tags": args.tag,
+        "min_duration": args.min_duration,
+        "max_duration": args.max_duration,
+    }
 
-    # Get access token
     access_token = args.access_token or os.getenv("VIMEO_ACCESS_TOKEN")
-    if not access_token:
+    if not access_token and (args.refresh or not use_catalog):
         print("Error: Vimeo access token is required")
         print("Set VIMEO_ACCESS_TOKEN environment variable or use --access-token")
         return 1
 
-    client = VimeoClient(access_token=access_token)
-
     try:
-        videos = client.get_all_videos(limit=args.limit)
+        if use_catalog:
+            client = create_vimeo_client(access_token) if access_token else None
+            catalog = CatalogStore(str(catalog_path), policy=client.media_policy if client else DEFAULT_MEDIA_POLICY)
+            if args.refresh:
+                print("Refreshing the local catalog...")
+                catalog.refresh(client)
+            print(f"Listing videos from the local catalog ({catalog_path})...")
+            videos = catalog.query(limit=args.limit, **filters)
+            catalog.close()
+        else:
+            print("Fetching videos from Vimeo...")
+            client = create_vimeo_client(access_token)
+            if any(filters.values()):
+                # Stop paging once enough videos have matched
+                videos = list(islice(
+                    (video for video in client.iter_all_videos() if matches_list_filters(video, **filters)),
+                    args.limit or None
+                ))
+            else:
+                videos = client.get_all_videos(limit=args.limit)
     except Exception as e:
         print(f"Error fetching videos: {e}")
         return 1
@@ -238,6 +338,22 @@ def cmd_list_videos(args):
     return 0
 
 
+def matches_list_filters(
+    video,
+    include_tags: List[str] = None,
+    min_duration: int = None,
+    max_duration: int = None
+) -> bool:
+    """Apply the list command's filters to a video fetched live."""
+    if include_tags and not {t.lower() for t in include_tags} & {t.lower() for t in video.tags}:
+        return False
+    if min_duration and video.duration < min_duration:
+        return False
+    if max_duration and video.duration > max_duration:
+        return False
+    return True
+
+
 def cmd_test_connection(args):
     """Test connections to Vimeo API."""
     print("Testing Vimeo API Connection")
@@ -249,7 +365,7 @@ def cmd_test_connection(args):
         return 1
 
     try:
-        client = VimeoClient(access_token=access_token)
+        client = create_vimeo_client(access_token)
         user = client.get_user()
 
         print(f"✓ Connected to Vimeo API")
@@ -416,6 +532,16 @@ def main():
         action="store_true",
         help="Suppress progress output"
     )
+    sync_parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="Write a Chrome trace of the sync's stages and requests to FILE"
+    )
+    sync_parser.add_argument(
+        "--profile",
+        metavar="FILE",
+        help="Run the sync under cProfile, saving the stats to FILE"
+    )
     sync_parser.set_defaults(func=cmd_sync)
 
     # Validate command
@@ -427,7 +553,10 @@ def main():
     validate_parser.set_defaults(func=cmd_validate)
 
     # List command
-    list_parser = subparsers.add_parser("list", help="List videos from Vimeo")
+    list_parser = subparsers.add_parser(
+        "list",
+        help="List videos from Vimeo (or the local catalog in SYNC_CACHE_PATH, if there is one)"
+    )
     list_parser.add_argument(
         "-t", "--access-token",
         help="Vimeo API access token"
@@ -438,6 +567,31 @@ def main():
         default=20,
         help="Maximum number of videos to list (default: 20)"
     )
+    list_parser.add_argument(
+        "--tag",
+        action="append",
+        help="Only videos with this tag (repeat for any of several)"
+    )
+    list_parser.add_argument(
+        "--min-duration",
+        type=int,
+        help="Only videos at least this many seconds long"
+    )
+    list_parser.add_argument(
+        "--max-duration",
+        type=int,
+        help="Only videos at most this many seconds long"
+    )
+    list_parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Bring the local catalog up to date first (creates it if missing)"
+    )
+    list_parser.add_argument(
+        "--live",
+        action="store_true",
+        help="Fetch from Vimeo even if a local catalog exists"
+    )
     list_parser.set_defaults(func=cmd_list_videos)
 
     # Test command
@@ -0,0 +1,224 @@
+"""
+Pre-compressed feed artifacts.
+
+Compressed copies of a feed (``roku_feed.json.gz``, ``roku_feed.json.br``)
+are produced while the feed is serialized, so the JSON is never read back
+or held in memory to compress it.
+"""
+
+import gzip
+import logging
+from contextlib import contextmanager
+from typing import IO, Dict, Iterable, Iterator, List
+
+from .atomic_file import AtomicFile, Discard, PathLike
+from .exceptions import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+# Content-Encoding -> file suffix of the artifact
+ENCODINGS = {
+    "gzip": ".gz",
+    "br": ".br",
+}
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9  # 10-11 compress a few percent better at several times the cost
+
+
+def artifact_path(path: PathLike, encoding: str) -> str:
+    """Path of a feed's compressed artifact."""
+    return f"{path}{ENCODINGS[encoding]}"
+
+
+def _brotli_available() -> bool:
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def resolve_encodings(encodings: Iterable[str]) -> List[str]:
+    """
+    Check requested encodings, dropping Brotli if it is not installed.
+
+    Args:
+        encodings: Content-Encoding names ('gzip', 'br')
+
+    Returns:
+        The encodings that can be produced, in the order given
+
+    Raises:
+        ConfigurationError: For an unknown encoding
+    """
+    resolved = []
+    for encoding in encodings:
+        if encoding not in ENCODINGS:
+            raise ConfigurationError(
+                f"Unknown feed compression '{encoding}', expected one of: {', '.join(ENCODINGS)}"
+            )
+        if encoding == "br" and not _brotli_available():
+            logger.warning("brotli is not installed, skipping .br feed. Install with: pip install brotli")
+            continue
+        if encoding not in resolved:
+            resolved.append(encoding)
+    return resolved
+
+
+class _GzipEncoder:
+    def __init__(self, raw: IO[bytes]):
+        # Leave the (temporary) file name and time out of the header, so
+        # identical feeds give identical artifacts
+        self._gzip = gzip.GzipFile(
+            filename="",
+            fileobj=raw,
+            mode="wb",
+            compresslevel=GZIP_LEVEL,
+            mtime=0
+        )
+
+    def write(self, data: bytes):
+        self._gzip.write(data)
+
+    def finish(self):
+        self._gzip.close()
+
+
+class _BrotliEncoder:
+    def __init__(self, raw: IO[bytes]):
+        import brotli
+
+        self._raw = raw
+        self._compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=BROTLI_QUALITY)
+
+    def write(self, data: bytes):
+        self._raw.write(self._compressor.process(data))
+
+    def finish(self):
+        self._raw.write(self._compressor.finish())
+
+
+_ENCODERS = {
+    "gzip": _GzipEncoder,
+    "br": _BrotliEncoder,
+}
+
+
+class FeedOutput:
+    """
+    Text stream that writes a feed and its compressed artifacts together.
+
+    Every file is written atomically and they are committed or discarded
+    as a set, so the artifacts always match the JSON next to them.
+    """
+
+    BLOCK_SIZE = 64 * 1024  # Characters buffered before compressing
+
+    def __init__(self, path: PathLike, encodings: Iterable[str] = (), keep: int = 0):
+        """
+        Open the output files.
+
+        Args:
+            path: Feed JSON path
+            encodings: Artifacts to produce alongside it ('gzip', 'br')
+            keep: Previous generations to keep of each file
+        """
+        self._files: List[AtomicFile] = []
+        self._encoders = []
+        self._pending: List[str] = []
+        self._pending_size = 0
+        self.artifacts: Dict[str, str] = {}
+
+        try:
+            self._json = self._open(path, keep)
+            for encoding in encodings:
+                target = self._open(artifact_path(path, encoding), keep)
+                self._encoders.append(_ENCODERS[encoding](target.file))
+                self.artifacts[encoding] = str(target.path)
+        except BaseException:
+            self.discard()
+            raise
+
+    def _open(self, path: PathLike, keep: int) -> AtomicFile:
+        target = AtomicFile(path, "wb", keep=keep)
+        self._files.append(target)
+        return target
+
+    def write(self, text: str):
+        if not self._encoders:
+            self._json.file.write(text.encode("utf-8"))
+            return
+
+        # The feed arrives in many small pieces; compressors are much faster
+        # fed in larger blocks
+        self._pending.append(text)
+        self._pending_size += len(text)
+        if self._pending_size >= self.BLOCK_SIZE:
+            self._flush()
+
+    def _flush(self):
+        data = "".join(self._pending).encode("utf-8")
+        self._pending = []
+        self._pending_size = 0
+
+        self._json.file.write(data)
+        for encoder in self._encoders:
+            encoder.write(data)
+
+    def commit(self):
+        """Finish the artifacts and move every file into place."""
+        try:
+            self._flush()
+            for encoder in self._encoders:
+                encoder.finish()
+        except BaseException:
+            self.discard()
+            raise
+
+        # The JSON goes last, so it is never newer than its artifacts
+        ordered = self._files[1:] + self._files[:1]
+        for index, target in enumerate(ordered):
+            try:
+                target.commit()
+            except BaseException:
+                for pending in ordered[index + 1:]:
+                    pending.discard()
+                raise
+
+    def discard(self):
+        """Remove the temporary files, leaving any previous feed in place."""
+        for target in self._files:
+            target.discard()
+
+
+@contextmanager
+def open_feed_output(
+    path: PathLike,
+    encodings: Iterable[str] = (),
+    keep: int = 0
+) -> Iterator[FeedOutput]:
+    """
+    Write a feed and its compressed artifacts atomically.
+
+    Raising Discard in the block drops every file quietly, as with
+    atomic_write().
+
+    Args:
+        path: Feed JSON path
+        encodings: Artifacts to produce alongside it ('gzip', 'br')
+        keep: Previous generations to keep of each file
+
+    Yields:
+        FeedOutput to write the feed text to
+    """
+    output = FeedOutput(path, encodings, keep)
+    try:
+        yield output
+    except Discard:
+        output.discard()
+        return
+    except BaseException:
+        output.discard()
+        raise
+    output.commit()
@@ -3,6 +3,7 @@ Configuration handling for the Vimeo to Roku SDK.
 """
 
 import os
+import re
 import yaml
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, List
@@ -10,6 +11,9 @@ from pathlib import Path
 
 from .exceptions import ConfigurationError
 
+# Channel names become directory names under <cache_path>/channels
+CHANNEL_NAME_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_-]*$")
+
 
 @dataclass
 class VimeoConfig:
@@ -20,6 +24,13 @@ class VimeoConfig:
     user_id: Optional[str] = None  # If not set, uses authenticated user
     folder_id: Optional[str] = None  # Specific folder to sync
     album_id: Optional[str] = None  # Specific album/showcase to sync
+    max_workers: int = 4  # Concurrent page fetches when paginating (1 = sequential)
+    fields_profile: str = "feed"  # Field projection requested from Vimeo (feed, stats, full)
+    extra_fields: List[str] = field(default_factory=list)  # Additional field paths to request
+    lean_models: bool = False  # Keep only the thumbnail and video file the feed uses
+    thumbnail_min_width: int = 800  # Feed uses the smallest thumbnail at least this wide
+    preferred_video_type: str = "HLS"  # Feed uses a file of this type (HLS, MP4, DASH) if any
+    api_base_url: str = "https://api.vimeo.com"  # Override to point at a proxy or mock server
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "VimeoConfig":
@@ -29,19 +40,35 @@ class VimeoConfig:
             access_token=data.get("access_token", ""),
             user_id=data.get("user_id"),
             folder_id=data.get("folder_id"),
-            album_id=data.get("album_id")
+            album_id=data.get("album_id"),
+            max_workers=data.get("max_workers", 4),
+            fields_profile=data.get("fields_profile", "feed"),
+            extra_fields=data.get("extra_fields", []),
+            lean_models=data.get("lean_models", False),
+            thumbnail_min_width=data.get("thumbnail_min_width", 800),
+            preferred_video_type=data.get("preferred_video_type", "HLS"),
+            api_base_url=data.get("api_base_url", "https://api.vimeo.com")
         )
 
     @classmethod
     def from_env(cls) -> "VimeoConfig":
         """Load configuration from environment variables."""
+        extra_fields = os.getenv("VIMEO_EXTRA_FIELDS", "")
+
         return cls(
             client_id=os.getenv("VIMEO_CLIENT_ID", ""),
             client_secret=os.getenv("VIMEO_CLIENT_SECRET", ""),
             access_token=os.getenv("VIMEO_ACCESS_TOKEN", ""),
             user_id=os.getenv("VIMEO_USER_ID"),
             folder_id=os.getenv("VIMEO_FOLDER_ID"),
-            album_id=os.getenv("VIMEO_ALBUM_ID")
+            album_id=os.getenv("VIMEO_ALBUM_ID"),
+            max_workers=int(os.getenv("VIMEO_MAX_WORKERS", "4")),
+            fields_profile=os.getenv("VIMEO_FIELDS_PROFILE", "feed"),
+            extra_fields=[f.strip() for f in extra_fields.split(",") if f.strip()],
+            lean_models=os.getenv("VIMEO_LEAN_MODELS", "false").lower() == "true",
+            thumbnail_min_width=int(os.getenv("VIMEO_THUMBNAIL_MIN_WIDTH", "800")),
+            preferred_video_type=os.getenv("VIMEO_PREFERRED_VIDEO_TYPE", "HLS"),
+            api_base_url=os.getenv("VIMEO_API_BASE_URL", "https://api.vimeo.com")
         )
 
 
@@ -52,6 +79,8 @@ class RokuConfig:
     channel_id: Optional[str] = None
     language: str = "en"
     feed_output_path: str = "./roku_feed.json"
+    feed_generations: int = 0  # Previous feeds kept as <feed_output_path>.1 .. .N
+    feed_compression: List[str] = field(default_factory=list)  # Artifacts to write: 'gzip', 'br'
     default_genre: str = "Entertainment"
     rating_system: str = "USA_TV"
     default_rating: str = "TV-G"
@@ -60,6 +89,10 @@ class RokuConfig:
     s3_bucket: Optional[str] = None
     s3_key: Optional[str] = None
     webhook_url: Optional[str] = None  # Webhook to notify when feed is updated
+    s3_cache_control: Optional[str] = "max-age=300"  # Cache-Control for uploaded feeds
+    s3_multipart_threshold_mb: int = 8  # Files this large are uploaded in parts
+    s3_multipart_chunk_mb: int = 8
+    s3_max_concurrency: int = 10  # Parts uploaded at once per file
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "RokuConfig":
@@ -68,28 +101,42 @@ class RokuConfig:
             channel_id=data.get("channel_id"),
             language=data.get("language", "en"),
             feed_output_path=data.get("feed_output_path", "./roku_feed.json"),
+            feed_generations=int(data.get("feed_generations", 0)),
+            feed_compression=data.get("feed_compression", []),
             default_genre=data.get("default_genre", "Entertainment"),
             rating_system=data.get("rating_system", "USA_TV"),
             default_rating=data.get("default_rating", "TV-G"),
             s3_bucket=data.get("s3_bucket"),
             s3_key=data.get("s3_key"),
-            webhook_url=data.get("webhook_url")
+            webhook_url=data.get("webhook_url"),
+            s3_cache_control=data.get("s3_cache_control", "max-age=300"),
+            s3_multipart_threshold_mb=data.get("s3_multipart_threshold_mb", 8),
+            s3_multipart_chunk_mb=data.get("s3_multipart_chunk_mb", 8),
+            s3_max_concurrency=data.get("s3_max_concurrency", 10)
         )
 
     @classmethod
     def from_env(cls) -> "RokuConfig":
         """Load configuration from environment variables."""
+        feed_compression = os.getenv("ROKU_FEED_COMPRESSION", "")
+
         return cls(
             provider_name=os.getenv("ROKU_PROVIDER_NAME", ""),
             channel_id=os.getenv("ROKU_CHANNEL_ID"),
             language=os.getenv("ROKU_LANGUAGE", "en"),
             feed_output_path=os.getenv("ROKU_FEED_OUTPUT_PATH", "./roku_feed.json"),
+            feed_generations=int(os.getenv("ROKU_FEED_GENERATIONS", "0")),
+            feed_compression=[c.strip() for c in feed_compression.split(",") if c.strip()],
             default_genre=os.getenv("ROKU_DEFAULT_GENRE", "Entertainment"),
             rating_system=os.getenv("ROKU_RATING_SYSTEM", "USA_TV"),
             default_rating=os.getenv("ROKU_DEFAULT_RATING", "TV-G"),
             s3_bucket=os.getenv("ROKU_S3_BUCKET"),
             s3_key=os.getenv("ROKU_S3_KEY"),
-            webhook_url=os.getenv("ROKU_WEBHOOK_URL")
+            webhook_url=os.getenv("ROKU_WEBHOOK_URL"),
+            s3_cache_control=os.getenv("ROKU_S3_CACHE_CONTROL", "max-age=300"),
+            s3_multipart_threshold_mb=int(os.getenv("ROKU_S3_MULTIPART_THRESHOLD_MB", "8")),
+            s3_multipart_chunk_mb=int(os.getenv("ROKU_S3_MULTIPART_CHUNK_MB", "8")),
+            s3_max_concurrency=int(os.getenv("ROKU_S3_MAX_CONCURRENCY", "10"))
         )
 
 
@@ -109,11 +156,29 @@ class SyncConfig:
     # Caching
     cache_enabled: bool = True
     cache_path: str = "./.vimeo_roku_cache"
+    http_cache_max_mb: int = 64  # Size bound for cached Vimeo responses (ETag revalidation)
+    state_backend: str = "sqlite"  # Sync state storage: 'sqlite' or 'json'
+    catalog_enabled: bool = False  # Mirror the library in <cache_path>/catalog.db and sync from it
+
+    # Incremental syncs
+    detect_deletions: bool = True  # List current video IDs to drop deleted videos from the feed
+
+    # Convert and write videos page by page instead of holding the catalog in memory
+    streaming: bool = False
+
+    # Leave the feed, S3 object and webhook alone when the content is unchanged
+    skip_unchanged: bool = True
 
     # Logging
     log_level: str = "INFO"
     log_file: Optional[str] = None
 
+    # Chrome trace-event JSON of each sync's spans (chrome://tracing, Perfetto)
+    trace_path: Optional[str] = None
+
+    # Channel feeds built at once by multi-channel syncs
+    channel_workers: int = 4
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SyncConfig":
         return cls(
@@ -125,8 +190,16 @@ class SyncConfig:
             short_form_max_duration=data.get("short_form_max_duration", 900),
             cache_enabled=data.get("cache_enabled", True),
             cache_path=data.get("cache_path", "./.vimeo_roku_cache"),
+            http_cache_max_mb=data.get("http_cache_max_mb", 64),
+            state_backend=data.get("state_backend", "sqlite"),
+            catalog_enabled=data.get("catalog_enabled", False),
+            detect_deletions=data.get("detect_deletions", True),
+            streaming=data.get("streaming", False),
+            skip_unchanged=data.get("skip_unchanged", True),
             log_level=data.get("log_level", "INFO"),
-            log_file=data.get("log_file")
+            log_file=data.get("log_file"),
+            trace_path=data.get("trace_path"),
+            channel_workers=int(data.get("channel_workers", 4))
         )
 
     @classmethod
@@ -144,8 +217,69 @@ class SyncConfig:
             short_form_max_duration=int(os.getenv("SYNC_SHORT_FORM_MAX_DURATION", "900")),
             cache_enabled=os.getenv("SYNC_CACHE_ENABLED", "true").lower() == "true",
             cache_path=os.getenv("SYNC_CACHE_PATH", "./.vimeo_roku_cache"),
+            http_cache_max_mb=int(os.getenv("SYNC_HTTP_CACHE_MAX_MB", "64")),
+            state_backend=os.getenv("SYNC_STATE_BACKEND", "sqlite"),
+            catalog_enabled=os.getenv("SYNC_CATALOG_ENABLED", "false").lower() == "true",
+            detect_deletions=os.getenv("SYNC_DETECT_DELETIONS", "true").lower() == "true",
+            streaming=os.getenv("SYNC_STREAMING", "false").lower() == "true",
+            skip_unchanged=os.getenv("SYNC_SKIP_UNCHANGED", "true").lower() == "true",
             log_level=os.getenv("SYNC_LOG_LEVEL", "INFO"),
-            log_file=os.getenv("SYNC_LOG_FILE")
+            log_file=os.getenv("SYNC_LOG_FILE"),
+            trace_path=os.getenv("SYNC_TRACE_PATH"),
+            channel_workers=int(os.getenv("SYNC_CHANNEL_WORKERS", "4"))
+        )
+
+
+@dataclass
+class ChannelConfig:
+    """A Roku channel built from the shared Vimeo catalog in multi-channel syncs."""
+    name: str
+    roku: RokuConfig = field(default_factory=RokuConfig)
+    sync: SyncConfig = field(default_factory=SyncConfig)
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        roku_defaults: Dict[str, Any] = None,
+        sync_defaults: Dict[str, Any] = None
+    ) -> "ChannelConfig":
+        """
+        Build a channel from its entry under ``channels``.
+
+        The channel's ``roku`` and ``sync`` sections override the top-level
+        ones. Each channel keeps its sync state under
+        ``<cache_path>/channels/<name>`` unless it sets its own cache_path,
+        and only writes a trace if it sets its own trace_path.
+
+        Args:
+            data: The channel's entry
+            roku_defaults: Top-level ``roku`` section
+            sync_defaults: Top-level ``sync`` section
+
+        Returns:
+            ChannelConfig
+
+        Raises:
+            ConfigurationError: If the channel has no name
+        """
+        name = str(data.get("name") or "").strip()
+        if not name:
+            raise ConfigurationError("Every channel needs a name")
+
+        roku_data = {**(roku_defaults or {}), **(data.get("roku") or {})}
+        channel_sync = data.get("sync") or {}
+        sync_data = {**(sync_defaults or {}), **channel_sync}
+        if "cache_path" not in channel_sync:
+            base = (sync_defaults or {}).get("cache_path", SyncConfig.cache_path)
+            sync_data["cache_path"] = str(Path(base) / "channels" / name)
+        if "trace_path" not in channel_sync:
+            sync_data.pop("trace_path", None)
+
+        return cls(
+            name=name,
+            roku=RokuConfig.from_dict(roku_data),
+            sync=SyncConfig.from_dict(sync_data)
         )
 
 
@@ -155,6 +289,7 @@ class Config:
     vimeo: VimeoConfig = field(default_factory=VimeoConfig)
     roku: RokuConfig = field(default_factory=RokuConfig)
     sync: SyncConfig = field(default_factory=SyncConfig)
+    channels: List[ChannelConfig] = field(default_factory=list)  # Multi-channel syncs
 
     @classmethod
     def from_yaml(cls, filepath: str) -> "Config":
@@ -169,10 +304,16 @@ class Config:
         except yaml.YAMLError as e:
             raise ConfigurationError(f"Invalid YAML in configuration file: {e}")
 
+        roku_data = data.get("roku", {})
+        sync_data = data.get("sync", {})
         return cls(
             vimeo=VimeoConfig.from_dict(data.get("vimeo", {})),
-            roku=RokuConfig.from_dict(data.get("roku", {})),
-            sync=SyncConfig.from_dict(data.get("sync", {}))
+            roku=RokuConfig.from_dict(roku_data),
+            sync=SyncConfig.from_dict(sync_data),
+            channels=[
+                ChannelConfig.from_dict(channel, roku_data, sync_data)
+                for channel in data.get("channels") or []
+            ]
         )
 
     @classmethod
@@ -207,8 +348,36 @@ class Config:
         if not self.vimeo.access_token:
             errors.append("Vimeo access token is required")
 
-        if not self.roku.provider_name:
-            errors.append("Roku provider name is required")
+        if not self.channels:
+            if not self.roku.provider_name:
+                errors.append("Roku provider name is required")
+            return errors
+
+        names = set()
+        feed_paths = set()
+        cache_paths = set()
+        for channel in self.channels:
+            if not CHANNEL_NAME_PATTERN.match(channel.name):
+                errors.append(
+                    f"Channel name '{channel.name}' must contain only letters, digits, '-' and '_'"
+                )
+            if channel.name in names:
+                errors.append(f"Channel '{channel.name}' is defined more than once")
+            names.add(channel.name)
+
+            if not channel.roku.provider_name:
+                errors.append(f"Roku provider name is required for channel '{channel.name}'")
+
+            feed_path = os.path.abspath(channel.roku.feed_output_path)
+            if feed_path in feed_paths:
+                errors.append(f"Channel '{channel.name}' writes to the same feed_output_path as another channel")
+            feed_paths.add(feed_path)
+
+            if channel.sync.cache_enabled:
+                cache_path = os.path.abspath(channel.sync.cache_path)
+                if cache_path in cache_paths:
+                    errors.append(f"Channel '{channel.name}' shares its cache_path with another channel")
+                cache_paths.add(cache_path)
 
         return errors
 
@@ -0,0 +1,255 @@
+"""
+Streaming serializer for Roku Direct Publisher feeds.
+"""
+
+import hashlib
+import json
+import tempfile
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from . import json_codec
+from .exceptions import RokuFeedError
+from .timestamps import format_timestamp
+
+# Indentation of saved feeds; cached video fragments are stored at this indent
+FEED_INDENT = 2
+
+# Top-level keys in the order they appear in a feed
+FEED_KEYS = (
+    "providerName",
+    "language",
+    "lastUpdated",
+    "shortFormVideos",
+    "movies",
+    "series",
+    "tvSpecials",
+    "playlists",
+    "categories",
+)
+
+# Characters read at a time when copying spooled sections
+SPOOL_CHUNK_SIZE = 64 * 1024
+
+
+def indent_json(text: str, depth: int) -> str:
+    """
+    Shift indented JSON text to a nesting depth within a larger document.
+
+    Only continuation lines are shifted; the first line follows a key or
+    list separator written by the caller.
+    """
+    return text.replace("\n", "\n" + " " * (FEED_INDENT * depth))
+
+
+def serialize_item(item: Dict[str, Any]) -> str:
+    """Serialize a section item as it appears inside a saved feed."""
+    return indent_json(json_codec.dumps_indented(item), 2)
+
+
+def _item_prefix(index: int) -> str:
+    """Separator and indent written before the item at a position in a section."""
+    return ("\n" if index == 0 else ",\n") + " " * (2 * FEED_INDENT)
+
+
+def _section_end(count: int) -> str:
+    return "\n" + " " * FEED_INDENT + "]" if count else "]"
+
+
+class SectionSpool:
+    """
+    Serialized section items spooled to temporary files.
+
+    Lets a producer emit videos in any order (as they come off the API)
+    while the feed is still written section by section, without keeping
+    the items in memory.
+    """
+
+    def __init__(self):
+        self._files: Dict[str, TextIO] = {}
+        self.counts: Dict[str, int] = {}
+
+    def __enter__(self) -> "SectionSpool":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add(self, key: str, fragment: str):
+        """
+        Append a serialized item to a section.
+
+        Args:
+            key: Feed section key (e.g. 'shortFormVideos')
+            fragment: Item serialized as by serialize_item()
+        """
+        spool = self._files.get(key)
+        if spool is None:
+            if key not in FEED_KEYS:
+                raise RokuFeedError(f"Unknown feed key '{key}'")
+            spool = self._files[key] = tempfile.TemporaryFile("w+", encoding="utf-8")
+            self.counts[key] = 0
+
+        spool.write(_item_prefix(self.counts[key]))
+        spool.write(fragment)
+        self.counts[key] += 1
+
+    @property
+    def sections(self) -> List[str]:
+        """Keys of the spooled sections, in feed order."""
+        return [key for key in FEED_KEYS if key in self._files]
+
+    def iter_chunks(self, key: str) -> Iterator[str]:
+        """Read back a section's spooled items in chunks."""
+        spool = self._files[key]
+        spool.flush()
+        spool.seek(0)
+        while True:
+            chunk = spool.read(SPOOL_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+    def close(self):
+        """Delete the temporary files."""
+        for spool in self._files.values():
+            spool.close()
+        self._files.clear()
+
+
+class FeedWriter:
+    """
+    Writes a feed to a text stream one key and one item at a time.
+
+    The output is identical to ``json.dumps(feed, indent=2,
+    ensure_ascii=False)`` of the equivalent dictionary (see
+    json_codec.dumps_indented()), but nothing larger than a single item is
+    held in memory. Keys must be written in feed
+    order and each key at most once.
+
+    While writing, a SHA-256 digest is kept of everything except the
+    ``lastUpdated`` value, so two feeds with the same content have the same
+    ``digest`` whenever they were generated.
+
+    Example:
+        writer = FeedWriter(f)
+        writer.write_header("My Channel", "en", datetime.now(timezone.utc))
+        writer.begin_section("shortFormVideos")
+        for video in videos:
+            writer.write_video(video)
+        writer.end_section()
+        writer.close()
+    """
+
+    def __init__(self, stream: TextIO):
+        """
+        Initialize the writer.
+
+        Args:
+            stream: Text stream opened for writing (UTF-8 for files)
+        """
+        self.stream = stream
+        self._digest = hashlib.sha256()
+        self._position = -1  # Index into FEED_KEYS of the last key written
+        self._section: Optional[str] = None
+        self._section_items = 0
+        self._closed = False
+
+    @property
+    def digest(self) -> str:
+        """Hex digest of the content written so far, excluding lastUpdated."""
+        return self._digest.hexdigest()
+
+    def write_header(self, provider_name: str, language: str, last_updated: datetime):
+        """Write the providerName, language and lastUpdated fields."""
+        self.write_value("providerName", provider_name)
+        self.write_value("language", language)
+        self.write_value("lastUpdated", format_timestamp(last_updated))
+
+    def write_value(self, key: str, value: Any):
+        """Write a top-level key with a JSON value."""
+        self._start_key(key)
+        text = indent_json(json_codec.dumps_indented(value), 1)
+        if key == "lastUpdated":
+            self.stream.write(text)  # Left out of the digest
+        else:
+            self._write(text)
+
+    def begin_section(self, key: str):
+        """Open a top-level list that items are then written to one by one."""
+        self._start_key(key)
+        self._write("[")
+        self._section = key
+        self._section_items = 0
+
+    def write_item(self, item: Dict[str, Any]):
+        """Write a dictionary as the next item of the open section."""
+        self.write_fragment(serialize_item(item))
+
+    def write_video(self, video):
+        """
+        Write a RokuVideo as the next item of the open section.
+
+        A cached fragment is used as-is; otherwise the video is serialized
+        without caching the result on it.
+        """
+        self.write_fragment(video.json_fragment or serialize_item(video.to_dict()))
+
+    def write_fragment(self, fragment: str):
+        """Write an already serialized item to the open section."""
+        if self._section is None:
+            raise RokuFeedError("No feed section is open")
+        self._write(_item_prefix(self._section_items))
+        self._write(fragment)
+        self._section_items += 1
+
+    def end_section(self):
+        """Close the open section."""
+        if self._section is None:
+            raise RokuFeedError("No feed section is open")
+        self._write(_section_end(self._section_items))
+        self._section = None
+
+    def write_section(self, key: str, videos: Iterable):
+        """Write a whole section of RokuVideos."""
+        self.begin_section(key)
+        for video in videos:
+            self.write_video(video)
+        self.end_section()
+
+    def write_spooled_section(self, key: str, spool: SectionSpool):
+        """Write a section whose items were collected in a SectionSpool."""
+        self._start_key(key)
+        self._write("[")
+        for chunk in spool.iter_chunks(key):
+            self._write(chunk)
+        self._write(_section_end(spool.counts[key]))
+
+    def close(self):
+        """Finish the document. The stream itself is left open."""
+        if self._closed:
+            return
+        if self._section is not None:
+            self.end_section()
+        self._write("\n}" if self._position >= 0 else "{}")
+        self._closed = True
+
+    def _start_key(self, key: str):
+        if self._closed:
+            raise RokuFeedError("Feed has already been closed")
+        if self._section is not None:
+            raise RokuFeedError(f"Section '{self._section}' is still open")
+        if key not in FEED_KEYS:
+            raise RokuFeedError(f"Unknown feed key '{key}'")
+
+        position = FEED_KEYS.index(key)
+        if position <= self._position:
+            raise RokuFeedError(f"Feed key '{key}' written out of order")
+
+        self._write("{\n" if self._position < 0 else ",\n")
+        self._write(" " * FEED_INDENT + json.dumps(key, ensure_ascii=False) + ": ")
+        self._position = position
+
+    def _write(self, text: str):
+        self._digest.update(text.encode("utf-8"))
+        self.stream.write(text)
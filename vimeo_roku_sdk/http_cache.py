@@ -0,0 +1,208 @@
+"""
+On-disk HTTP response cache for conditional Vimeo API requests.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Dict, Any, Mapping
+
+from . import json_codec
+from .atomic_file import atomic_write
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    """A cached response body with its validators."""
+    key: str
+    body: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers that turn a GET into a conditional request."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def json(self) -> Dict[str, Any]:
+        return json_codec.loads(self.body) if self.body else {}
+
+
+class ResponseCache:
+    """
+    Size-bounded on-disk cache of GET responses, keyed by endpoint and params.
+
+    Each entry stores the raw body alongside its ``ETag``/``Last-Modified``
+    validators. Callers send those back as ``If-None-Match``/
+    ``If-Modified-Since`` and serve the stored body on a 304, so unchanged
+    listing pages cost a near-empty round trip. When the cache grows beyond
+    ``max_bytes`` the least recently used entries are evicted.
+    """
+
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache entries (created if missing)
+            max_bytes: Upper bound on the total size of cached bodies
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._sizes: Dict[str, int] = {}
+        for body_path in self.cache_dir.glob("*.body"):
+            self._sizes[body_path.stem] = body_path.stat().st_size
+
+    @staticmethod
+    def make_key(endpoint: str, params: Mapping[str, Any] = None) -> str:
+        """Build a stable cache key from an endpoint and its query parameters."""
+        canonical = json.dumps(
+            [endpoint, sorted((params or {}).items())],
+            default=str,
+            separators=(",", ":")
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self._sizes.values())
+
+    def get(self, endpoint: str, params: Mapping[str, Any] = None) -> Optional[CachedResponse]:
+        """
+        Look up a cached response.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+
+        Returns:
+            The cached response, or None if there is no usable entry
+        """
+        key = self.make_key(endpoint, params)
+        if key not in self._sizes:
+            return None
+
+        try:
+            meta = json_codec.load(self._meta_path(key))
+            body = self._body_path(key).read_bytes()
+        except (OSError, ValueError) as e:
+            logger.debug(f"Discarding unreadable cache entry {key}: {e}")
+            self._remove(key)
+            return None
+
+        # Mark as recently used for eviction
+        try:
+            os.utime(self._body_path(key))
+        except OSError:
+            pass  # Evicted or removed by another process since the read
+
+        return CachedResponse(
+            key=key,
+            body=body,
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified")
+        )
+
+    def put(
+        self,
+        endpoint: str,
+        params: Mapping[str, Any],
+        headers: Mapping[str, str],
+        body: bytes
+    ) -> bool:
+        """
+        Store a response if it carries a validator.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            headers: Response headers
+            body: Raw response body
+
+        Returns:
+            True if the response was cached
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return False
+        if len(body) > self.max_bytes:
+            return False
+
+        key = self.make_key(endpoint, params)
+        meta = {"endpoint": endpoint, "etag": etag, "last_modified": last_modified}
+
+        try:
+            self._write(self._body_path(key), body)
+            self._write(self._meta_path(key), json_codec.dumps(meta))
+        except OSError as e:
+            logger.warning(f"Failed to write response cache entry: {e}")
+            return False
+
+        with self._lock:
+            self._sizes[key] = len(body)
+        self._evict()
+        return True
+
+    def clear(self):
+        """Remove every cache entry."""
+        for key in list(self._sizes):
+            self._remove(key)
+
+    def _evict(self):
+        """Drop least recently used entries until under the size bound."""
+        with self._lock:
+            total = self.total_bytes
+            if total <= self.max_bytes:
+                return
+
+            def last_used(key: str) -> float:
+                try:
+                    return self._body_path(key).stat().st_mtime
+                except OSError:
+                    return 0.0
+
+            for key in sorted(self._sizes, key=last_used):
+                if total <= self.max_bytes:
+                    break
+                total -= self._sizes[key]
+                self._remove(key, locked=True)
+
+    def _remove(self, key: str, locked: bool = False):
+        for path in (self._body_path(key), self._meta_path(key)):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        if locked:
+            self._sizes.pop(key, None)
+        else:
+            with self._lock:
+                self._sizes.pop(key, None)
+
+    def _write(self, path: Path, data: bytes):
+        """Write a file via a temporary sibling so readers never see partial data."""
+        # Entries can always be fetched again, so skip the cost of fsync
+        with atomic_write(path, "wb", fsync=False) as f:
+            f.write(data)
+
+    def _body_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.body"
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.meta"
@@ -0,0 +1,141 @@
+"""
+JSON encoding and decoding with an optional fast backend.
+
+Uses orjson or msgspec when one is installed and the standard library
+otherwise. Every function accepts and produces the same values whichever
+backend is active, so callers never need to know which one it is.
+
+The backend can be forced with the ``VIMEO_ROKU_JSON`` environment variable
+('orjson', 'msgspec' or 'json') or set_backend().
+"""
+
+import json
+import logging
+import os
+from typing import Any, Union
+
+from .exceptions import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("orjson", "msgspec", "json")
+
+# Indentation of pretty-printed output, matching saved feeds
+INDENT = 2
+
+_backend = "json"
+_orjson = None
+_msgspec_decoder = None
+_msgspec_encoder = None
+
+
+def _import_backend(name: str) -> bool:
+    global _orjson, _msgspec_decoder, _msgspec_encoder
+    try:
+        if name == "orjson":
+            import orjson
+            _orjson = orjson
+        elif name == "msgspec":
+            import msgspec
+            _msgspec_decoder = msgspec.json.Decoder()
+            _msgspec_encoder = msgspec.json.Encoder()
+    except ImportError:
+        return False
+    return True
+
+
+def set_backend(name: str = "auto") -> str:
+    """
+    Choose the JSON backend.
+
+    Args:
+        name: 'orjson', 'msgspec', 'json', or 'auto' for the fastest
+            installed one
+
+    Returns:
+        The backend in use
+
+    Raises:
+        ConfigurationError: For an unknown backend, or one that is not installed
+    """
+    global _backend
+
+    if name == "auto":
+        _backend = next(backend for backend in BACKENDS if _import_backend(backend))
+        return _backend
+
+    if name not in BACKENDS:
+        raise ConfigurationError(f"Unknown JSON backend '{name}', expected one of: {', '.join(BACKENDS)}")
+    if not _import_backend(name):
+        raise ConfigurationError(f"{name} is not installed. Install with: pip install {name}")
+    _backend = name
+    return _backend
+
+
+def get_backend() -> str:
+    """Name of the JSON backend in use."""
+    return _backend
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode a JSON document.
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if _backend == "orjson":
+        return _orjson.loads(data)  # orjson.JSONDecodeError is a ValueError
+    if _backend == "msgspec":
+        try:
+            return _msgspec_decoder.decode(data)
+        except Exception as e:  # msgspec.DecodeError
+            raise ValueError(str(e)) from e
+    return json.loads(data)
+
+
+def load(path: Union[str, os.PathLike]) -> Any:
+    """Decode a JSON file."""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def dumps(value: Any) -> bytes:
+    """Encode a value as compact UTF-8 JSON."""
+    try:
+        if _backend == "orjson":
+            return _orjson.dumps(value)
+        if _backend == "msgspec":
+            return _msgspec_encoder.encode(value)
+    except TypeError:
+        pass  # e.g. non-string keys or integers beyond 64 bits
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_indented(value: Any) -> str:
+    """
+    Encode a value as feed-style JSON text.
+
+    The result is that of ``json.dumps(value, indent=2, ensure_ascii=False)``,
+    except that orjson writes floats needing an exponent in its shorter form
+    (``1e16`` rather than ``1e+16``). msgspec has no equivalent layout, so
+    the standard library is used with it.
+    """
+    if _backend == "orjson":
+        try:
+            return _orjson.dumps(value, option=_orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(value, indent=INDENT, ensure_ascii=False)
+
+
+def _backend_from_env():
+    name = os.getenv("VIMEO_ROKU_JSON", "auto").strip().lower() or "auto"
+    try:
+        set_backend(name)
+    except ConfigurationError as e:
+        logger.warning(f"{e}; using the standard library json module")
+        set_backend("json")
+
+
+_backend_from_env()
@@ -0,0 +1,279 @@
+"""
+Prometheus metrics for long-running sync processes.
+
+SyncMetrics keeps the outcome of the most recent sync (its counts and the
+trace summary recorded on SyncResult, per channel for multi-channel syncs)
+and renders it in the Prometheus text exposition format; MetricsServer
+serves that over HTTP for scraping. No client library is needed.
+"""
+
+import logging
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .sync_manager import MultiChannelResult, SyncResult
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_]")
+
+
+def metric_name(*parts: str) -> str:
+    """Join name parts into a valid metric name ('http.bytes' -> 'http_bytes')."""
+    return _INVALID_NAME_CHARS.sub("_", "_".join(parts))
+
+
+def _format_value(value: Optional[float]) -> str:
+    if value is None:
+        return "NaN"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+class SyncMetrics:
+    """
+    Metrics of the last sync, plus run totals since the process started.
+
+    Example:
+        metrics = SyncMetrics()
+        metrics.record(manager.sync())
+        print(metrics.render())
+    """
+
+    def __init__(self, namespace: str = "vimeo_roku"):
+        """
+        Initialize the metrics.
+
+        Args:
+            namespace: Prefix of every metric name
+        """
+        self.namespace = namespace
+        self.runs = 0
+        self.failures = 0
+        self.last_result: Optional[Union[SyncResult, MultiChannelResult]] = None
+        self.last_run_time: Optional[float] = None
+        self.last_success_time: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def record(self, result: Union[SyncResult, MultiChannelResult]):
+        """Record the result of a sync run (single or multi-channel)."""
+        with self._lock:
+            self.runs += 1
+            self.last_result = result
+            self.last_run_time = time.time()
+            if result.success:
+                self.last_success_time = self.last_run_time
+            else:
+                self.failures += 1
+
+    def record_failure(self):
+        """Record a sync run that raised before producing a result."""
+        self.record(SyncResult(success=False))
+
+    def render(self) -> str:
+        """The metrics in the Prometheus text exposition format."""
+        with self._lock:
+            families = _Families(self.namespace)
+            families.add("sync_runs_total", "counter", "Sync runs since the process started", self.runs)
+            families.add("sync_failures_total", "counter", "Failed sync runs since the process started", self.failures)
+            families.add(
+                "last_sync_timestamp_seconds", "gauge",
+                "Unix time the last sync finished", self.last_run_time
+            )
+            families.add(
+                "last_successful_sync_timestamp_seconds", "gauge",
+                "Unix time the last successful sync finished", self.last_success_time
+            )
+
+            result = self.last_result
+            if isinstance(result, MultiChannelResult):
+                self._render_run(families, result)
+                families.add(
+                    "last_sync_videos_fetched", "gauge",
+                    "Videos fetched for all channels in the last sync", result.videos_fetched
+                )
+                self._render_trace(families, result.trace)
+                for name, channel_result in result.channels.items():
+                    self._render_sync_result(families, channel_result, {"channel": name})
+            elif result is not None:
+                self._render_sync_result(families, result)
+
+            return families.render()
+
+    @staticmethod
+    def _render_run(families: "_Families", result, labels: Dict[str, str] = None):
+        families.add("last_sync_success", "gauge", "Whether the last sync succeeded", result.success, labels)
+        families.add(
+            "last_sync_duration_seconds", "gauge",
+            "Wall-clock duration of the last sync", result.duration_seconds, labels
+        )
+        families.add("last_sync_errors", "gauge", "Errors reported by the last sync", len(result.errors), labels)
+
+    def _render_sync_result(self, families: "_Families", result: SyncResult, labels: Dict[str, str] = None):
+        labels = labels or {}
+        self._render_run(families, result, labels)
+        for outcome in ("processed", "added", "updated", "removed", "skipped", "failed"):
+            families.add(
+                "last_sync_videos", "gauge", "Videos by outcome in the last sync",
+                getattr(result, f"videos_{outcome}"), {**labels, "outcome": outcome}
+            )
+        for reason, count in sorted(result.skip_reasons.items()):
+            families.add(
+                "last_sync_skipped_videos", "gauge", "Videos filtered out of the last sync, by reason",
+                count, {**labels, "reason": reason}
+            )
+        families.add(
+            "last_sync_feed_changed", "gauge",
+            "Whether the last sync changed the feed content", result.feed_changed, labels
+        )
+        self._render_trace(families, result.trace, labels)
+
+    @staticmethod
+    def _render_trace(families: "_Families", trace: Dict[str, Any], labels: Dict[str, str] = None):
+        labels = labels or {}
+        trace = trace or {}
+        for name, totals in sorted(trace.get("stages", {}).items()):
+            families.add(
+                "last_sync_stage_seconds", "gauge",
+                "Seconds spent per stage in the last sync (upload, rate_limit_wait, ...)",
+                totals["seconds"], {**labels, "stage": name}
+            )
+            families.add(
+                "last_sync_stage_count", "gauge",
+                "Times each stage ran in the last sync (http = requests made)",
+                totals["count"], {**labels, "stage": name}
+            )
+
+        for name, value in sorted(trace.get("counters", {}).items()):
+            families.add(metric_name("last_sync", name), "gauge", f"{name} in the last sync", value, labels)
+
+        for name, value in sorted(trace.get("gauges", {}).items()):
+            families.add(metric_name(name), "gauge", f"{name} after the last sync", value, labels)
+
+        for name, histogram in sorted(trace.get("histograms", {}).items()):
+            families.add_histogram(metric_name("last_sync", name), f"{name} in the last sync", histogram, labels)
+
+
+class _Families:
+    """Metric families being rendered, each listed once with all its samples."""
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+        self._families: Dict[str, Tuple[str, str, List[str]]] = {}
+
+    def _samples(self, name: str, kind: str, help_text: str) -> Tuple[str, List[str]]:
+        full_name = f"{self.namespace}_{name}"
+        if full_name not in self._families:
+            self._families[full_name] = (kind, help_text, [])
+        return full_name, self._families[full_name][2]
+
+    def add(self, name: str, kind: str, help_text: str, value: Any, labels: Dict[str, str] = None):
+        """Add a sample to a family."""
+        full_name, samples = self._samples(name, kind, help_text)
+        samples.append(f"{full_name}{_labels(labels)} {_format_value(value)}")
+
+    def add_histogram(self, name: str, help_text: str, histogram: Dict[str, Any], labels: Dict[str, str] = None):
+        """Add a histogram from Histogram.to_dict(), whose buckets are not cumulative."""
+        labels = labels or {}
+        full_name, samples = self._samples(name, "histogram", help_text)
+        cumulative = 0
+        for bound, count in histogram["buckets"].items():
+            cumulative += count
+            samples.append(f"{full_name}_bucket{_labels({**labels, 'le': bound})} {cumulative}")
+        samples.append(f"{full_name}_sum{_labels(labels)} {_format_value(histogram['sum'])}")
+        samples.append(f"{full_name}_count{_labels(labels)} {histogram['count']}")
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for full_name, (kind, help_text, samples) in self._families.items():
+            lines.append(f"# HELP {full_name} {help_text}")
+            lines.append(f"# TYPE {full_name} {kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+def _labels(labels: Optional[Dict[str, str]]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape_label(str(value))}"' for key, value in labels.items())
+    return "{" + pairs + "}"
+
+
+class MetricsServer:
+    """
+    Serves SyncMetrics at /metrics from a background thread.
+
+    Example:
+        with MetricsServer(metrics, port=9464):
+            run_scheduler()
+    """
+
+    def __init__(self, metrics: SyncMetrics, host: str = "0.0.0.0", port: int = 9464):
+        """
+        Create the server (call start() or use it as a context manager).
+
+        Args:
+            metrics: Metrics to serve
+            host: Interface to listen on
+            port: Port to listen on (0 = any free port)
+        """
+        self.metrics = metrics
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def start(self) -> "MetricsServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Serving metrics at {self.url}")
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "MetricsServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _handler_class(self):
+        metrics = self.metrics
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                logger.debug(f"Metrics request: {format % args}")
+
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+
+                body = metrics.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
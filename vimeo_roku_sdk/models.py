@@ -2,11 +2,47 @@
 Data models for Vimeo and Roku video content.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Tuple, TextIO
 from enum import Enum
+import hashlib
+import io
 import json
+import logging
+import sys
+
+from . import json_codec
+from .atomic_file import Discard
+from .compression import open_feed_output
+from .feed_writer import FeedWriter, serialize_item
+from .timestamps import EPOCH, format_date, format_timestamp, parse_timestamp, utc_now
+
+logger = logging.getLogger(__name__)
+
+
+def slotted_dataclass(cls=None, **kwargs):
+    """
+    ``dataclass(slots=True)``, with an equivalent for Python 3.8 and 3.9.
+
+    Slotted instances have no per-instance ``__dict__``, which matters for
+    models created once per video in catalogs of tens of thousands.
+    """
+    def wrap(cls):
+        if sys.version_info >= (3, 10):
+            return dataclass(cls, slots=True, **kwargs)
+
+        cls = dataclass(cls, **kwargs)
+        names = tuple(f.name for f in fields(cls))
+        namespace = dict(cls.__dict__)
+        namespace["__slots__"] = names
+        # Class attributes holding field defaults would shadow the slots;
+        # the generated __init__ already carries the defaults
+        for name in names + ("__dict__", "__weakref__"):
+            namespace.pop(name, None)
+        return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+    return wrap if cls is None else wrap(cls)
 
 
 class VideoType(Enum):
@@ -26,7 +62,7 @@ class VideoQuality(Enum):
     UHD = "UHD"
 
 
-@dataclass
+@slotted_dataclass
 class VideoFile:
     """Represents a video file with quality and URL information."""
     url: str
@@ -44,8 +80,29 @@ class VideoFile:
             "videoType": self.video_type
         }
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "quality": self.quality.value,
+            "video_type": self.video_type,
+            "bitrate": self.bitrate,
+            "width": self.width,
+            "height": self.height
+        }
 
-@dataclass
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "VideoFile":
+        return cls(
+            url=data["url"],
+            quality=VideoQuality(data["quality"]),
+            video_type=data.get("video_type", "HLS"),
+            bitrate=data.get("bitrate"),
+            width=data.get("width"),
+            height=data.get("height")
+        )
+
+
+@slotted_dataclass
 class Thumbnail:
     """Represents a thumbnail image."""
     url: str
@@ -59,10 +116,97 @@ class Thumbnail:
             "height": self.height
         }
 
-
-@dataclass
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Thumbnail":
+        return cls(url=data["url"], width=data["width"], height=data["height"])
+
+
+# Rank of each quality when no file of the preferred type is available
+_QUALITY_RANK = {
+    VideoQuality.SD: 0,
+    VideoQuality.HD: 1,
+    VideoQuality.FHD: 2,
+    VideoQuality.UHD: 3,
+}
+
+
+@dataclass(frozen=True)
+class MediaPolicy:
+    """How a video's feed thumbnail and video file are chosen."""
+    min_thumbnail_width: int = 800  # Smallest thumbnail at least this wide, else the widest
+    preferred_video_type: str = "HLS"  # First file of this type, else the highest quality
+
+    def selector(self) -> "MediaSelector":
+        return MediaSelector(self)
+
+    def select(
+        self,
+        thumbnails: Iterable[Thumbnail],
+        video_files: Iterable[VideoFile]
+    ) -> Tuple[Optional[Thumbnail], Optional[VideoFile]]:
+        """Choose a thumbnail and video file in one pass over each list."""
+        selector = self.selector()
+        for thumbnail in thumbnails:
+            selector.add_thumbnail(thumbnail)
+        for video_file in video_files:
+            selector.add_video_file(video_file)
+        return selector.thumbnail, selector.video_file
+
+
+DEFAULT_MEDIA_POLICY = MediaPolicy()
+
+
+class MediaSelector:
+    """
+    Picks the best thumbnail and video file as candidates are seen.
+
+    Lets from_vimeo_response choose while it walks the API's picture sizes
+    and files, without another pass over them.
+    """
+
+    __slots__ = ("policy", "_fitting", "_widest", "_preferred", "_best_quality")
+
+    def __init__(self, policy: MediaPolicy = DEFAULT_MEDIA_POLICY):
+        self.policy = policy
+        self._fitting: Optional[Thumbnail] = None
+        self._widest: Optional[Thumbnail] = None
+        self._preferred: Optional[VideoFile] = None
+        self._best_quality: Optional[VideoFile] = None
+
+    def add_thumbnail(self, thumbnail: Thumbnail):
+        if thumbnail.width >= self.policy.min_thumbnail_width:
+            if self._fitting is None or thumbnail.width < self._fitting.width:
+                self._fitting = thumbnail
+        if self._widest is None or thumbnail.width > self._widest.width:
+            self._widest = thumbnail
+
+    def add_video_file(self, video_file: VideoFile):
+        if video_file.video_type == self.policy.preferred_video_type:
+            if self._preferred is None:
+                self._preferred = video_file
+        elif (
+            self._best_quality is None
+            or _QUALITY_RANK[video_file.quality] > _QUALITY_RANK[self._best_quality.quality]
+        ):
+            self._best_quality = video_file
+
+    @property
+    def thumbnail(self) -> Optional[Thumbnail]:
+        return self._fitting or self._widest
+
+    @property
+    def video_file(self) -> Optional[VideoFile]:
+        return self._preferred or self._best_quality
+
+
+@slotted_dataclass
 class Video:
-    """Represents a video from Vimeo."""
+    """
+    Represents a video from Vimeo.
+
+    Videos parsed in lean mode (see from_vimeo_response) keep only the
+    thumbnail and video file the feed uses.
+    """
     id: str
     title: str
     description: str
@@ -84,42 +228,86 @@ class Video:
     vimeo_uri: Optional[str] = None
     vimeo_embed_url: Optional[str] = None
 
+    # (thumbnail, video file) chosen while parsing, or by the default policy
+    # on first use; see get_best_thumbnail()/get_best_video_file(). Reset it
+    # to None after changing thumbnails or video_files.
+    selected_media: Optional[Tuple[Optional[Thumbnail], Optional[VideoFile]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Problems with the API's dates, e.g. "created_time is missing"; the
+    # affected dates fall back to another of the video's dates, or EPOCH
+    date_errors: Tuple[str, ...] = field(default=(), repr=False, compare=False)
+
     @classmethod
-    def from_vimeo_response(cls, data: Dict[str, Any]) -> "Video":
-        """Create a Video instance from Vimeo API response."""
+    def from_vimeo_response(
+        cls,
+        data: Dict[str, Any],
+        lean: bool = False,
+        policy: MediaPolicy = DEFAULT_MEDIA_POLICY
+    ) -> "Video":
+        """
+        Create a Video instance from Vimeo API response.
+
+        The feed thumbnail and video file are chosen by ``policy`` while the
+        picture sizes and files are parsed, and remembered on the video.
+        Missing or malformed dates are logged and listed in ``date_errors``.
+
+        Args:
+            data: Video object from the API
+            lean: Keep only the chosen thumbnail and video file and drop the
+                embed HTML, to save memory on large catalogs
+            policy: How to choose the thumbnail and video file
+        """
+        selector = policy.selector()
+
         # Parse thumbnails
         thumbnails = []
         if "pictures" in data and "sizes" in data["pictures"]:
             for pic in data["pictures"]["sizes"]:
-                thumbnails.append(Thumbnail(
+                thumbnail = Thumbnail(
                     url=pic.get("link", ""),
                     width=pic.get("width", 0),
                     height=pic.get("height", 0)
-                ))
+                )
+                selector.add_thumbnail(thumbnail)
+                if not lean:
+                    thumbnails.append(thumbnail)
 
         # Parse video files
         video_files = []
         if "files" in data and data["files"]:
             for file_data in data["files"]:
                 quality = cls._determine_quality(file_data.get("height", 0))
-                video_files.append(VideoFile(
+                video_file = VideoFile(
                     url=file_data.get("link", ""),
                     quality=quality,
                     video_type=file_data.get("type", "video/mp4").upper().replace("VIDEO/", ""),
                     width=file_data.get("width"),
                     height=file_data.get("height"),
                     bitrate=file_data.get("size")
-                ))
+                )
+                selector.add_video_file(video_file)
+                if not lean:
+                    video_files.append(video_file)
 
         # Parse HLS if available
         if "play" in data and data["play"]:
             play_data = data["play"]
             if "hls" in play_data and play_data["hls"]:
-                video_files.append(VideoFile(
+                video_file = VideoFile(
                     url=play_data["hls"].get("link", ""),
                     quality=VideoQuality.HD,
                     video_type="HLS"
-                ))
+                )
+                selector.add_video_file(video_file)
+                if not lean:
+                    video_files.append(video_file)
+
+        selected_media = (selector.thumbnail, selector.video_file)
+        if lean:
+            thumbnails = [selector.thumbnail] if selector.thumbnail else []
+            video_files = [selector.video_file] if selector.video_file else []
 
         # Parse tags
         tags = []
@@ -132,12 +320,20 @@ class Video:
             categories = [cat.get("name", "") for cat in data["categories"] if cat.get("name")]
 
         # Parse dates
-        created_time = cls._parse_datetime(data.get("created_time"))
-        modified_time = cls._parse_datetime(data.get("modified_time"))
-        release_date = cls._parse_datetime(data.get("release_time")) if data.get("release_time") else created_time
-
-        return cls(
-            id=data.get("uri", "").split("/")[-1] or str(data.get("resource_key", "")),
+        date_errors = []
+        created_time = cls._parse_datetime(data, "created_time", date_errors)
+        modified_time = cls._parse_datetime(data, "modified_time", date_errors)
+        release_date = cls._parse_datetime(data, "release_time", date_errors, required=False)
+        created_time = created_time or modified_time or EPOCH
+        modified_time = modified_time or created_time
+        release_date = release_date or created_time
+
+        video_id = data.get("uri", "").split("/")[-1] or str(data.get("resource_key", ""))
+        if date_errors:
+            logger.warning(f"Video {video_id}: {'; '.join(date_errors)}")
+
+        video = cls(
+            id=video_id,
             title=data.get("name", "Untitled"),
             description=data.get("description", "") or "",
             duration=data.get("duration", 0),
@@ -149,13 +345,74 @@ class Video:
             tags=tags,
             categories=categories,
             privacy=data.get("privacy", {}).get("view", "anybody"),
-            embed_html=data.get("embed", {}).get("html"),
+            embed_html=None if lean else data.get("embed", {}).get("html"),
             link=data.get("link"),
             plays=data.get("stats", {}).get("plays", 0) or 0,
             likes=data.get("metadata", {}).get("connections", {}).get("likes", {}).get("total", 0) or 0,
             vimeo_uri=data.get("uri"),
             vimeo_embed_url=data.get("player_embed_url")
         )
+        video.selected_media = selected_media
+        video.date_errors = tuple(date_errors)
+        return video
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the video (as parsed) for storage; see from_dict()."""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "duration": self.duration,
+            "created_time": self.created_time.isoformat(),
+            "modified_time": self.modified_time.isoformat(),
+            "release_date": self.release_date.isoformat() if self.release_date else None,
+            "thumbnails": [thumbnail.to_dict() for thumbnail in self.thumbnails],
+            "video_files": [video_file.to_dict() for video_file in self.video_files],
+            "tags": self.tags,
+            "categories": self.categories,
+            "privacy": self.privacy,
+            "embed_html": self.embed_html,
+            "link": self.link,
+            "plays": self.plays,
+            "likes": self.likes,
+            "vimeo_uri": self.vimeo_uri,
+            "vimeo_embed_url": self.vimeo_embed_url,
+            "date_errors": list(self.date_errors)
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], policy: MediaPolicy = DEFAULT_MEDIA_POLICY) -> "Video":
+        """
+        Restore a video serialized by to_dict().
+
+        Args:
+            data: Serialized video
+            policy: How to choose the thumbnail and video file, as when parsing
+        """
+        release_date = data.get("release_date")
+        video = cls(
+            id=data["id"],
+            title=data["title"],
+            description=data.get("description", ""),
+            duration=data.get("duration", 0),
+            created_time=parse_timestamp(data["created_time"]),
+            modified_time=parse_timestamp(data["modified_time"]),
+            release_date=parse_timestamp(release_date) if release_date else None,
+            thumbnails=[Thumbnail.from_dict(thumbnail) for thumbnail in data.get("thumbnails", [])],
+            video_files=[VideoFile.from_dict(video_file) for video_file in data.get("video_files", [])],
+            tags=data.get("tags", []),
+            categories=data.get("categories", []),
+            privacy=data.get("privacy", "anybody"),
+            embed_html=data.get("embed_html"),
+            link=data.get("link"),
+            plays=data.get("plays", 0),
+            likes=data.get("likes", 0),
+            vimeo_uri=data.get("vimeo_uri"),
+            vimeo_embed_url=data.get("vimeo_embed_url")
+        )
+        video.selected_media = policy.select(video.thumbnails, video.video_files)
+        video.date_errors = tuple(data.get("date_errors", ()))
+        return video
 
     @staticmethod
     def _determine_quality(height: int) -> VideoQuality:
@@ -170,42 +427,83 @@ class Video:
             return VideoQuality.SD
 
     @staticmethod
-    def _parse_datetime(date_str: Optional[str]) -> datetime:
-        """Parse ISO format datetime string."""
-        if not date_str:
-            return datetime.now()
+    def _parse_datetime(
+        data: Dict[str, Any],
+        key: str,
+        errors: List[str],
+        required: bool = True
+    ) -> Optional[datetime]:
+        """
+        Parse a timestamp field of an API response.
+
+        Args:
+            data: Video object from the API
+            key: Field to parse (e.g. 'created_time')
+            errors: List a problem with the field is appended to
+            required: Whether a missing value is a problem
+
+        Returns:
+            The parsed datetime, or None if it is missing or malformed
+        """
+        value = data.get(key)
+        if not value:
+            if required:
+                errors.append(f"{key} is missing")
+            return None
         try:
-            # Handle Vimeo's ISO format
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        except (ValueError, AttributeError):
-            return datetime.now()
-
-    def get_best_thumbnail(self, min_width: int = 800) -> Optional[Thumbnail]:
-        """Get the best thumbnail at or above the minimum width."""
-        suitable = [t for t in self.thumbnails if t.width >= min_width]
-        if suitable:
-            return min(suitable, key=lambda t: t.width)
-        elif self.thumbnails:
-            return max(self.thumbnails, key=lambda t: t.width)
-        return None
+            return parse_timestamp(value)
+        except ValueError:
+            errors.append(f"{key} {value!r} is not a valid timestamp")
+            return None
+
+    def content_fingerprint(self) -> str:
+        """
+        Stable hash of the fields RokuVideo.from_video() reads.
+
+        Two videos with the same fingerprint convert to the same Roku item,
+        even if other metadata such as stats or modified_time differ. Only
+        the selected thumbnail and video file count, so a lean and a full
+        parse of the same video agree.
+        """
+        thumbnail = self.get_best_thumbnail()
+        video_file = self.get_best_video_file()
+        parts = (
+            self.id,
+            self.title,
+            self.description,
+            self.duration,
+            self.created_time.isoformat(),
+            self.release_date.isoformat() if self.release_date else None,
+            thumbnail.url if thumbnail else None,
+            (video_file.url, video_file.quality.value, video_file.video_type) if video_file else None,
+            tuple(self.tags),
+            tuple(self.categories),
+        )
+        return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+    def get_best_thumbnail(self, min_width: int = None) -> Optional[Thumbnail]:
+        """
+        Get the smallest thumbnail at or above the minimum width, else the widest.
+
+        Args:
+            min_width: Minimum width; defaults to the policy the video was
+                parsed with, whose choice is memoized
+        """
+        if min_width is None:
+            return self._selected_media()[0]
+        return MediaPolicy(min_thumbnail_width=min_width).select(self.thumbnails, ())[0]
 
     def get_best_video_file(self) -> Optional[VideoFile]:
-        """Get the highest quality video file, preferring HLS."""
-        hls_files = [f for f in self.video_files if f.video_type == "HLS"]
-        if hls_files:
-            return hls_files[0]
-
-        if self.video_files:
-            quality_order = [VideoQuality.UHD, VideoQuality.FHD, VideoQuality.HD, VideoQuality.SD]
-            for quality in quality_order:
-                for file in self.video_files:
-                    if file.quality == quality:
-                        return file
-            return self.video_files[0]
-        return None
+        """Get the video file of the preferred type (HLS), else the highest quality one."""
+        return self._selected_media()[1]
 
+    def _selected_media(self) -> Tuple[Optional[Thumbnail], Optional[VideoFile]]:
+        if self.selected_media is None:
+            self.selected_media = DEFAULT_MEDIA_POLICY.select(self.thumbnails, self.video_files)
+        return self.selected_media
 
-@dataclass
+
+@slotted_dataclass
 class RokuVideo:
     """Represents a video formatted for Roku Direct Publisher."""
     id: str
@@ -221,6 +519,11 @@ class RokuVideo:
     video_type: VideoType = VideoType.SHORT_FORM
     rating: Optional[Dict[str, str]] = None
 
+    # Serialized to_dict() as it appears in a saved feed, set once the item
+    # has been serialized or restored from a cached fragment. Fields must
+    # not be changed after that.
+    json_fragment: Optional[str] = field(default=None, repr=False, compare=False)
+
     @classmethod
     def from_video(cls, video: Video, video_type: VideoType = None) -> "RokuVideo":
         """Create a RokuVideo from a Video instance."""
@@ -233,7 +536,7 @@ class RokuVideo:
 
         # Build content object
         content = {
-            "dateAdded": video.created_time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "dateAdded": format_timestamp(video.created_time),
             "duration": video.duration,
             "videos": []
         }
@@ -262,7 +565,7 @@ class RokuVideo:
             title=video.title[:100],  # Roku title limit
             short_description=short_desc,
             long_description=long_desc,
-            release_date=video.release_date.strftime("%Y-%m-%d") if video.release_date else video.created_time.strftime("%Y-%m-%d"),
+            release_date=format_date(video.release_date or video.created_time),
             duration=video.duration,
             thumbnail=thumbnail_url,
             content=content,
@@ -271,6 +574,43 @@ class RokuVideo:
             video_type=video_type
         )
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], video_type: VideoType = VideoType.SHORT_FORM) -> "RokuVideo":
+        """Create a RokuVideo from an item of a saved Roku feed."""
+        content = data.get("content", {})
+        return cls(
+            id=data.get("id", ""),
+            title=data.get("title", ""),
+            short_description=data.get("shortDescription", ""),
+            long_description=data.get("longDescription", ""),
+            release_date=data.get("releaseDate", ""),
+            duration=content.get("duration", 0),
+            thumbnail=data.get("thumbnail", ""),
+            content=content,
+            tags=data.get("tags", []),
+            genres=data.get("genres", []),
+            video_type=video_type,
+            rating=data.get("rating")
+        )
+
+    @classmethod
+    def from_fragment(cls, fragment: str, video_type: VideoType = VideoType.SHORT_FORM) -> "RokuVideo":
+        """Restore a RokuVideo from a fragment produced by to_json_fragment()."""
+        video = cls.from_dict(json_codec.loads(fragment), video_type)
+        video.json_fragment = fragment
+        return video
+
+    def to_json_fragment(self) -> str:
+        """
+        Serialize to JSON as the item appears inside a saved feed.
+
+        The result is computed once and reused, so unchanged videos are
+        spliced into the feed without being serialized again.
+        """
+        if self.json_fragment is None:
+            self.json_fragment = serialize_item(self.to_dict())
+        return self.json_fragment
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to Roku feed dictionary format."""
         result = {
@@ -296,7 +636,7 @@ class RokuFeed:
     """Represents a complete Roku Direct Publisher feed."""
     provider_name: str
     language: str = "en"
-    last_updated: datetime = field(default_factory=datetime.now)
+    last_updated: datetime = field(default_factory=utc_now)
     short_form_videos: List[RokuVideo] = field(default_factory=list)
     movies: List[RokuVideo] = field(default_factory=list)
     series: List[Dict[str, Any]] = field(default_factory=list)
@@ -304,48 +644,198 @@ class RokuFeed:
     playlists: List[Dict[str, Any]] = field(default_factory=list)
     categories: List[Dict[str, Any]] = field(default_factory=list)
 
+    # Feed keys of the video sections, by the video type they hold
+    SECTIONS = {
+        VideoType.SHORT_FORM: "shortFormVideos",
+        VideoType.MOVIE: "movies",
+        VideoType.TV_SPECIAL: "tvSpecials",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RokuFeed":
+        """Create a RokuFeed from a saved Roku feed dictionary."""
+        last_updated = data.get("lastUpdated")
+        feed = cls(
+            provider_name=data.get("providerName", ""),
+            language=data.get("language", "en"),
+            last_updated=parse_timestamp(last_updated) if last_updated else utc_now(),
+            series=data.get("series", []),
+            playlists=data.get("playlists", []),
+            categories=data.get("categories", [])
+        )
+
+        for video_type, key in cls.SECTIONS.items():
+            for item in data.get(key, []):
+                feed.add_video(RokuVideo.from_dict(item, video_type))
+
+        return feed
+
+    def _section(self, video_type: VideoType) -> Optional[List[RokuVideo]]:
+        if video_type == VideoType.SHORT_FORM:
+            return self.short_form_videos
+        elif video_type == VideoType.MOVIE:
+            return self.movies
+        elif video_type == VideoType.TV_SPECIAL:
+            return self.tv_specials
+        return None
+
+    def iter_videos(self) -> Iterator[RokuVideo]:
+        """Iterate over every video in the feed, in section order."""
+        for video_type in self.SECTIONS:
+            yield from self._section(video_type)
+
+    def video_ids(self) -> List[str]:
+        """IDs of every video in the feed, in section order."""
+        return [video.id for video in self.iter_videos()]
+
     def add_video(self, video: RokuVideo):
         """Add a video to the appropriate list based on its type."""
-        if video.video_type == VideoType.SHORT_FORM:
-            self.short_form_videos.append(video)
-        elif video.video_type == VideoType.MOVIE:
-            self.movies.append(video)
-        elif video.video_type == VideoType.TV_SPECIAL:
-            self.tv_specials.append(video)
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to Roku feed dictionary format."""
-        result = {
-            "providerName": self.provider_name,
-            "language": self.language,
-            "lastUpdated": self.last_updated.strftime("%Y-%m-%dT%H:%M:%SZ")
-        }
+        section = self._section(video.video_type)
+        if section is not None:
+            section.append(video)
+
+    def merge_videos(
+        self,
+        videos: List[RokuVideo],
+        removed_ids: Iterable[str] = ()
+    ) -> Dict[str, int]:
+        """
+        Upsert videos by ID and drop removed ones in a single pass.
+
+        Existing videos are replaced in place, or moved if their type
+        changed. New videos are placed at the front of their section, in the
+        order given.
+
+        Args:
+            videos: Videos to add or update
+            removed_ids: IDs of videos to remove
+
+        Returns:
+            Counts of videos added, updated and removed
+        """
+        updates = {video.id: video for video in videos}
+        removed = set(removed_ids) - set(updates)
+        counts = {"added": 0, "updated": 0, "removed": 0}
+        placed = set()
+
+        for video_type in self.SECTIONS:
+            section = self._section(video_type)
+            merged = []
+            for item in section:
+                if item.id in removed:
+                    counts["removed"] += 1
+                    continue
+                update = updates.get(item.id)
+                if update is None:
+                    merged.append(item)
+                    continue
+                counts["updated"] += 1
+                if update.video_type == video_type:
+                    merged.append(update)
+                    placed.add(update.id)
+            section[:] = merged
+
+        for video_type in self.SECTIONS:
+            section = self._section(video_type)
+            new_videos = [
+                video for video in updates.values()
+                if video.video_type == video_type and video.id not in placed
+            ]
+            section[:0] = new_videos
+
+        counts["added"] = len(updates) - counts["updated"]
+        return counts
+
+    def _entries(self) -> List[Tuple[str, Any]]:
+        """Top-level feed keys and values, with video sections as RokuVideo lists."""
+        entries = [
+            ("providerName", self.provider_name),
+            ("language", self.language),
+            ("lastUpdated", format_timestamp(self.last_updated))
+        ]
 
         if self.short_form_videos:
-            result["shortFormVideos"] = [v.to_dict() for v in self.short_form_videos]
+            entries.append(("shortFormVideos", self.short_form_videos))
 
         if self.movies:
-            result["movies"] = [v.to_dict() for v in self.movies]
+            entries.append(("movies", self.movies))
 
         if self.series:
-            result["series"] = self.series
+            entries.append(("series", self.series))
 
         if self.tv_specials:
-            result["tvSpecials"] = [v.to_dict() for v in self.tv_specials]
+            entries.append(("tvSpecials", self.tv_specials))
 
         if self.playlists:
-            result["playlists"] = self.playlists
+            entries.append(("playlists", self.playlists))
 
         if self.categories:
-            result["categories"] = self.categories
+            entries.append(("categories", self.categories))
 
-        return result
+        return entries
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to Roku feed dictionary format."""
+        video_keys = set(self.SECTIONS.values())
+        return {
+            key: [v.to_dict() for v in value] if key in video_keys else value
+            for key, value in self._entries()
+        }
+
+    def write_json(self, stream: TextIO) -> str:
+        """
+        Stream the feed to a text stream, one video at a time.
+
+        The output is identical to ``json.dumps(self.to_dict(), indent=2,
+        ensure_ascii=False)``. Videos with a cached JSON fragment are
+        written from it without being serialized again.
+
+        Returns:
+            Content digest of the feed, excluding lastUpdated
+        """
+        video_keys = set(self.SECTIONS.values())
+        writer = FeedWriter(stream)
+        for key, value in self._entries():
+            if key in video_keys:
+                writer.write_section(key, value)
+            else:
+                writer.write_value(key, value)
+        writer.close()
+        return writer.digest
 
     def to_json(self, indent: int = 2) -> str:
         """Convert to JSON string."""
+        if indent == 2:
+            buffer = io.StringIO()
+            self.write_json(buffer)
+            return buffer.getvalue()
         return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
 
-    def save(self, filepath: str):
-        """Save feed to a JSON file."""
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(self.to_json())
+    def save(
+        self,
+        filepath: str,
+        keep: int = 0,
+        unchanged_digest: str = None,
+        encodings: Iterable[str] = ()
+    ) -> str:
+        """
+        Save feed to a JSON file.
+
+        The file is replaced atomically, so readers never see a partial feed.
+
+        Args:
+            filepath: Output file path
+            keep: Previous versions to keep as ``<filepath>.1`` .. ``.N``
+            unchanged_digest: Digest of the feed already at filepath; if the
+                new content has the same digest the file is left untouched
+            encodings: Compressed copies to write alongside, e.g. ['gzip']
+                for ``<filepath>.gz`` (see compression.resolve_encodings)
+
+        Returns:
+            Content digest of the feed, excluding lastUpdated
+        """
+        with open_feed_output(filepath, encodings, keep) as f:
+            digest = self.write_json(f)
+            if digest == unchanged_digest:
+                raise Discard()
+        return digest
@@ -0,0 +1,218 @@
+"""
+Rate limiting for Vimeo API requests.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Token bucket limiter that can be shared by threads and coroutines.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Each request reserves a token up front, so concurrent callers queue
+    behind one another instead of racing for the same slot.
+    """
+
+    def __init__(self, rate: float = 10.0, capacity: float = None):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (defaults to one second of tokens)
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Take tokens from the bucket.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds the caller must wait before using the reserved tokens
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= tokens
+
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1):
+        """Block the current thread until the tokens are available."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, tokens: float = 1):
+        """Suspend the current coroutine until the tokens are available."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class AdaptiveRateLimiter(TokenBucket):
+    """
+    Token bucket paced by Vimeo's ``X-RateLimit-*`` response headers.
+
+    After every response the refill rate is recomputed so the remaining
+    request budget is spread evenly over the time left until the window
+    resets. ``headroom`` requests are held back for requests already in
+    flight; once the budget is spent, callers wait for the reset instead
+    of running into 429 responses.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        capacity: float = None,
+        max_rate: float = None,
+        headroom: int = None
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Requests per second until the first rate-limit headers arrive
+            capacity: Maximum burst size
+            max_rate: Upper bound on the adapted rate (optional)
+            headroom: Requests kept in reserve (defaults to the burst size + 1)
+        """
+        super().__init__(rate, capacity)
+        self.max_rate = max_rate
+        self.headroom = headroom if headroom is not None else int(self.capacity) + 1
+
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self._reset_at: Optional[float] = None
+        self._paused_until = 0.0  # Budget exhausted: wait for the window to reset
+        self._retry_until = 0.0  # Set by pause() from a 429's Retry-After; never lowered
+
+    @property
+    def seconds_until_reset(self) -> Optional[float]:
+        """Seconds left in the current rate-limit window, if known."""
+        if self._reset_at is None:
+            return None
+        return max(0.0, self._reset_at - time.monotonic())
+
+    def reserve(self, tokens: float = 1) -> float:
+        delay = super().reserve(tokens)
+        with self._lock:
+            pause = max(self._paused_until, self._retry_until) - time.monotonic()
+        return max(delay, pause)
+
+    def pause(self, seconds: float):
+        """
+        Hold back every caller for the given number of seconds.
+
+        Rate-limit headers of later responses (such as requests that were
+        already in flight) do not shorten the pause.
+        """
+        with self._lock:
+            self._retry_until = max(self._retry_until, time.monotonic() + seconds)
+
+    def update(self, headers: Mapping[str, str]):
+        """
+        Adjust pacing from a response's rate-limit headers.
+
+        Args:
+            headers: Response headers (case-insensitive mapping)
+        """
+        remaining = _int_header(headers, "X-RateLimit-Remaining")
+        reset_in = _seconds_until(headers.get("X-RateLimit-Reset"))
+        if remaining is None or reset_in is None:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            reset_at = now + reset_in
+
+            # Responses to concurrent requests can arrive out of order, so
+            # within one window only a lower remaining count is trusted
+            same_window = self._reset_at is not None and abs(reset_at - self._reset_at) < 1
+            if same_window and self.remaining is not None and remaining > self.remaining:
+                return
+
+            self.limit = _int_header(headers, "X-RateLimit-Limit")
+            self.remaining = remaining
+            self._reset_at = reset_at
+
+            budget = remaining - self.headroom
+            if budget <= 0:
+                self._paused_until = reset_at
+                logger.info(
+                    f"Rate limit budget exhausted, pausing {reset_in:.1f}s until reset"
+                )
+                return
+
+            rate = budget / max(reset_in, 1.0)
+            if self.max_rate:
+                rate = min(rate, self.max_rate)
+
+            # Settle the tokens earned at the old rate before switching
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self.rate = rate
+            if not same_window:
+                # A new window ends a pause for the previous window's budget
+                self._paused_until = min(self._paused_until, now)
+
+
+def _int_header(headers: Mapping[str, str], name: str) -> Optional[int]:
+    value = headers.get(name)
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _seconds_until(reset: Optional[str]) -> Optional[float]:
+    """
+    Parse an ``X-RateLimit-Reset`` value into seconds from now.
+
+    Vimeo sends an ISO 8601 timestamp; epoch seconds and plain
+    delta-seconds are accepted as well.
+    """
+    if not reset:
+        return None
+
+    try:
+        value = float(reset)
+    except ValueError:
+        try:
+            reset_time = datetime.fromisoformat(reset.strip().replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if reset_time.tzinfo is None:
+            reset_time = reset_time.replace(tzinfo=timezone.utc)
+        return max(0.0, (reset_time - datetime.now(timezone.utc)).total_seconds())
+
+    if value > 1e9:  # Epoch timestamp
+        return max(0.0, value - time.time())
+    return max(0.0, value)
@@ -2,15 +2,25 @@
 Roku Direct Publisher feed generator.
 """
 
-import json
+import hashlib
 import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable
 from pathlib import Path
 
+from . import json_codec
 from .models import Video, RokuVideo, RokuFeed, VideoType
+from .atomic_file import Discard
+from .compression import ENCODINGS, artifact_path, open_feed_output, resolve_encodings
+from .feed_writer import FEED_KEYS, FeedWriter, SectionSpool
 from .config import RokuConfig
 from .exceptions import RokuFeedError, RokuValidationError
+from .timestamps import format_date, format_timestamp, utc_now
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +40,9 @@ class RokuFeedGenerator:
     MIN_THUMBNAIL_WIDTH = 800
     MIN_THUMBNAIL_HEIGHT = 450
 
+    # Bump when build_video() output changes so cached conversions are rebuilt
+    CONVERSION_VERSION = 1
+
     def __init__(self, config: RokuConfig = None, provider_name: str = None):
         """
         Initialize the Roku feed generator.
@@ -49,6 +62,9 @@ class RokuFeedGenerator:
             language=self.config.language
         )
 
+        # Content digest of the last saved feed (see save())
+        self.last_digest: Optional[str] = None
+
     def reset(self):
         """Reset the feed to empty state."""
         self.feed = RokuFeed(
@@ -56,7 +72,71 @@ class RokuFeedGenerator:
             language=self.config.language
         )
 
-    def add_video(
+    def load(self, filepath: str = None) -> bool:
+        """
+        Load a previously saved feed so it can be updated incrementally.
+
+        Args:
+            filepath: Feed file path (uses config path if not specified)
+
+        Returns:
+            True if the feed was loaded, False if it is missing or unreadable
+        """
+        filepath = filepath or self.config.feed_output_path
+        path = Path(filepath)
+        if not path.exists():
+            return False
+
+        try:
+            feed = RokuFeed.from_dict(json_codec.load(path))
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Failed to load previous feed from {filepath}: {e}")
+            return False
+
+        feed.provider_name = self.provider_name
+        feed.language = self.config.language
+        self.feed = feed
+
+        logger.info(f"Loaded previous feed from {filepath}")
+        return True
+
+    def conversion_key(
+        self,
+        video: Video,
+        video_type: VideoType = None,
+        genres: List[str] = None,
+        rating: Dict[str, str] = None
+    ) -> str:
+        """
+        Hash everything that determines build_video()'s output.
+
+        A Roku item converted earlier can be reused as long as its key is
+        unchanged. The short-form threshold (a sync setting) is covered by
+        the video_type the caller classified the video as.
+
+        Args:
+            video: Video object from Vimeo
+            video_type: Override video type classification
+            genres: Override genres
+            rating: Content rating
+
+        Returns:
+            Hex digest
+        """
+        settings = (
+            self.CONVERSION_VERSION,
+            video_type.value if video_type else None,
+            tuple(genres) if genres else None,
+            tuple(sorted(rating.items())) if rating else None,
+            self.config.default_genre,
+            self.config.rating_system,
+            self.config.default_rating,
+        )
+        digest = hashlib.sha256(video.content_fingerprint().encode("ascii"))
+        digest.update(repr(settings).encode("utf-8"))
+        return digest.hexdigest()
+
+    def build_video(
         self,
         video: Video,
         video_type: VideoType = None,
@@ -64,7 +144,7 @@ class RokuFeedGenerator:
         rating: Dict[str, str] = None
     ) -> RokuVideo:
         """
-        Add a video to the feed.
+        Convert a video to Roku format without adding it to the feed.
 
         Args:
             video: Video object from Vimeo
@@ -73,7 +153,7 @@ class RokuFeedGenerator:
             rating: Content rating (e.g., {"rating": "TV-G", "ratingSource": "USA_TV"})
 
         Returns:
-            RokuVideo object that was added
+            RokuVideo object
         """
         # Determine video type if not specified
         if video_type is None:
@@ -99,12 +179,55 @@ class RokuFeedGenerator:
                 "ratingSource": self.config.rating_system
             }
 
-        # Add to feed
+        return roku_video
+
+    def add_video(
+        self,
+        video: Video,
+        video_type: VideoType = None,
+        genres: List[str] = None,
+        rating: Dict[str, str] = None
+    ) -> RokuVideo:
+        """
+        Add a video to the feed.
+
+        Args:
+            video: Video object from Vimeo
+            video_type: Override video type classification
+            genres: Override genres
+            rating: Content rating (e.g., {"rating": "TV-G", "ratingSource": "USA_TV"})
+
+        Returns:
+            RokuVideo object that was added
+        """
+        roku_video = self.build_video(video, video_type, genres, rating)
         self.feed.add_video(roku_video)
 
-        logger.debug(f"Added video '{roku_video.title}' as {video_type.value}")
+        logger.debug(f"Added video '{roku_video.title}' as {roku_video.video_type.value}")
         return roku_video
 
+    def merge_videos(
+        self,
+        videos: List[RokuVideo],
+        removed_ids: Iterable[str] = ()
+    ) -> Dict[str, int]:
+        """
+        Apply a set of changes to the current feed.
+
+        Args:
+            videos: Converted videos to add or update (matched by ID)
+            removed_ids: Roku IDs of videos to remove
+
+        Returns:
+            Counts of videos added, updated and removed
+        """
+        counts = self.feed.merge_videos(videos, removed_ids)
+        logger.debug(
+            f"Merged feed changes: {counts['added']} added, "
+            f"{counts['updated']} updated, {counts['removed']} removed"
+        )
+        return counts
+
     def add_videos(
         self,
         videos: List[Video],
@@ -176,10 +299,10 @@ class RokuFeedGenerator:
                     "episodeNumber": ep_idx + 1,
                     "shortDescription": video.description[:200] if video.description else video.title,
                     "longDescription": video.description[:500] if video.description else video.title,
-                    "releaseDate": video.release_date.strftime("%Y-%m-%d") if video.release_date else "",
+                    "releaseDate": format_date(video.release_date) if video.release_date else "",
                     "thumbnail": thumbnail_obj.url if thumbnail_obj else "",
                     "content": {
-                        "dateAdded": video.created_time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                        "dateAdded": format_timestamp(video.created_time),
                         "duration": video.duration,
                         "videos": []
                     }
@@ -210,7 +333,7 @@ class RokuFeedGenerator:
             "shortDescription": description[:200] if description else title,
             "longDescription": description[:500] if description else title,
             "thumbnail": thumbnail,
-            "releaseDate": release_date or (episodes[0].release_date.strftime("%Y-%m-%d") if episodes else ""),
+            "releaseDate": release_date or (format_date(episodes[0].release_date) if episodes else ""),
             "genres": genres or [self.config.default_genre],
             "seasons": seasons_data
         }
@@ -292,6 +415,22 @@ class RokuFeedGenerator:
 
         return errors
 
+    def validate_video(self, video: RokuVideo) -> List[str]:
+        """
+        Validate a single video the way validate() checks the feed's videos.
+
+        Args:
+            video: Converted video
+
+        Returns:
+            List of validation error messages
+        """
+        if video.video_type == VideoType.SHORT_FORM:
+            return self._validate_video(video, "shortFormVideo")
+        if video.video_type == VideoType.MOVIE:
+            return self._validate_video(video, "movie")
+        return []
+
     def _validate_video(self, video: RokuVideo, video_type: str) -> List[str]:
         """Validate a single video."""
         errors = []
@@ -322,7 +461,7 @@ class RokuFeedGenerator:
 
     def update_timestamp(self):
         """Update the lastUpdated timestamp to now."""
-        self.feed.last_updated = datetime.now()
+        self.feed.last_updated = utc_now()
 
     def to_dict(self) -> Dict[str, Any]:
         """Get the feed as a dictionary."""
@@ -334,12 +473,16 @@ class RokuFeedGenerator:
         self.update_timestamp()
         return self.feed.to_json(indent)
 
-    def save(self, filepath: str = None):
+    def save(self, filepath: str = None, previous_digest: str = None):
         """
         Save the feed to a JSON file.
 
+        The content digest is kept in ``last_digest``. If it equals
+        ``previous_digest`` and the file exists, the file is not rewritten.
+
         Args:
             filepath: Output file path (uses config path if not specified)
+            previous_digest: Digest of the last saved feed
         """
         filepath = filepath or self.config.feed_output_path
 
@@ -351,15 +494,76 @@ class RokuFeedGenerator:
                 logger.warning(f"  - {error}")
 
         self.update_timestamp()
+        previous_digest = self._existing_digest(filepath, previous_digest)
+        self.last_digest = self.feed.save(
+            filepath,
+            keep=self.config.feed_generations,
+            unchanged_digest=previous_digest,
+            encodings=self.encodings
+        )
+        self._log_saved(filepath, previous_digest)
 
-        path = Path(filepath)
-        path.parent.mkdir(parents=True, exist_ok=True)
+        return filepath
 
-        self.feed.save(str(path))
-        logger.info(f"Feed saved to {filepath}")
+    def save_spooled(
+        self,
+        spool: SectionSpool,
+        filepath: str = None,
+        previous_digest: str = None
+    ) -> str:
+        """
+        Save a feed whose videos were spooled while they were streamed in.
+
+        The header, series, playlists and categories come from the current
+        feed; its in-memory video lists are not written. Digests work as in
+        save().
 
+        Args:
+            spool: Spooled video sections
+            filepath: Output file path (uses config path if not specified)
+            previous_digest: Digest of the last saved feed
+
+        Returns:
+            Path the feed was saved to
+        """
+        filepath = filepath or self.config.feed_output_path
+        self.update_timestamp()
+        previous_digest = self._existing_digest(filepath, previous_digest)
+
+        values = dict(self.feed._entries())
+        with open_feed_output(filepath, self.encodings, self.config.feed_generations) as f:
+            writer = FeedWriter(f)
+            writer.write_header(self.feed.provider_name, self.feed.language, self.feed.last_updated)
+            for key in FEED_KEYS[3:]:
+                if key in spool.counts:
+                    writer.write_spooled_section(key, spool)
+                elif key in values and key not in RokuFeed.SECTIONS.values():
+                    writer.write_value(key, values[key])
+            writer.close()
+
+            self.last_digest = writer.digest
+            if writer.digest == previous_digest:
+                raise Discard()
+
+        self._log_saved(filepath, previous_digest)
         return filepath
 
+    @property
+    def encodings(self) -> List[str]:
+        """Compressed artifacts written alongside the feed."""
+        return resolve_encodings(self.config.feed_compression)
+
+    def _existing_digest(self, filepath: str, digest: Optional[str]) -> Optional[str]:
+        """The previous digest, if the files it describes are all still there."""
+        paths = [filepath] + [artifact_path(filepath, encoding) for encoding in self.encodings]
+        return digest if digest and all(Path(path).exists() for path in paths) else None
+
+    def _log_saved(self, filepath: str, previous_digest: Optional[str]):
+        if self.last_digest == previous_digest:
+            logger.info(f"Feed unchanged, kept {filepath}")
+        else:
+            logger.info(f"Feed saved to {filepath}")
+
     def get_stats(self) -> Dict[str, int]:
         """Get statistics about the feed content."""
         return {
@@ -377,52 +581,203 @@ class RokuFeedGenerator:
         }
 
 
+_s3_client = None
+_s3_client_lock = threading.Lock()
+
+
+def get_s3_client():
+    """
+    Get the process-wide boto3 S3 client.
+
+    Creating a client is slow and clients are thread-safe, so one is shared
+    by every uploader.
+    """
+    global _s3_client
+    with _s3_client_lock:
+        if _s3_client is None:
+            try:
+                import boto3
+            except ImportError:
+                raise RokuFeedError("boto3 is required for S3 upload. Install with: pip install boto3")
+            _s3_client = boto3.client("s3")
+        return _s3_client
+
+
+@dataclass
+class S3Upload:
+    """A local file to upload to an S3 key."""
+    path: str
+    key: str
+    extra_args: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class UploadStats:
+    """Files, bytes and wall-clock time of an upload."""
+    files: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+
+    @property
+    def bytes_per_second(self) -> Optional[float]:
+        return self.bytes / self.seconds if self.seconds else None
+
+    def add(self, other: "UploadStats"):
+        self.files += other.files
+        self.bytes += other.bytes
+        self.seconds += other.seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "files": self.files,
+            "bytes": self.bytes,
+            "seconds": self.seconds,
+            "bytes_per_second": self.bytes_per_second
+        }
+
+
 class RokuFeedUploader:
     """
     Handles uploading Roku feeds to various destinations.
     """
 
-    def __init__(self, config: RokuConfig = None):
+    # Files uploaded at once; each may use several threads for its parts
+    MAX_PARALLEL_FILES = 4
+
+    def __init__(self, config: RokuConfig = None, s3_client=None):
+        """
+        Initialize the uploader.
+
+        Args:
+            config: RokuConfig object
+            s3_client: boto3 S3 client (defaults to the shared client)
+        """
         self.config = config or RokuConfig()
+        self._s3_client = s3_client
+        self.last_upload: Optional[UploadStats] = None  # Throughput of the last upload_to_s3()
+
+    @property
+    def s3_client(self):
+        return self._s3_client or get_s3_client()
+
+    def transfer_config(self):
+        """Multipart settings for S3 transfers, from the Roku config."""
+        try:
+            from boto3.s3.transfer import TransferConfig
+        except ImportError:
+            raise RokuFeedError("boto3 is required for S3 upload. Install with: pip install boto3")
 
-    def upload_to_s3(self, feed_path: str, bucket: str = None, key: str = None) -> str:
+        mb = 1024 * 1024
+        return TransferConfig(
+            multipart_threshold=self.config.s3_multipart_threshold_mb * mb,
+            multipart_chunksize=self.config.s3_multipart_chunk_mb * mb,
+            max_concurrency=self.config.s3_max_concurrency,
+            use_threads=self.config.s3_max_concurrency > 1
+        )
+
+    def upload_files(self, uploads: List[S3Upload], bucket: str = None) -> UploadStats:
+        """
+        Upload several files to S3 concurrently.
+
+        Files at or above the multipart threshold are sent in parts, several
+        at a time, according to transfer_config().
+
+        Args:
+            uploads: Files and the keys to upload them to
+            bucket: S3 bucket name
+
+        Returns:
+            UploadStats with the files, bytes and seconds taken
+
+        Raises:
+            RokuFeedError: If no bucket is configured
+        """
+        bucket = bucket or self.config.s3_bucket
+        if not bucket:
+            raise RokuFeedError("S3 bucket is required")
+        stats = UploadStats(files=len(uploads))
+        if not uploads:
+            return stats
+
+        s3 = self.s3_client
+        transfer_config = self.transfer_config()
+
+        def upload(item: S3Upload):
+            s3.upload_file(item.path, bucket, item.key, ExtraArgs=item.extra_args, Config=transfer_config)
+            logger.debug(f"Uploaded {item.path} to s3://{bucket}/{item.key}")
+
+        stats.bytes = sum(os.path.getsize(item.path) for item in uploads)
+        start = time.perf_counter()
+        if len(uploads) == 1:
+            upload(uploads[0])
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(uploads), self.MAX_PARALLEL_FILES)) as executor:
+                # list() re-raises the first failed upload
+                list(executor.map(upload, uploads))
+        stats.seconds = time.perf_counter() - start
+        return stats
+
+    def upload_to_s3(
+        self,
+        feed_path: str,
+        bucket: str = None,
+        key: str = None,
+        encodings: Iterable[str] = None,
+        extra_uploads: Iterable[S3Upload] = ()
+    ) -> str:
         """
         Upload feed to Amazon S3.
 
+        Compressed artifacts written next to the feed are uploaded to the
+        key plus their suffix (``roku-feed.json.gz``) with the matching
+        Content-Encoding. They and any extra uploads (such as shards you
+        generate yourself; none are generated here) go up in parallel with
+        the same transfer settings, before the feed itself. The throughput
+        is kept in ``last_upload``.
+
         Args:
             feed_path: Path to the feed JSON file
             bucket: S3 bucket name
             key: S3 object key
+            encodings: Artifacts to upload (defaults to roku.feed_compression)
+            extra_uploads: Other files to publish with the feed
 
         Returns:
             S3 URL of the uploaded feed
         """
-        try:
-            import boto3
-        except ImportError:
-            raise RokuFeedError("boto3 is required for S3 upload. Install with: pip install boto3")
-
         bucket = bucket or self.config.s3_bucket
         key = key or self.config.s3_key or "roku-feed.json"
 
         if not bucket:
             raise RokuFeedError("S3 bucket is required")
 
-        s3 = boto3.client("s3")
+        if encodings is None:
+            encodings = resolve_encodings(self.config.feed_compression)
 
-        with open(feed_path, "rb") as f:
-            s3.upload_fileobj(
-                f,
-                bucket,
-                key,
-                ExtraArgs={
-                    "ContentType": "application/json",
-                    "ACL": "public-read"
-                }
-            )
+        extra_args = {
+            "ContentType": "application/json",
+            "ACL": "public-read"
+        }
+        if self.config.s3_cache_control:
+            extra_args["CacheControl"] = self.config.s3_cache_control
+
+        sidecars = list(extra_uploads)
+        for encoding in encodings:
+            path = artifact_path(feed_path, encoding)
+            if not Path(path).exists():
+                logger.warning(f"No {encoding} artifact at {path}, not uploading it")
+                continue
+            sidecars.append(S3Upload(path, key + ENCODINGS[encoding], dict(extra_args, ContentEncoding=encoding)))
+
+        stats = self.upload_files(sidecars, bucket)
+        stats.add(self.upload_files([S3Upload(feed_path, key, extra_args)], bucket))
+        self.last_upload = stats
 
         url = f"https://{bucket}.s3.amazonaws.com/{key}"
-        logger.info(f"Feed uploaded to S3: {url}")
+        logger.info(
+            f"Feed uploaded to S3: {url} ({stats.files} files, {stats.bytes} bytes "
+            f"in {stats.seconds:.2f}s)"
+        )
         return url
 
     def notify_webhook(self, feed_url: str, webhook_url: str = None) -> bool:
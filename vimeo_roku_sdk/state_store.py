@@ -0,0 +1,457 @@
+"""
+Persistent sync state backends.
+"""
+
+import logging
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterable, Iterator, List
+
+from . import json_codec
+from .atomic_file import atomic_write
+from .exceptions import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class VideoRecord:
+    """What the last sync knew about one video in the feed."""
+    video_id: str
+    modified_time: Optional[datetime] = None
+    content_hash: Optional[str] = None
+    section: Optional[str] = None
+    last_seen_run: int = 0
+    fragment: Optional[str] = None  # Serialized Roku item, reused while content_hash matches
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "VideoRecord":
+        modified_time = data.get("modified_time")
+        return cls(
+            video_id=data["video_id"],
+            modified_time=datetime.fromisoformat(modified_time) if modified_time else None,
+            content_hash=data.get("content_hash"),
+            section=data.get("section"),
+            last_seen_run=data.get("last_seen_run", 0),
+            fragment=data.get("fragment")
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "video_id": self.video_id,
+            "modified_time": self.modified_time.isoformat() if self.modified_time else None,
+            "content_hash": self.content_hash,
+            "section": self.section,
+            "last_seen_run": self.last_seen_run,
+            "fragment": self.fragment
+        }
+
+
+class StateStore(ABC):
+    """
+    Interface for sync state storage.
+
+    A store holds a handful of string values (last sync time, run number)
+    and one VideoRecord per video in the feed. Changes made inside
+    ``transaction()`` are persisted together or not at all.
+    """
+
+    @abstractmethod
+    def get(self, key: str, default: str = None) -> Optional[str]:
+        """Get a stored value."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: Optional[str]):
+        """Store a value (None removes it)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_video(self, video_id: str) -> Optional[VideoRecord]:
+        """Look up the record for a video."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_videos(self) -> Iterator[VideoRecord]:
+        """Iterate over every video record."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def video_count(self) -> int:
+        """Number of video records."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def upsert_videos(self, records: Iterable[VideoRecord]):
+        """Insert or replace video records by ID."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_videos(self, video_ids: Iterable[str]) -> int:
+        """
+        Delete video records.
+
+        Returns:
+            Number of records deleted
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def prune(self, run: int) -> int:
+        """
+        Delete records of videos not seen since before the given run.
+
+        Returns:
+            Number of records deleted
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    @contextmanager
+    def transaction(self):
+        """Group changes so they are saved atomically."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self):
+        """Remove all stored state."""
+        raise NotImplementedError
+
+    def close(self):
+        """Release any resources held by the store."""
+
+
+class JSONStateStore(StateStore):
+    """
+    State kept in memory and saved as a single JSON file.
+
+    The whole file is rewritten on every committed change, so this backend
+    suits small libraries or setups where SQLite is unavailable. With no
+    path, state lives in memory only.
+    """
+
+    def __init__(self, path: str = None):
+        """
+        Initialize the store.
+
+        Args:
+            path: JSON file to load from and save to (optional)
+        """
+        self.path = Path(path) if path else None
+        self._values: Dict[str, str] = {}
+        self._videos: Dict[str, VideoRecord] = {}
+        self._depth = 0
+        self._load()
+
+    def _load(self):
+        if not self.path or not self.path.exists():
+            return
+
+        try:
+            data = json_codec.load(self.path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load sync state: {e}")
+            return
+
+        for key, value in data.items():
+            if key == "videos":
+                for record in value:
+                    self._videos[record["video_id"]] = VideoRecord.from_dict(record)
+            elif key == "synced_video_ids":
+                # Files written before per-video records existed
+                for video_id in value:
+                    self._videos.setdefault(video_id, VideoRecord(video_id=video_id))
+            elif value is not None:
+                self._values[key] = str(value)
+
+    def _commit(self):
+        if self._depth or not self.path:
+            return
+
+        data: Dict[str, Any] = dict(self._values)
+        data["videos"] = [record.to_dict() for record in self._videos.values()]
+
+        with atomic_write(self.path, "wb") as f:
+            f.write(json_codec.dumps(data))
+
+    def get(self, key: str, default: str = None) -> Optional[str]:
+        return self._values.get(key, default)
+
+    def set(self, key: str, value: Optional[str]):
+        if value is None:
+            self._values.pop(key, None)
+        else:
+            self._values[key] = value
+        self._commit()
+
+    def get_video(self, video_id: str) -> Optional[VideoRecord]:
+        return self._videos.get(video_id)
+
+    def iter_videos(self) -> Iterator[VideoRecord]:
+        return iter(list(self._videos.values()))
+
+    def video_count(self) -> int:
+        return len(self._videos)
+
+    def upsert_videos(self, records: Iterable[VideoRecord]):
+        for record in records:
+            self._videos[record.video_id] = record
+        self._commit()
+
+    def delete_videos(self, video_ids: Iterable[str]) -> int:
+        deleted = 0
+        for video_id in video_ids:
+            if self._videos.pop(video_id, None) is not None:
+                deleted += 1
+        self._commit()
+        return deleted
+
+    def prune(self, run: int) -> int:
+        stale = [r.video_id for r in self._videos.values() if r.last_seen_run < run]
+        return self.delete_videos(stale)
+
+    @contextmanager
+    def transaction(self):
+        values = dict(self._values)
+        videos = dict(self._videos)
+        self._depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._values, self._videos = values, videos
+            raise
+        finally:
+            self._depth -= 1
+        self._commit()
+
+    def clear(self):
+        self._values.clear()
+        self._videos.clear()
+        if self.path and self.path.exists():
+            self.path.unlink()
+
+
+class SQLiteStateStore(StateStore):
+    """
+    State kept in an SQLite database.
+
+    Video records are rows keyed by video ID, so lookups and upserts touch
+    only the affected rows and the file never grows beyond the current
+    library. Changes outside ``transaction()`` are committed immediately.
+    """
+
+    SCHEMA_VERSION = 2
+    COLUMNS = "video_id, modified_time, content_hash, section, last_seen_run, fragment"
+
+    def __init__(self, path: str):
+        """
+        Open (and create if needed) the state database.
+
+        Args:
+            path: Database file path, or ":memory:"
+        """
+        self.path = path
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._migrate()
+
+    def _migrate(self):
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= self.SCHEMA_VERSION:
+            return
+
+        with self.transaction():
+            if version < 1:
+                self._create_tables()
+            if version < 2:
+                self._conn.execute("ALTER TABLE videos ADD COLUMN fragment TEXT")
+            self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+    def _create_tables(self):
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS videos (
+                video_id TEXT PRIMARY KEY,
+                modified_time TEXT,
+                content_hash TEXT,
+                section TEXT,
+                last_seen_run INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_videos_last_seen_run ON videos (last_seen_run)"
+        )
+
+    @staticmethod
+    def _to_record(row) -> VideoRecord:
+        video_id, modified_time, digest, section, last_seen_run, fragment = row
+        return VideoRecord(
+            video_id=video_id,
+            modified_time=datetime.fromisoformat(modified_time) if modified_time else None,
+            content_hash=digest,
+            section=section,
+            last_seen_run=last_seen_run,
+            fragment=fragment
+        )
+
+    def get(self, key: str, default: str = None) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set(self, key: str, value: Optional[str]):
+        with self.transaction():
+            if value is None:
+                self._conn.execute("DELETE FROM state WHERE key = ?", (key,))
+            else:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)",
+                    (key, value)
+                )
+
+    def get_video(self, video_id: str) -> Optional[VideoRecord]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {self.COLUMNS} FROM videos WHERE video_id = ?",
+                (video_id,)
+            ).fetchone()
+        return self._to_record(row) if row else None
+
+    def iter_videos(self) -> Iterator[VideoRecord]:
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {self.COLUMNS} FROM videos").fetchall()
+        return (self._to_record(row) for row in rows)
+
+    def video_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM videos").fetchone()[0]
+
+    def upsert_videos(self, records: Iterable[VideoRecord]):
+        rows = (
+            (
+                r.video_id,
+                r.modified_time.isoformat() if r.modified_time else None,
+                r.content_hash,
+                r.section,
+                r.last_seen_run,
+                r.fragment
+            )
+            for r in records
+        )
+        with self.transaction():
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO videos ({self.COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def delete_videos(self, video_ids: Iterable[str]) -> int:
+        with self.transaction():
+            cursor = self._conn.executemany(
+                "DELETE FROM videos WHERE video_id = ?",
+                ((video_id,) for video_id in video_ids)
+            )
+            return max(cursor.rowcount, 0)
+
+    def prune(self, run: int) -> int:
+        with self.transaction():
+            cursor = self._conn.execute("DELETE FROM videos WHERE last_seen_run < ?", (run,))
+            return cursor.rowcount
+
+    @contextmanager
+    def transaction(self):
+        with self._lock:
+            outermost = self._depth == 0
+            if outermost:
+                self._conn.execute("BEGIN IMMEDIATE")
+            self._depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._depth -= 1
+                if outermost:
+                    self._conn.execute("ROLLBACK")
+                raise
+            self._depth -= 1
+            if outermost:
+                self._conn.execute("COMMIT")
+
+    def clear(self):
+        with self.transaction():
+            self._conn.execute("DELETE FROM state")
+            self._conn.execute("DELETE FROM videos")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+STATE_BACKENDS = {
+    "sqlite": ("sync_state.db", SQLiteStateStore),
+    "json": ("sync_state.json", JSONStateStore),
+}
+
+
+def open_state_store(cache_path: str, backend: str = "sqlite") -> StateStore:
+    """
+    Open the sync state store under a cache directory.
+
+    State saved by the JSON backend (including ``sync_state.json`` files
+    from earlier versions) is imported into a new SQLite store once, and
+    the JSON file is kept as ``sync_state.json.migrated``.
+
+    Args:
+        cache_path: Cache directory
+        backend: 'sqlite' or 'json'
+
+    Returns:
+        Open StateStore
+    """
+    if backend not in STATE_BACKENDS:
+        raise ConfigurationError(
+            f"Unknown state backend '{backend}' (choose from: {', '.join(STATE_BACKENDS)})"
+        )
+
+    filename, store_class = STATE_BACKENDS[backend]
+    store = store_class(str(Path(cache_path) / filename))
+
+    legacy_path = Path(cache_path) / STATE_BACKENDS["json"][0]
+    if backend != "json" and legacy_path.exists() and store.get("last_sync") is None:
+        migrate_state(JSONStateStore(str(legacy_path)), store)
+        legacy_path.rename(legacy_path.with_name(legacy_path.name + ".migrated"))
+        logger.info(f"Migrated sync state from {legacy_path}")
+
+    return store
+
+
+def migrate_state(source: StateStore, target: StateStore, keys: List[str] = None):
+    """
+    Copy state values and video records from one store to another.
+
+    Args:
+        source: Store to read from
+        target: Store to write to
+        keys: State keys to copy (defaults to the ones SyncState uses)
+    """
+    keys = keys or ["last_sync", "last_video_count", "run"]
+    with target.transaction():
+        for key in keys:
+            value = source.get(key)
+            if value is not None:
+                target.set(key, value)
+        target.upsert_videos(source.iter_videos())
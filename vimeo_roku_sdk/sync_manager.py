@@ -2,18 +2,32 @@
 Sync manager for orchestrating Vimeo to Roku content synchronization.
 """
 
-import json
+import asyncio
+import dataclasses
 import logging
-from datetime import datetime
+import os
+import pickle
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Set, Tuple, Union, Iterable, Iterator, AsyncIterator
 from dataclasses import dataclass, field
 
 from .vimeo_client import VimeoClient
+from .async_client import AsyncVimeoClient
+from .http_cache import ResponseCache
+from .state_store import StateStore, JSONStateStore, VideoRecord, open_state_store
+from .catalog_store import CATALOG_FILENAME, CatalogStore
 from .roku_feed import RokuFeedGenerator, RokuFeedUploader
-from .models import Video, RokuVideo, VideoType
+from .feed_writer import SectionSpool
+from .models import DEFAULT_MEDIA_POLICY, Video, RokuVideo, RokuFeed, VideoType
 from .config import Config, VimeoConfig, RokuConfig, SyncConfig
 from .exceptions import SyncError, VimeoAPIError, RokuFeedError
+from .tracing import NULL_TRACER, Tracer
+from .timestamps import as_utc
+from .video_filter import FilterBatch, VideoFilter
 
 logger = logging.getLogger(__name__)
 
@@ -24,68 +38,97 @@ class SyncResult:
     success: bool
     videos_processed: int = 0
     videos_added: int = 0
+    videos_updated: int = 0
+    videos_removed: int = 0
     videos_skipped: int = 0
+    skip_reasons: Dict[str, int] = field(default_factory=dict)  # e.g. {"private": 3, "too_short": 1}
     videos_failed: int = 0
+    conversions_reused: int = 0
+    feed_changed: bool = False
     feed_path: Optional[str] = None
     feed_url: Optional[str] = None
     errors: List[str] = field(default_factory=list)
     duration_seconds: float = 0
     timestamp: datetime = field(default_factory=datetime.now)
+    trace: Dict[str, Any] = field(default_factory=dict)  # Tracer.summary() of the run
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "success": self.success,
             "videos_processed": self.videos_processed,
             "videos_added": self.videos_added,
+            "videos_updated": self.videos_updated,
+            "videos_removed": self.videos_removed,
             "videos_skipped": self.videos_skipped,
+            "skip_reasons": self.skip_reasons,
             "videos_failed": self.videos_failed,
+            "conversions_reused": self.conversions_reused,
+            "feed_changed": self.feed_changed,
             "feed_path": self.feed_path,
             "feed_url": self.feed_url,
             "errors": self.errors,
             "duration_seconds": self.duration_seconds,
-            "timestamp": self.timestamp.isoformat()
+            "timestamp": self.timestamp.isoformat(),
+            "trace": self.trace
+        }
+
+
+@dataclass
+class MultiChannelResult:
+    """Result of a multi-channel sync."""
+    success: bool
+    videos_fetched: int = 0
+    channels: Dict[str, SyncResult] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)  # Errors fetching the shared catalog
+    duration_seconds: float = 0
+    timestamp: datetime = field(default_factory=datetime.now)
+    trace: Dict[str, Any] = field(default_factory=dict)  # Tracer.summary() of the shared fetch
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "success": self.success,
+            "videos_fetched": self.videos_fetched,
+            "channels": {name: result.to_dict() for name, result in self.channels.items()},
+            "errors": self.errors,
+            "duration_seconds": self.duration_seconds,
+            "timestamp": self.timestamp.isoformat(),
+            "trace": self.trace
         }
 
 
 @dataclass
 class SyncState:
-    """Persistent state for incremental syncs."""
+    """Summary of the last sync, persisted in the state store."""
     last_sync: Optional[datetime] = None
     last_video_count: int = 0
-    synced_video_ids: List[str] = field(default_factory=list)
+    run: int = 0
+    feed_digest: Optional[str] = None  # Content of the last saved feed
+    published_digest: Optional[str] = None  # Content of the last uploaded feed
 
     @classmethod
-    def load(cls, filepath: str) -> "SyncState":
-        """Load state from a JSON file."""
-        path = Path(filepath)
-        if not path.exists():
-            return cls()
-
+    def load(cls, store: StateStore) -> "SyncState":
+        """Load state from a state store."""
+        last_sync = store.get("last_sync")
         try:
-            with open(path, "r") as f:
-                data = json.load(f)
             return cls(
-                last_sync=datetime.fromisoformat(data["last_sync"]) if data.get("last_sync") else None,
-                last_video_count=data.get("last_video_count", 0),
-                synced_video_ids=data.get("synced_video_ids", [])
+                last_sync=as_utc(datetime.fromisoformat(last_sync)) if last_sync else None,
+                last_video_count=int(store.get("last_video_count", "0")),
+                run=int(store.get("run", "0")),
+                feed_digest=store.get("feed_digest"),
+                published_digest=store.get("published_digest")
             )
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
+        except ValueError as e:
             logger.warning(f"Failed to load sync state: {e}")
             return cls()
 
-    def save(self, filepath: str):
-        """Save state to a JSON file."""
-        path = Path(filepath)
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        data = {
-            "last_sync": self.last_sync.isoformat() if self.last_sync else None,
-            "last_video_count": self.last_video_count,
-            "synced_video_ids": self.synced_video_ids
-        }
-
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2)
+    def save(self, store: StateStore):
+        """Save state to a state store."""
+        with store.transaction():
+            store.set("last_sync", self.last_sync.isoformat() if self.last_sync else None)
+            store.set("last_video_count", str(self.last_video_count))
+            store.set("run", str(self.run))
+            store.set("feed_digest", self.feed_digest)
+            store.set("published_digest", self.published_digest)
 
 
 class SyncManager:
@@ -100,13 +143,15 @@ class SyncManager:
     - Uploading to S3 (optional)
     - Webhook notifications (optional)
     - Incremental syncs with state persistence
+    - Serving the full library from a local catalog mirror (optional)
     """
 
     def __init__(
         self,
         config: Config = None,
         vimeo_client: VimeoClient = None,
-        feed_generator: RokuFeedGenerator = None
+        feed_generator: RokuFeedGenerator = None,
+        async_vimeo_client: AsyncVimeoClient = None
     ):
         """
         Initialize the sync manager.
@@ -115,22 +160,52 @@ class SyncManager:
             config: Configuration object
             vimeo_client: Pre-configured Vimeo client (optional)
             feed_generator: Pre-configured feed generator (optional)
+            async_vimeo_client: Pre-configured async Vimeo client for sync_async (optional)
         """
         self.config = config or Config()
 
         # Initialize clients
-        self.vimeo = vimeo_client or VimeoClient(config=self.config.vimeo)
-        self.feed_generator = feed_generator or RokuFeedGenerator(config=self.config.roku)
+        self.response_cache = self._create_response_cache()
+        self.vimeo = vimeo_client or VimeoClient(
+            config=self.config.vimeo,
+            response_cache=self.response_cache
+        )
+        self.async_vimeo = async_vimeo_client
+        # The top-level provider may be left unset when only channels are synced
+        if feed_generator is None and (self.config.roku.provider_name or not self.config.channels):
+            feed_generator = RokuFeedGenerator(config=self.config.roku)
+        self.feed_generator = feed_generator
         self.uploader = RokuFeedUploader(config=self.config.roku)
 
         # State for incremental syncs
-        self._state_path = Path(self.config.sync.cache_path) / "sync_state.json"
+        self._state_store: Optional[StateStore] = None
         self._state: Optional[SyncState] = None
 
+        # Local mirror of the library (sync.catalog_enabled), opened on first use
+        self._catalog: Optional[CatalogStore] = None
+
+        # Tracer of the sync in progress
+        self.tracer: Tracer = NULL_TRACER
+
+        # Filter of the sync in progress, compiled from config.sync
+        self._video_filter: VideoFilter = self._compile_filter()
+
+        # Managers of config.channels, created on first use
+        self._channel_managers: Optional[Dict[str, "SyncManager"]] = None
+
         # Callbacks
         self._on_video_processed: Optional[Callable[[Video, bool], None]] = None
         self._on_progress: Optional[Callable[[int, int], None]] = None
 
+    def _create_response_cache(self) -> Optional[ResponseCache]:
+        """Create the on-disk cache for conditional Vimeo requests, if enabled."""
+        if not self.config.sync.cache_enabled or not self.config.sync.http_cache_max_mb:
+            return None
+        return ResponseCache(
+            str(Path(self.config.sync.cache_path) / "http"),
+            max_bytes=self.config.sync.http_cache_max_mb * 1024 * 1024
+        )
+
     def set_callbacks(
         self,
         on_video_processed: Callable[[Video, bool], None] = None,
@@ -146,66 +221,79 @@ class SyncManager:
         self._on_video_processed = on_video_processed
         self._on_progress = on_progress
 
-    def _load_state(self) -> SyncState:
-        """Load sync state from disk."""
-        if self._state is None:
+    @property
+    def state_store(self) -> StateStore:
+        """The store holding sync state (kept in memory if caching is disabled)."""
+        if self._state_store is None:
             if self.config.sync.cache_enabled:
-                self._state = SyncState.load(str(self._state_path))
+                self._state_store = open_state_store(
+                    self.config.sync.cache_path,
+                    self.config.sync.state_backend
+                )
             else:
-                self._state = SyncState()
-        return self._state
-
-    def _save_state(self):
-        """Save sync state to disk."""
-        if self._state and self.config.sync.cache_enabled:
-            self._state.save(str(self._state_path))
+                self._state_store = JSONStateStore()
+        return self._state_store
+
+    @property
+    def catalog(self) -> Optional[CatalogStore]:
+        """The local library mirror, or None unless sync.catalog_enabled (and caching) is on."""
+        if self._catalog is None and self.config.sync.catalog_enabled and self.config.sync.cache_enabled:
+            self._catalog = CatalogStore(
+                str(Path(self.config.sync.cache_path) / CATALOG_FILENAME),
+                policy=getattr(self.vimeo, "media_policy", DEFAULT_MEDIA_POLICY)
+            )
+        return self._catalog
 
-    def _should_include_video(self, video: Video) -> bool:
+    def refresh_catalog(self, full: bool = False) -> CatalogStore:
         """
-        Check if a video should be included based on filter criteria.
+        Bring the local catalog up to date with the Vimeo library.
 
         Args:
-            video: Video to check
+            full: Crawl the whole library rather than only recent changes
 
         Returns:
-            True if video should be included
+            The refreshed CatalogStore
+
+        Raises:
+            SyncError: If the catalog is not enabled
         """
-        # Check privacy
-        if not self.config.sync.include_private and video.privacy != "anybody":
-            logger.debug(f"Skipping private video: {video.title}")
-            return False
+        catalog = self.catalog
+        if catalog is None:
+            raise SyncError("The catalog is not enabled (set sync.catalog_enabled and sync.cache_enabled)")
+        with self.tracer.span("catalog_refresh") as span:
+            span.update(catalog.refresh(self.vimeo, full=full).to_dict())
+        return catalog
 
-        # Check duration
-        if video.duration < self.config.sync.min_duration:
-            logger.debug(f"Skipping short video: {video.title} ({video.duration}s)")
-            return False
+    def _load_state(self) -> SyncState:
+        """Load sync state from the state store."""
+        if self._state is None:
+            self._state = SyncState.load(self.state_store)
+        return self._state
 
-        if self.config.sync.max_duration and video.duration > self.config.sync.max_duration:
-            logger.debug(f"Skipping long video: {video.title} ({video.duration}s)")
-            return False
+    def _compile_filter(self) -> VideoFilter:
+        """Compile the filter options of the sync settings, once per sync."""
+        return VideoFilter.from_config(self.config.sync)
 
-        # Check include tags
-        if self.config.sync.include_tags:
-            video_tags = [t.lower() for t in video.tags]
-            include_tags = [t.lower() for t in self.config.sync.include_tags]
-            if not any(tag in video_tags for tag in include_tags):
-                logger.debug(f"Skipping video without required tags: {video.title}")
-                return False
-
-        # Check exclude tags
-        if self.config.sync.exclude_tags:
-            video_tags = [t.lower() for t in video.tags]
-            exclude_tags = [t.lower() for t in self.config.sync.exclude_tags]
-            if any(tag in video_tags for tag in exclude_tags):
-                logger.debug(f"Skipping video with excluded tag: {video.title}")
-                return False
-
-        # Check for playable content
-        if not video.get_best_video_file():
-            logger.warning(f"Skipping video without playable content: {video.title}")
-            return False
+    def _filter_batch(self, videos: List[Video], result: SyncResult) -> FilterBatch:
+        """
+        Filter a batch of videos, recording the skipped ones on the result.
 
-        return True
+        Returns:
+            FilterBatch with the videos to convert
+        """
+        batch = self._video_filter.partition(videos)
+        self._record_skipped(result, batch.skipped, batch.reasons)
+        return batch
+
+    def _record_skipped(self, result: SyncResult, videos: List[Video], reasons: Dict[str, int]):
+        """Count filtered-out videos, and their skip reasons, on the result."""
+        result.videos_processed += len(videos)
+        result.videos_skipped += len(videos)
+        for reason, count in reasons.items():
+            result.skip_reasons[reason] = result.skip_reasons.get(reason, 0) + count
+        if self._on_video_processed:
+            for video in videos:
+                self._on_video_processed(video, False)
 
     def _determine_video_type(self, video: Video) -> VideoType:
         """Determine the Roku video type based on duration."""
@@ -223,6 +311,9 @@ class SyncManager:
         """
         Fetch videos from Vimeo.
 
+        With sync.catalog_enabled, the whole library ('all') is read from
+        the local catalog after refreshing it with recent changes.
+
         Args:
             source: Video source ('all', 'album', 'folder')
             album_id: Album ID if source is 'album'
@@ -250,12 +341,59 @@ class SyncManager:
                 if limit and len(videos) >= limit:
                     break
 
+        elif self.catalog:
+            videos = self.refresh_catalog().query(limit=limit)
+
         else:  # all
             videos = self.vimeo.get_all_videos(limit=limit)
 
         logger.info(f"Fetched {len(videos)} videos from Vimeo")
         return videos
 
+    async def fetch_videos_async(
+        self,
+        vimeo: AsyncVimeoClient,
+        source: str = "all",
+        album_id: str = None,
+        folder_id: str = None,
+        limit: int = None
+    ) -> List[Video]:
+        """
+        Fetch videos from Vimeo with the async client.
+
+        Args:
+            vimeo: Async Vimeo client to fetch with
+            source: Video source ('all', 'album', 'folder')
+            album_id: Album ID if source is 'album'
+            folder_id: Folder ID if source is 'folder'
+            limit: Maximum number of videos to fetch
+
+        Returns:
+            List of Video objects
+        """
+        logger.info(f"Fetching videos from Vimeo (source: {source})...")
+
+        if source == "album":
+            album_id = album_id or self.config.vimeo.album_id
+            videos_iter = vimeo.iter_album_videos(album_id=album_id)
+        elif source == "folder":
+            folder_id = folder_id or self.config.vimeo.folder_id
+            videos_iter = vimeo.iter_folder_videos(folder_id=folder_id)
+        else:  # all
+            videos_iter = vimeo.iter_all_videos()
+
+        videos = []
+        try:
+            async for video in videos_iter:
+                videos.append(video)
+                if limit and len(videos) >= limit:
+                    break
+        finally:
+            await videos_iter.aclose()
+
+        logger.info(f"Fetched {len(videos)} videos from Vimeo")
+        return videos
+
     def sync(
         self,
         source: str = "all",
@@ -263,11 +401,21 @@ class SyncManager:
         folder_id: str = None,
         incremental: bool = False,
         upload: bool = False,
-        notify: bool = False
+        notify: bool = False,
+        streaming: bool = None
     ) -> SyncResult:
         """
         Perform a full sync from Vimeo to Roku.
 
+        An incremental sync loads the previously saved feed and merges in
+        only the videos modified since the last sync, removing videos that
+        were deleted, left the album/folder or no longer pass the filters.
+        Without a previous feed it falls back to a full rebuild.
+
+        A streaming full rebuild converts each video as its page arrives and
+        spools it to disk, so memory use stays around a few pages of videos
+        however large the library is. The in-memory feed is left empty.
+
         Args:
             source: Video source ('all', 'album', 'folder')
             album_id: Album ID if source is 'album'
@@ -275,109 +423,835 @@ class SyncManager:
             incremental: Only sync videos modified since last sync
             upload: Upload feed to S3 after generating
             notify: Send webhook notification after sync
+            streaming: Stream full rebuilds (defaults to sync.streaming)
 
         Returns:
             SyncResult with details of the operation
+
+        Raises:
+            ValueError: If only channels are configured (see sync_channels)
         """
+        self._check_single_feed(incremental)
         start_time = datetime.now()
+        started_at = datetime.now(timezone.utc)
         result = SyncResult(success=False)
 
         try:
-            # Load state for incremental sync
-            state = self._load_state()
+            with self._traced(result, self.vimeo) as tracer:
+                self._video_filter = self._compile_filter()
+                # Load state for incremental sync
+                state = self._load_state()
+
+                if self._can_merge(incremental, state):
+                    logger.info(f"Performing incremental sync since {state.last_sync}")
+                    if source == "all" and self.catalog:
+                        catalog = self.refresh_catalog()
+                        changed = catalog.query(modified_since=state.last_sync)
+                        current_ids = catalog.video_ids() if self.config.sync.detect_deletions else None
+                    else:
+                        with tracer.span("fetch_changes"):
+                            changed = self.vimeo.get_videos_modified_since(state.last_sync)
+                        with tracer.span("list_ids"):
+                            current_ids = self._fetch_current_ids(self.vimeo, source, album_id, folder_id)
+                        joined_ids = self._joined_ids(source, changed, current_ids)
+                        if joined_ids:
+                            with tracer.span("fetch_joined", videos=len(joined_ids)):
+                                changed = changed + self._fetch_videos_by_id(joined_ids, result)
+                    with tracer.span("convert", videos=len(changed)):
+                        records, removed_ids = self._merge_changes(changed, current_ids, result)
+                    self._publish(state, result, started_at, upload, notify, records, removed_ids)
+
+                elif self._is_streaming(streaming):
+                    with self.state_store.transaction(), _FeedStream(self, state, result) as stream:
+                        with tracer.span("stream"):
+                            for video in self._iter_source(self.vimeo, source, album_id, folder_id, stream.set_total):
+                                stream.add(video)
+                            feed_path = stream.finish()
+                        self._publish(
+                            state, result, started_at, upload, notify, [],
+                            feed_path=feed_path, video_count=result.videos_added
+                        )
+
+                else:
+                    with tracer.span("fetch") as span:
+                        videos = self.fetch_videos(source, album_id, folder_id)
+                        span["videos"] = len(videos)
+                    with tracer.span("convert", videos=len(videos)):
+                        records = self._rebuild_feed(videos, result)
+                    self._publish(state, result, started_at, upload, notify, records)
 
-            # Reset feed generator
-            self.feed_generator.reset()
+        except Exception as e:
+            self._state = None  # Reload the state the store rolled back to
+            self._record_sync_error(result, e)
 
-            # Fetch videos
-            if incremental and state.last_sync:
-                logger.info(f"Performing incremental sync since {state.last_sync}")
-                videos = self.vimeo.get_videos_modified_since(state.last_sync)
-            else:
-                videos = self.fetch_videos(source, album_id, folder_id)
+        finally:
+            result.duration_seconds = (datetime.now() - start_time).total_seconds()
 
-            total_videos = len(videos)
-            logger.info(f"Processing {total_videos} videos...")
+        return result
 
-            # Process each video
-            for idx, video in enumerate(videos):
-                result.videos_processed += 1
+    async def sync_async(
+        self,
+        source: str = "all",
+        album_id: str = None,
+        folder_id: str = None,
+        incremental: bool = False,
+        upload: bool = False,
+        notify: bool = False,
+        streaming: bool = None
+    ) -> SyncResult:
+        """
+        Perform a full sync using the asyncio Vimeo client.
 
-                if self._on_progress:
-                    self._on_progress(idx + 1, total_videos)
+        Takes the same arguments as sync(). Videos are fetched on the running
+        event loop with many requests in flight; filtering, feed generation
+        and publishing then proceed exactly as in sync().
 
-                try:
-                    # Check if video should be included
-                    if not self._should_include_video(video):
-                        result.videos_skipped += 1
-                        if self._on_video_processed:
-                            self._on_video_processed(video, False)
-                        continue
+        Returns:
+            SyncResult with details of the operation
 
-                    # Determine video type and add to feed
-                    video_type = self._determine_video_type(video)
-                    self.feed_generator.add_video(video, video_type)
+        Raises:
+            ValueError: If only channels are configured (see sync_channels)
+        """
+        self._check_single_feed(incremental)
+        start_time = datetime.now()
+        started_at = datetime.now(timezone.utc)
+        result = SyncResult(success=False)
+        vimeo = self.async_vimeo or AsyncVimeoClient(
+            config=self.config.vimeo,
+            response_cache=self.response_cache
+        )
 
-                    result.videos_added += 1
-                    state.synced_video_ids.append(video.id)
+        try:
+            with self._traced(result, vimeo) as tracer:
+                self._video_filter = self._compile_filter()
+                # Load state for incremental sync
+                state = self._load_state()
+
+                if self._can_merge(incremental, state):
+                    logger.info(f"Performing incremental sync since {state.last_sync}")
+                    with tracer.span("fetch_changes"):
+                        changed = await vimeo.get_videos_modified_since(state.last_sync)
+                    with tracer.span("list_ids"):
+                        current_ids = await self._fetch_current_ids_async(vimeo, source, album_id, folder_id)
+                    joined_ids = self._joined_ids(source, changed, current_ids)
+                    if joined_ids:
+                        with tracer.span("fetch_joined", videos=len(joined_ids)):
+                            changed = changed + await self._fetch_videos_by_id_async(vimeo, joined_ids, result)
+                    with tracer.span("convert", videos=len(changed)):
+                        records, removed_ids = self._merge_changes(changed, current_ids, result)
+                    self._publish(state, result, started_at, upload, notify, records, removed_ids)
+
+                elif self._is_streaming(streaming):
+                    with self.state_store.transaction(), _FeedStream(self, state, result) as stream:
+                        with tracer.span("stream"):
+                            videos = self._iter_source(vimeo, source, album_id, folder_id, stream.set_total)
+                            try:
+                                async for video in videos:
+                                    stream.add(video)
+                            finally:
+                                await videos.aclose()
+                            feed_path = stream.finish()
+                        self._publish(
+                            state, result, started_at, upload, notify, [],
+                            feed_path=feed_path, video_count=result.videos_added
+                        )
+
+                else:
+                    with tracer.span("fetch") as span:
+                        videos = await self.fetch_videos_async(vimeo, source, album_id, folder_id)
+                        span["videos"] = len(videos)
+                    with tracer.span("convert", videos=len(videos)):
+                        records = self._rebuild_feed(videos, result)
+                    self._publish(state, result, started_at, upload, notify, records)
 
-                    if self._on_video_processed:
-                        self._on_video_processed(video, True)
+        except Exception as e:
+            self._state = None  # Reload the state the store rolled back to
+            self._record_sync_error(result, e)
 
-                except Exception as e:
-                    logger.error(f"Failed to process video {video.id}: {e}")
-                    result.videos_failed += 1
-                    result.errors.append(f"Video {video.id}: {str(e)}")
+        finally:
+            if vimeo is not self.async_vimeo:
+                await vimeo.close()
+            result.duration_seconds = (datetime.now() - start_time).total_seconds()
 
-            # Validate and save feed
-            validation_errors = self.feed_generator.validate()
-            if validation_errors:
-                for error in validation_errors:
-                    result.errors.append(f"Validation: {error}")
+        return result
 
-            feed_path = self.feed_generator.save()
-            result.feed_path = feed_path
+    def sync_videos(
+        self,
+        videos: Iterable[Video],
+        upload: bool = False,
+        notify: bool = False,
+        streaming: bool = None,
+        started_at: datetime = None
+    ) -> SyncResult:
+        """
+        Rebuild, save and publish the feed from videos fetched elsewhere.
 
-            # Upload to S3 if requested
-            if upload and self.config.roku.s3_bucket:
-                try:
-                    result.feed_url = self.uploader.upload_to_s3(feed_path)
-                except Exception as e:
-                    logger.error(f"Failed to upload to S3: {e}")
-                    result.errors.append(f"S3 upload: {str(e)}")
+        This is the full-rebuild part of sync(), for callers that already
+        have the catalog, such as multi-channel syncs.
 
-            # Send webhook notification if requested
-            if notify and result.feed_url:
-                self.uploader.notify_webhook(result.feed_url)
+        Args:
+            videos: Videos to build the feed from (iterated once)
+            upload: Upload feed to S3 after generating
+            notify: Send webhook notification after sync
+            streaming: Convert and spool the videos one at a time instead
+                of building the feed in memory (defaults to sync.streaming)
+            started_at: When fetching the videos started (UTC), recorded as
+                the sync time so the next incremental sync misses no edits
 
-            # Update state
-            state.last_sync = datetime.now()
-            state.last_video_count = result.videos_added
-            self._save_state()
+        Returns:
+            SyncResult with details of the operation
+        """
+        start_time = datetime.now()
+        started_at = started_at or datetime.now(timezone.utc)
+        result = SyncResult(success=False)
 
-            result.success = True
-            logger.info(
-                f"Sync completed: {result.videos_added} added, "
-                f"{result.videos_skipped} skipped, {result.videos_failed} failed"
-            )
+        try:
+            with self._traced(result) as tracer:
+                self._video_filter = self._compile_filter()
+                state = self._load_state()
+
+                if self._is_streaming(streaming):
+                    with self.state_store.transaction(), _FeedStream(self, state, result) as stream:
+                        if hasattr(videos, "__len__"):
+                            stream.set_total(len(videos))
+                        with tracer.span("stream"):
+                            for video in videos:
+                                stream.add(video)
+                            feed_path = stream.finish()
+                        self._publish(
+                            state, result, started_at, upload, notify, [],
+                            feed_path=feed_path, video_count=result.videos_added
+                        )
+
+                else:
+                    videos = list(videos)
+                    with tracer.span("convert", videos=len(videos)):
+                        records = self._rebuild_feed(videos, result)
+                    self._publish(state, result, started_at, upload, notify, records)
+
+        except Exception as e:
+            self._state = None  # Reload the state the store rolled back to
+            self._record_sync_error(result, e)
+
+        finally:
+            result.duration_seconds = (datetime.now() - start_time).total_seconds()
 
-        except VimeoAPIError as e:
-            logger.error(f"Vimeo API error during sync: {e}")
-            result.errors.append(f"Vimeo API: {str(e)}")
+        return result
+
+    def channel_managers(self) -> Dict[str, "SyncManager"]:
+        """Sync managers for config.channels, keyed by channel name."""
+        if self._channel_managers is None:
+            self._channel_managers = {
+                channel.name: SyncManager(
+                    config=Config(
+                        vimeo=self.config.vimeo,
+                        roku=channel.roku,
+                        # Channels fetch nothing themselves, so need no HTTP cache or catalog
+                        sync=dataclasses.replace(channel.sync, http_cache_max_mb=0, catalog_enabled=False)
+                    ),
+                    vimeo_client=self.vimeo
+                )
+                for channel in self.config.channels
+            }
+        return self._channel_managers
+
+    def sync_channels(
+        self,
+        source: str = "all",
+        album_id: str = None,
+        folder_id: str = None,
+        upload: bool = False,
+        notify: bool = False,
+        streaming: bool = None
+    ) -> MultiChannelResult:
+        """
+        Sync every channel in config.channels from one crawl of the source.
 
-        except RokuFeedError as e:
-            logger.error(f"Roku feed error during sync: {e}")
-            result.errors.append(f"Roku feed: {str(e)}")
+        The videos are fetched and parsed once. Each channel then filters
+        and converts them with its own settings and saves and publishes
+        its own feed, up to sync.channel_workers channels at a time, so
+        API calls and parsing do not grow with the number of channels.
+        Streaming syncs spool the parsed videos to a temporary file rather
+        than holding them in memory, and every channel streams from it.
+
+        Channel feeds are always rebuilt in full; each channel still reuses
+        the conversions recorded by its previous sync.
+
+        Args:
+            source: Video source ('all', 'album', 'folder')
+            album_id: Album ID if source is 'album'
+            folder_id: Folder ID if source is 'folder'
+            upload: Upload each channel's feed to S3
+            notify: Send each channel's webhook notification
+            streaming: Spool the catalog to disk (defaults to sync.streaming)
+
+        Returns:
+            MultiChannelResult with each channel's SyncResult
+
+        Raises:
+            SyncError: If no channels are configured
+        """
+        if not self.config.channels:
+            raise SyncError("No channels configured")
+
+        start_time = datetime.now()
+        started_at = datetime.now(timezone.utc)
+        result = MultiChannelResult(success=False)
+        streaming = self._is_streaming(streaming)
+
+        try:
+            with self._traced(result, self.vimeo) as tracer, ExitStack() as stack:
+                with tracer.span("fetch") as span:
+                    if streaming:
+                        videos = stack.enter_context(_VideoSpool())
+                        for video in self._iter_source(self.vimeo, source, album_id, folder_id):
+                            videos.add(video)
+                    else:
+                        videos = self.fetch_videos(source, album_id, folder_id)
+                    span["videos"] = result.videos_fetched = len(videos)
+
+                managers = self.channel_managers()
+                logger.info(f"Building {len(managers)} channel feeds from {len(videos)} videos...")
+                with tracer.span("channels", channels=len(managers)):
+                    result.channels = self._run_channels(managers, videos, upload, notify, streaming, started_at)
+
+            result.success = all(channel.success for channel in result.channels.values())
 
         except Exception as e:
-            logger.error(f"Unexpected error during sync: {e}")
-            result.errors.append(f"Unexpected: {str(e)}")
+            self._record_sync_error(result, e)
 
         finally:
             result.duration_seconds = (datetime.now() - start_time).total_seconds()
 
         return result
 
+    def _run_channels(
+        self,
+        managers: Dict[str, "SyncManager"],
+        videos: Iterable[Video],
+        upload: bool,
+        notify: bool,
+        streaming: bool,
+        started_at: datetime
+    ) -> Dict[str, SyncResult]:
+        """Build and publish each channel's feed from the shared videos."""
+        workers = max(1, min(self.config.sync.channel_workers, len(managers)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="channel") as executor:
+            futures = {
+                name: executor.submit(
+                    manager.sync_videos, videos,
+                    upload=upload, notify=notify, streaming=streaming, started_at=started_at
+                )
+                for name, manager in managers.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
+
+    @contextmanager
+    def _traced(self, result: Union[SyncResult, MultiChannelResult], *clients) -> Iterator[Tracer]:
+        """
+        Trace a sync run with a fresh tracer shared with the Vimeo clients.
+
+        The tracer's summary is recorded on the result, and its spans are
+        exported to sync.trace_path if that is set.
+
+        Args:
+            result: Result to record the trace summary on
+            *clients: Vimeo clients making this run's requests
+
+        Yields:
+            The run's tracer
+        """
+        tracer = Tracer()
+        previous = [(client, getattr(client, "tracer", NULL_TRACER)) for client in clients]
+        for client in clients:
+            client.tracer = tracer
+        self.tracer = tracer
+
+        try:
+            with tracer.span("sync"):
+                yield tracer
+        finally:
+            self.tracer = NULL_TRACER
+            for client, client_tracer in previous:
+                client.tracer = client_tracer
+                self._trace_rate_limit(tracer, client)
+            result.trace = tracer.summary()
+
+            trace_path = self.config.sync.trace_path
+            if trace_path:
+                try:
+                    tracer.export_chrome_trace(trace_path)
+                    logger.info(f"Trace written to {trace_path}")
+                except OSError as e:
+                    logger.warning(f"Failed to write trace to {trace_path}: {e}")
+
+    @staticmethod
+    def _trace_rate_limit(tracer: Tracer, client):
+        """Record the rate-limit budget a client was left with."""
+        limiter = getattr(client, "rate_limiter", None)
+        if getattr(limiter, "remaining", None) is None:
+            return
+        tracer.gauge("rate_limit.remaining", limiter.remaining)
+        if limiter.limit is not None:
+            tracer.gauge("rate_limit.limit", limiter.limit)
+
+    @staticmethod
+    def _trace_upload(tracer: Tracer, stats):
+        """Record the size and throughput of an S3 upload."""
+        if stats is None:
+            return
+        tracer.count("upload.files", stats.files)
+        tracer.count("upload.bytes", stats.bytes)
+        if stats.bytes_per_second is not None:
+            tracer.gauge("upload.bytes_per_second", stats.bytes_per_second)
+
+    def _previous_digest(self, state: SyncState) -> Optional[str]:
+        """Digest of the saved feed a new one may be compared with."""
+        return state.feed_digest if self.config.sync.skip_unchanged else None
+
+    def _is_streaming(self, streaming: Optional[bool]) -> bool:
+        return self.config.sync.streaming if streaming is None else streaming
+
+    def _iter_source(
+        self,
+        vimeo: Union[VimeoClient, AsyncVimeoClient],
+        source: str,
+        album_id: str = None,
+        folder_id: str = None,
+        on_total: Callable[[int], None] = None
+    ) -> Union[Iterator[Video], AsyncIterator[Video]]:
+        """Iterate over a source's videos with either client."""
+        if source == "album":
+            return vimeo.iter_album_videos(
+                album_id=album_id or self.config.vimeo.album_id,
+                on_total=on_total
+            )
+        if source == "folder":
+            return vimeo.iter_folder_videos(
+                folder_id=folder_id or self.config.vimeo.folder_id,
+                on_total=on_total
+            )
+        if vimeo is self.vimeo and self.catalog:
+            catalog = self.refresh_catalog()
+            if on_total:
+                on_total(catalog.count())
+            return catalog.iter_videos()
+        return vimeo.iter_all_videos(on_total=on_total)
+
+    def _check_single_feed(self, incremental: bool):
+        """Reject sync() and sync_async() when there is no top-level feed to build."""
+        if self.feed_generator is not None:
+            return
+        if incremental:
+            raise ValueError(
+                "Incremental syncs are not supported with channels; "
+                "channel feeds are always rebuilt in full by sync_channels()"
+            )
+        raise ValueError("Only channels are configured; use sync_channels()")
+
+    def _can_merge(self, incremental: bool, state: SyncState) -> bool:
+        """Check whether an incremental sync can update the previous feed."""
+        if not incremental:
+            return False
+        if not state.last_sync:
+            logger.info("No previous sync recorded, performing full sync")
+            return False
+        if not self.feed_generator.load():
+            logger.info("No previous feed to update, performing full sync")
+            return False
+        return True
+
+    def _fetch_current_ids(
+        self,
+        vimeo: VimeoClient,
+        source: str,
+        album_id: str = None,
+        folder_id: str = None
+    ) -> Optional[Set[str]]:
+        """
+        List the IDs of every video currently in the source.
+
+        Returns:
+            Set of video IDs, or None if deletions are not being detected
+        """
+        if source == "album":
+            return vimeo.get_album_video_ids(album_id or self.config.vimeo.album_id)
+        if source == "folder":
+            return vimeo.get_folder_video_ids(folder_id or self.config.vimeo.folder_id)
+        if self.config.sync.detect_deletions:
+            return vimeo.get_video_ids()
+        return None
+
+    async def _fetch_current_ids_async(
+        self,
+        vimeo: AsyncVimeoClient,
+        source: str,
+        album_id: str = None,
+        folder_id: str = None
+    ) -> Optional[Set[str]]:
+        """Async counterpart of _fetch_current_ids()."""
+        if source == "album":
+            return await vimeo.get_album_video_ids(album_id or self.config.vimeo.album_id)
+        if source == "folder":
+            return await vimeo.get_folder_video_ids(folder_id or self.config.vimeo.folder_id)
+        if self.config.sync.detect_deletions:
+            return await vimeo.get_video_ids()
+        return None
+
+    def _joined_ids(
+        self,
+        source: str,
+        changed: List[Video],
+        current_ids: Optional[Set[str]]
+    ) -> Set[str]:
+        """
+        IDs of videos that joined the album or folder without being modified.
+
+        Adding a video to an album or folder does not change its
+        modified_time, so the "modified since" scan misses it. Videos the
+        filters left out of the feed are listed here too and are fetched
+        again on each incremental sync.
+
+        Returns:
+            IDs in the source that are neither in the loaded feed nor changed
+        """
+        if source not in ("album", "folder") or current_ids is None:
+            return set()
+        in_feed = {
+            roku_id[len("vimeo-"):] for roku_id in self.feed_generator.feed.video_ids()
+            if roku_id.startswith("vimeo-")
+        }
+        return current_ids - in_feed - {video.id for video in changed}
+
+    def _fetch_videos_by_id(self, video_ids: Set[str], result: SyncResult) -> List[Video]:
+        """Fetch videos one by one, recording the ones that fail on the result."""
+        logger.info(f"Fetching {len(video_ids)} videos that joined the source...")
+        videos = []
+        for video_id in sorted(video_ids):
+            try:
+                videos.append(self.vimeo.get_video(video_id))
+            except VimeoAPIError as e:
+                self._record_fetch_error(result, video_id, e)
+        return videos
+
+    async def _fetch_videos_by_id_async(
+        self,
+        vimeo: AsyncVimeoClient,
+        video_ids: Set[str],
+        result: SyncResult
+    ) -> List[Video]:
+        """Async counterpart of _fetch_videos_by_id(), fetching concurrently."""
+        logger.info(f"Fetching {len(video_ids)} videos that joined the source...")
+        video_ids = sorted(video_ids)
+        fetched = await asyncio.gather(
+            *(vimeo.get_video(video_id) for video_id in video_ids),
+            return_exceptions=True
+        )
+        videos = []
+        for video_id, video in zip(video_ids, fetched):
+            if isinstance(video, VimeoAPIError):
+                self._record_fetch_error(result, video_id, video)
+            elif isinstance(video, BaseException):
+                raise video
+            else:
+                videos.append(video)
+        return videos
+
+    @staticmethod
+    def _record_fetch_error(result: SyncResult, video_id: str, error: Exception):
+        logger.error(f"Failed to fetch video {video_id}: {error}")
+        result.videos_failed += 1
+        result.errors.append(f"Video {video_id}: {error}")
+
+    def _rebuild_feed(self, videos: List[Video], result: SyncResult) -> List[VideoRecord]:
+        """
+        Build a new feed from the full list of fetched videos.
+
+        Returns:
+            State records for the videos in the feed
+        """
+        # Reset feed generator
+        self.feed_generator.reset()
+        cached = self._cached_records()
+        records = []
+
+        videos = self._filter_batch(videos, result).included
+        total_videos = len(videos)
+        logger.info(f"Processing {total_videos} videos ({result.videos_skipped} filtered out)...")
+
+        for idx, video in enumerate(videos):
+            if self._on_progress:
+                self._on_progress(idx + 1, total_videos)
+
+            converted = self._convert_video(video, result, cached.get(video.id), filtered=True)
+            if converted:
+                roku_video, record = converted
+                self.feed_generator.feed.add_video(roku_video)
+                records.append(record)
+                result.videos_added += 1
+
+        return records
+
+    def _merge_changes(
+        self,
+        videos: List[Video],
+        current_ids: Optional[Set[str]],
+        result: SyncResult
+    ) -> Tuple[List[VideoRecord], Set[str]]:
+        """
+        Merge changed videos into the loaded feed.
+
+        Args:
+            videos: Videos modified since the last sync
+            current_ids: IDs of every video in the source, used to drop
+                deleted videos (None to keep videos that are not listed)
+            result: Result to record counts on
+
+        Returns:
+            State records for the upserted videos, and the Roku IDs removed
+        """
+        cached = self._cached_records()
+        self._reuse_fragments(cached)
+        upserts = []
+        records = []
+        removed_ids = set()
+
+        if current_ids is not None:
+            # Modified videos outside the album/folder are not part of this feed
+            videos = [video for video in videos if video.id in current_ids]
+            removed_ids.update(
+                roku_id for roku_id in self.feed_generator.feed.video_ids()
+                if roku_id.startswith("vimeo-") and roku_id[len("vimeo-"):] not in current_ids
+            )
+
+        batch = self._filter_batch(videos, result)
+        # Made private, retagged or otherwise filtered out since last sync
+        removed_ids.update(f"vimeo-{video.id}" for video in batch.skipped)
+
+        total_videos = len(batch.included)
+        logger.info(f"Processing {total_videos} changed videos ({len(batch.skipped)} filtered out)...")
+
+        for idx, video in enumerate(batch.included):
+            if self._on_progress:
+                self._on_progress(idx + 1, total_videos)
+
+            converted = self._convert_video(video, result, cached.get(video.id), filtered=True)
+            if converted:
+                roku_video, record = converted
+                upserts.append(roku_video)
+                records.append(record)
+            else:
+                # Failed to convert
+                removed_ids.add(f"vimeo-{video.id}")
+
+        counts = self.feed_generator.merge_videos(upserts, removed_ids)
+        result.videos_added += counts["added"]
+        result.videos_updated += counts["updated"]
+        result.videos_removed += counts["removed"]
+        return records, removed_ids
+
+    def _cached_records(self) -> Dict[str, VideoRecord]:
+        """Load the previous sync's video records, keyed by video ID."""
+        return {record.video_id: record for record in self.state_store.iter_videos()}
+
+    def _reuse_fragments(self, cached: Dict[str, VideoRecord]):
+        """
+        Attach cached JSON fragments to the videos of a loaded feed.
+
+        A fragment is only attached if it still describes the loaded item,
+        so a feed edited by hand is re-serialized rather than overwritten.
+        """
+        for roku_video in self.feed_generator.feed.iter_videos():
+            if not roku_video.id.startswith("vimeo-"):
+                continue
+            record = cached.get(roku_video.id[len("vimeo-"):])
+            if not record or not record.fragment:
+                continue
+            if RokuVideo.from_fragment(record.fragment, roku_video.video_type) == roku_video:
+                roku_video.json_fragment = record.fragment
+
+    def _convert_video(
+        self,
+        video: Video,
+        result: SyncResult,
+        cached: Optional[VideoRecord] = None,
+        filtered: bool = False
+    ) -> Optional[Tuple[RokuVideo, VideoRecord]]:
+        """
+        Filter and convert a single video, recording the outcome.
+
+        If the previous sync converted the same content with the same
+        settings, its serialized item is reused instead of converting again.
+
+        Args:
+            video: Video to convert
+            result: Result to record counts on
+            cached: The video's record from the previous sync (optional)
+            filtered: The video already passed _filter_batch(), which
+                counted it as processed
+
+        Returns:
+            The converted video and its state record, or None if it was
+            skipped or failed
+        """
+        if not filtered:
+            reason = self._video_filter.skip_reason(video)
+            if reason:
+                self._record_skipped(result, [video], {reason: 1})
+                return None
+
+        result.videos_processed += 1
+
+        try:
+
+            # Published with fallback dates, so make sure they are seen
+            for error in video.date_errors:
+                result.errors.append(f"Video {video.id}: {error}")
+
+            # Determine video type and convert
+            video_type = self._determine_video_type(video)
+            key = self.feed_generator.conversion_key(video, video_type)
+
+            if cached and cached.fragment and cached.content_hash == key:
+                roku_video = RokuVideo.from_fragment(cached.fragment, video_type)
+                result.conversions_reused += 1
+            else:
+                roku_video = self.feed_generator.build_video(video, video_type)
+
+            record = VideoRecord(
+                video_id=video.id,
+                modified_time=as_utc(video.modified_time),
+                content_hash=key,
+                section=RokuFeed.SECTIONS.get(video_type),
+                fragment=roku_video.to_json_fragment()
+            )
+
+            if self._on_video_processed:
+                self._on_video_processed(video, True)
+            return roku_video, record
+
+        except Exception as e:
+            logger.error(f"Failed to process video {video.id}: {e}")
+            result.videos_failed += 1
+            result.errors.append(f"Video {video.id}: {str(e)}")
+            return None
+
+    def _publish(
+        self,
+        state: SyncState,
+        result: SyncResult,
+        started_at: datetime,
+        upload: bool,
+        notify: bool,
+        records: List[VideoRecord],
+        removed_ids: Optional[Set[str]] = None,
+        feed_path: str = None,
+        video_count: int = None
+    ):
+        """
+        Save the feed, publish it and record the sync in state.
+
+        A feed whose content (ignoring lastUpdated) matches the last saved
+        one is not rewritten, and one matching the last upload is neither
+        uploaded nor announced to the webhook again.
+
+        Args:
+            state: Sync state to update
+            result: Result to record the outcome on
+            started_at: When this sync started (UTC)
+            upload: Upload feed to S3
+            notify: Send webhook notification
+            records: State records for videos added or updated in the feed
+            removed_ids: Roku IDs removed by an incremental sync, or None
+                after a full rebuild (records not seen this run are pruned)
+            feed_path: Feed that was already saved (streaming syncs); the
+                in-memory feed is validated and saved if not given
+            video_count: Videos in the saved feed (defaults to the in-memory count)
+        """
+        tracer = self.tracer
+        if feed_path is None:
+            # Validate and save feed
+            with tracer.span("validate"):
+                validation_errors = self.feed_generator.validate()
+            if validation_errors:
+                for error in validation_errors:
+                    result.errors.append(f"Validation: {error}")
+
+            with tracer.span("save"):
+                feed_path = self.feed_generator.save(previous_digest=self._previous_digest(state))
+            video_count = self.feed_generator.get_stats()["total_videos"]
+        digest = self.feed_generator.last_digest
+        result.feed_path = feed_path
+        if os.path.exists(feed_path):
+            tracer.gauge("feed.bytes", os.path.getsize(feed_path))
+        result.feed_changed = digest != state.feed_digest
+        state.feed_digest = digest
+
+        # Upload to S3 if requested
+        if upload and self.config.roku.s3_bucket:
+            if self.config.sync.skip_unchanged and digest == state.published_digest:
+                logger.info("Feed unchanged since the last upload, skipping upload and notification")
+            else:
+                try:
+                    with tracer.span("upload"):
+                        result.feed_url = self.uploader.upload_to_s3(feed_path)
+                    self._trace_upload(tracer, getattr(self.uploader, "last_upload", None))
+                    state.published_digest = digest
+                except Exception as e:
+                    logger.error(f"Failed to upload to S3: {e}")
+                    result.errors.append(f"S3 upload: {str(e)}")
+
+        # Send webhook notification if requested
+        if notify and result.feed_url:
+            with tracer.span("notify"):
+                self.uploader.notify_webhook(result.feed_url)
+
+        # Update state. The start time is recorded so that videos modified
+        # while this sync was running are picked up by the next one.
+        store = self.state_store
+        with tracer.span("state"), store.transaction():
+            state.run += 1
+            for record in records:
+                record.last_seen_run = state.run
+            store.upsert_videos(records)
+
+            if removed_ids is None:
+                store.prune(state.run)
+            else:
+                store.delete_videos(
+                    roku_id[len("vimeo-"):] for roku_id in removed_ids if roku_id.startswith("vimeo-")
+                )
+
+            state.last_sync = started_at
+            state.last_video_count = video_count
+            state.save(store)
+
+        result.success = True
+        logger.info(
+            f"Sync completed: {result.videos_added} added, {result.videos_updated} updated, "
+            f"{result.videos_removed} removed, {result.videos_skipped} skipped, "
+            f"{result.videos_failed} failed"
+        )
+        if result.skip_reasons:
+            logger.info("Skipped videos by reason: " + ", ".join(
+                f"{reason} {count}" for reason, count in sorted(result.skip_reasons.items())
+            ))
+
+    @staticmethod
+    def _record_sync_error(result: SyncResult, error: Exception):
+        """Log a sync-level failure and record it on the result."""
+        if isinstance(error, VimeoAPIError):
+            logger.error(f"Vimeo API error during sync: {error}")
+            result.errors.append(f"Vimeo API: {str(error)}")
+
+        elif isinstance(error, RokuFeedError):
+            logger.error(f"Roku feed error during sync: {error}")
+            result.errors.append(f"Roku feed: {str(error)}")
+
+        else:
+            logger.error(f"Unexpected error during sync: {error}")
+            result.errors.append(f"Unexpected: {str(error)}")
+
     def sync_album(self, album_id: str = None, **kwargs) -> SyncResult:
         """
         Sync videos from a specific album/showcase.
@@ -417,17 +1291,135 @@ class SyncManager:
         return {
             "last_sync": state.last_sync.isoformat(),
             "video_count": state.last_video_count,
-            "synced_ids_count": len(state.synced_video_ids)
+            "synced_ids_count": self.state_store.video_count()
         }
 
     def clear_cache(self):
-        """Clear the sync state cache."""
+        """Clear the sync state cache (and the catalog, if enabled)."""
         self._state = SyncState()
-        if self._state_path.exists():
-            self._state_path.unlink()
+        self.state_store.clear()
+        if self.catalog:
+            self.catalog.clear()
         logger.info("Sync cache cleared")
 
 
+class _VideoSpool:
+    """
+    Parsed videos pickled to a temporary file.
+
+    Every iteration opens its own handle, so several channels can read
+    the spooled catalog at once.
+    """
+
+    def __init__(self):
+        self._dir = tempfile.TemporaryDirectory(prefix="vimeo_roku_videos_")
+        self.path = os.path.join(self._dir.name, "videos.pickle")
+        self._file = open(self.path, "wb")
+        self._count = 0
+
+    def __enter__(self) -> "_VideoSpool":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, video: Video):
+        pickle.dump(video, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._count += 1
+
+    def __iter__(self) -> Iterator[Video]:
+        self._file.flush()
+        with open(self.path, "rb") as f:
+            for _ in range(self._count):
+                yield pickle.load(f)
+
+    def close(self):
+        self._file.close()
+        self._dir.cleanup()
+
+
+class _FeedStream:
+    """
+    Converts videos as they arrive and spools them into a feed file.
+
+    State records are written to the store in batches as the stream goes,
+    so the caller should hold a store transaction around the whole stream.
+    """
+
+    BATCH_SIZE = 500
+
+    def __init__(self, manager: SyncManager, state: SyncState, result: SyncResult):
+        self.manager = manager
+        self.state = state
+        self.result = result
+        self.total: Optional[int] = None
+        self.spool = SectionSpool()
+        self._run = state.run + 1  # Run number _publish() will assign
+        self._seen = 0
+        self._batch: List[VideoRecord] = []
+
+        manager.feed_generator.reset()
+
+    def __enter__(self) -> "_FeedStream":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.spool.close()
+
+    def set_total(self, total: int):
+        """Record the listing's total, used for progress reporting."""
+        self.total = total
+        logger.info(f"Streaming {total} videos...")
+
+    def add(self, video: Video):
+        """Filter, convert and spool one video."""
+        manager = self.manager
+        self._seen += 1
+        if manager._on_progress:
+            manager._on_progress(self._seen, max(self.total or 0, self._seen))
+
+        with manager.tracer.timed("convert_video"):
+            cached = manager.state_store.get_video(video.id)
+            converted = manager._convert_video(video, self.result, cached)
+        if not converted:
+            return
+
+        roku_video, record = converted
+        for error in manager.feed_generator.validate_video(roku_video):
+            self.result.errors.append(f"Validation: {error}")
+
+        self.spool.add(record.section, record.fragment)
+        record.last_seen_run = self._run
+        self._batch.append(record)
+        self.result.videos_added += 1
+
+        if len(self._batch) >= self.BATCH_SIZE:
+            self._flush()
+
+    def finish(self) -> str:
+        """
+        Write the feed from the spooled sections.
+
+        Returns:
+            Path the feed was saved to
+        """
+        self._flush()
+        for error in self.manager.feed_generator.validate():
+            self.result.errors.append(f"Validation: {error}")
+        with self.manager.tracer.span("save"):
+            return self.manager.feed_generator.save_spooled(
+                self.spool,
+                previous_digest=self.manager._previous_digest(self.state)
+            )
+
+    def _flush(self):
+        self.manager.state_store.upsert_videos(self._batch)
+        self._batch = []
+
+
 def create_sync_manager(
     vimeo_access_token: str,
     roku_provider_name: str,
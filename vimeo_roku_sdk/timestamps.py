@@ -0,0 +1,79 @@
+"""
+Parsing and formatting of feed timestamps.
+
+Vimeo sends every timestamp as ``YYYY-MM-DDTHH:MM:SS+00:00`` and the same
+values recur (a video's release_time is usually its created_time), so both
+directions are memoized.
+"""
+
+from datetime import datetime, timezone
+from functools import lru_cache
+
+# Roku feed formats: releaseDate, and dateAdded/lastUpdated
+DATE_FORMAT = "%Y-%m-%d"
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+# Stands in for a date a video does not have, so output stays deterministic
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_MEMO_SIZE = 4096
+
+
+def parse_timestamp(value: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp, accepting a 'Z' suffix for UTC.
+
+    Args:
+        value: Timestamp such as '2025-01-05T10:00:00+00:00'
+
+    Returns:
+        The parsed datetime (timezone-aware when the value has an offset)
+
+    Raises:
+        ValueError: If the value is not a valid timestamp
+    """
+    if not isinstance(value, str):
+        raise ValueError(f"Expected a timestamp string, got {type(value).__name__}")
+    return _parse(value)
+
+
+@lru_cache(maxsize=_MEMO_SIZE)
+def _parse(value: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        # fromisoformat only accepts 'Z' from Python 3.11
+        if not value.endswith("Z"):
+            raise
+    return datetime.fromisoformat(value[:-1] + "+00:00")
+
+
+def utc_now() -> datetime:
+    """The current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
+def as_utc(moment: datetime) -> datetime:
+    """
+    Normalize a datetime to UTC.
+
+    Naive datetimes are taken to be local time, as written by
+    ``datetime.now()`` (which older sync state files used).
+    """
+    if moment.tzinfo is None:
+        moment = moment.astimezone()
+    elif moment.utcoffset().total_seconds() == 0:
+        return moment
+    return moment.astimezone(timezone.utc)
+
+
+@lru_cache(maxsize=_MEMO_SIZE)
+def format_date(moment: datetime) -> str:
+    """Format a datetime as a feed date ('2025-01-05'), in UTC."""
+    return as_utc(moment).strftime(DATE_FORMAT)
+
+
+@lru_cache(maxsize=_MEMO_SIZE)
+def format_timestamp(moment: datetime) -> str:
+    """Format a datetime as a feed timestamp ('2025-01-05T10:00:00Z'), in UTC."""
+    return as_utc(moment).strftime(TIMESTAMP_FORMAT)
@@ -0,0 +1,232 @@
+"""
+Lightweight tracing for sync runs.
+
+A Tracer records timed spans (sync stages, HTTP requests), counters,
+gauges and latency histograms. Its summary goes into SyncResult.to_dict(), and the
+individual spans can be exported as Chrome trace-event JSON for
+chrome://tracing or https://ui.perfetto.dev.
+"""
+
+import bisect
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Dict, Iterator, List, Optional, Sequence
+
+from . import json_codec
+from .atomic_file import PathLike, atomic_write
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Counts of observed values in fixed buckets."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # Last one is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        bounds = [str(bound) for bound in self.buckets] + ["+Inf"]
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "buckets": dict(zip(bounds, self.counts)),
+        }
+
+
+class _Timer:
+    """Context manager behind Tracer.timed(), lighter than a generator."""
+
+    __slots__ = ("tracer", "name", "start")
+
+    def __init__(self, tracer: "Tracer", name: str):
+        self.tracer = tracer
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        self.tracer.add_time(self.name, time.perf_counter() - self.start)
+
+
+_NULL_TIMER = nullcontext()
+
+
+class Tracer:
+    """
+    Collects spans, counters, gauges and histograms; safe to share between threads.
+
+    Spans are kept individually (up to ``max_events``) for export and also
+    summed per name. For hot paths, timed() only adds to the per-name
+    totals.
+
+    Example:
+        tracer = Tracer()
+        with tracer.span("fetch"):
+            ...
+        tracer.count("http.bytes", len(body))
+        tracer.export_chrome_trace("sync.trace.json")
+    """
+
+    def __init__(self, enabled: bool = True, max_events: int = 100000):
+        """
+        Initialize the tracer.
+
+        Args:
+            enabled: Record anything at all (a disabled tracer costs next to nothing)
+            max_events: Individual spans kept for export; totals are unaffected
+        """
+        self.enabled = enabled
+        self.max_events = max_events
+        self.events: List[Dict[str, Any]] = []
+        self.dropped_events = 0
+        self.stages: Dict[str, List[float]] = {}  # name -> [count, seconds]
+        self.counters: Dict[str, float] = {}
+        self.gauges: Dict[str, float] = {}
+        self.histograms: Dict[str, Histogram] = {}
+        self._origin = time.perf_counter()
+        self._threads: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        category: str = "sync",
+        histogram: str = None,
+        **args
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Time a block as a span.
+
+        Args:
+            name: Span name; spans with the same name are summed in the summary
+            category: Trace category (e.g. 'sync', 'http')
+            histogram: Histogram to also record the duration in (optional)
+            **args: Details shown with the span in trace viewers
+
+        Yields:
+            The span's args, to add details found out inside the block
+        """
+        if not self.enabled:
+            yield args
+            return
+
+        start = time.perf_counter()
+        try:
+            yield args
+        finally:
+            seconds = time.perf_counter() - start
+            self._record(name, category, start, seconds, args)
+            if histogram:
+                self.observe(histogram, seconds)
+
+    def timed(self, name: str) -> ContextManager[None]:
+        """Add a block's duration to a name's totals without keeping a span."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def add_time(self, name: str, seconds: float):
+        """Add to a name's totals, as if a span of that length had ended."""
+        if not self.enabled:
+            return
+        with self._lock:
+            totals = self.stages.setdefault(name, [0, 0.0])
+            totals[0] += 1
+            totals[1] += seconds
+
+    def count(self, name: str, value: float = 1):
+        """Increase a counter."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def gauge(self, name: str, value: float):
+        """Set a gauge to its latest value."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.gauges[name] = value
+
+    def observe(self, name: str, value: float, buckets: Sequence[float] = LATENCY_BUCKETS):
+        """Record a value in a histogram."""
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram(buckets)
+            histogram.observe(value)
+
+    def _record(self, name: str, category: str, start: float, seconds: float, args: Dict[str, Any]):
+        with self._lock:
+            totals = self.stages.setdefault(name, [0, 0.0])
+            totals[0] += 1
+            totals[1] += seconds
+
+            if len(self.events) >= self.max_events:
+                self.dropped_events += 1
+                return
+            ident = threading.get_ident()
+            tid = self._threads.setdefault(ident, len(self._threads) + 1)
+            self.events.append({
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": round((start - self._origin) * 1e6, 1),
+                "dur": round(seconds * 1e6, 1),
+                "pid": os.getpid(),
+                "tid": tid,
+                "args": args,
+            })
+
+    def summary(self) -> Dict[str, Any]:
+        """Totals per span name, counters, gauges and histograms."""
+        with self._lock:
+            return {
+                "stages": {
+                    name: {"count": count, "seconds": seconds}
+                    for name, (count, seconds) in self.stages.items()
+                },
+                "counters": dict(self.counters),
+                "gauges": dict(self.gauges),
+                "histograms": {name: histogram.to_dict() for name, histogram in self.histograms.items()},
+                "dropped_events": self.dropped_events,
+            }
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Spans in Chrome's trace-event format."""
+        with self._lock:
+            return {
+                "traceEvents": list(self.events),
+                "displayTimeUnit": "ms",
+                "otherData": {"counters": dict(self.counters)},
+            }
+
+    def export_chrome_trace(self, path: PathLike):
+        """Write the spans as a Chrome trace-event JSON file."""
+        with atomic_write(path, "wb", fsync=False) as f:
+            f.write(json_codec.dumps(self.to_chrome_trace()))
+
+
+# Default for clients used outside a traced sync
+NULL_TRACER = Tracer(enabled=False)
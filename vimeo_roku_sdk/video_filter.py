@@ -0,0 +1,173 @@
+"""
+Filtering of videos by the sync settings.
+
+VideoFilter turns the filter options of SyncConfig into a list of checks
+once (tag sets normalized, disabled checks left out), so each video costs
+only the comparisons that can reject it, and its tags are normalized once. Skipped videos are counted by
+reason instead of being logged one by one.
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from .config import SyncConfig
+from .models import Video
+
+# Why a video was left out of the feed
+SKIP_MISSING_TAG = "missing_tag"
+SKIP_PRIVATE = "private"
+SKIP_TOO_SHORT = "too_short"
+SKIP_TOO_LONG = "too_long"
+SKIP_EXCLUDED_TAG = "excluded_tag"
+SKIP_NOT_PLAYABLE = "not_playable"
+
+
+def normalize_tag(tag: str) -> str:
+    """Tags match case-insensitively."""
+    return tag.lower()
+
+
+@dataclass
+class FilterBatch:
+    """Outcome of filtering a batch of videos."""
+    included: List[Video] = field(default_factory=list)
+    skipped: List[Video] = field(default_factory=list)
+    reasons: Dict[str, int] = field(default_factory=dict)  # Skip reason -> videos
+
+
+class VideoFilter:
+    """
+    Decides which videos go into the feed.
+
+    Checks run cheapest and most likely to reject first: required tags
+    (usually few videos have them), privacy, duration bounds, excluded
+    tags, then whether the video has a playable file.
+
+    Example:
+        video_filter = VideoFilter.from_config(config.sync)
+        batch = video_filter.partition(videos)
+        print(len(batch.included), batch.reasons)
+    """
+
+    def __init__(
+        self,
+        include_private: bool = False,
+        min_duration: int = 0,
+        max_duration: Optional[int] = None,
+        include_tags: Iterable[str] = (),
+        exclude_tags: Iterable[str] = (),
+        require_playable: bool = True
+    ):
+        """
+        Compile the filter.
+
+        Args:
+            include_private: Keep videos whose privacy is not 'anybody'
+            min_duration: Minimum duration in seconds
+            max_duration: Maximum duration in seconds (None for no limit)
+            include_tags: Keep only videos with at least one of these tags
+            exclude_tags: Skip videos with any of these tags
+            require_playable: Skip videos without a playable video file
+        """
+        self.include_private = include_private
+        self.min_duration = min_duration or 0
+        self.max_duration = max_duration or None
+        self.include_tags = frozenset(normalize_tag(tag) for tag in include_tags)
+        self.exclude_tags = frozenset(normalize_tag(tag) for tag in exclude_tags)
+        self.require_playable = require_playable
+        self._checks = self._compile()
+
+    @classmethod
+    def from_config(cls, config: SyncConfig) -> "VideoFilter":
+        return cls(
+            include_private=config.include_private,
+            min_duration=config.min_duration,
+            max_duration=config.max_duration,
+            include_tags=config.include_tags,
+            exclude_tags=config.exclude_tags
+        )
+
+    def _compile(self) -> Tuple[Tuple[str, Callable[[Video, FrozenSet[str]], bool]], ...]:
+        """
+        (skip reason, rejects) pairs for the enabled checks, in evaluation order.
+
+        Each check is called with the video and its normalized tags.
+        """
+        checks: List[Tuple[str, Callable[[Video, FrozenSet[str]], bool]]] = []
+
+        include_tags = self.include_tags
+        if include_tags:
+            checks.append((SKIP_MISSING_TAG, lambda video, tags: include_tags.isdisjoint(tags)))
+
+        if not self.include_private:
+            checks.append((SKIP_PRIVATE, lambda video, tags: video.privacy != "anybody"))
+
+        min_duration = self.min_duration
+        if min_duration:
+            checks.append((SKIP_TOO_SHORT, lambda video, tags: video.duration < min_duration))
+
+        max_duration = self.max_duration
+        if max_duration:
+            checks.append((SKIP_TOO_LONG, lambda video, tags: video.duration > max_duration))
+
+        exclude_tags = self.exclude_tags
+        if exclude_tags:
+            checks.append((SKIP_EXCLUDED_TAG, lambda video, tags: not exclude_tags.isdisjoint(tags)))
+
+        if self.require_playable:
+            checks.append((SKIP_NOT_PLAYABLE, lambda video, tags: video.get_best_video_file() is None))
+
+        return tuple(checks)
+
+    def _video_tags(self, video: Video) -> FrozenSet[str]:
+        """The video's normalized tags, if any check looks at tags."""
+        if not (self.include_tags or self.exclude_tags) or not video.tags:
+            return frozenset()
+        return frozenset(normalize_tag(tag) for tag in video.tags)
+
+    def skip_reason(self, video: Video) -> Optional[str]:
+        """
+        Check one video.
+
+        Returns:
+            Why the video is skipped, or None if it belongs in the feed
+        """
+        tags = self._video_tags(video)
+        for reason, rejects in self._checks:
+            if rejects(video, tags):
+                return reason
+        return None
+
+    def __call__(self, video: Video) -> bool:
+        """True if the video belongs in the feed."""
+        return self.skip_reason(video) is None
+
+    def partition(self, videos: Iterable[Video]) -> FilterBatch:
+        """
+        Check a batch of videos (such as a page of results) at once.
+
+        Args:
+            videos: Videos to check
+
+        Returns:
+            FilterBatch with the included and skipped videos, in their
+            original order, and the number skipped for each reason
+        """
+        batch = FilterBatch()
+        included = batch.included.append
+        skipped = batch.skipped.append
+        reasons = batch.reasons
+        checks = self._checks
+        video_tags = self._video_tags
+
+        for video in videos:
+            tags = video_tags(video)
+            for reason, rejects in checks:
+                if rejects(video, tags):
+                    skipped(video)
+                    reasons[reason] = reasons.get(reason, 0) + 1
+                    break
+            else:
+                included(video)
+
+        return batch
@@ -2,49 +2,112 @@
 Vimeo API client for fetching video content.
 """
 
+import math
 import time
 import logging
-from typing import Optional, List, Dict, Any, Generator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Generator, Callable, Tuple, Set
 from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
 
-from .models import Video
+from . import json_codec
+from .models import DEFAULT_MEDIA_POLICY, MediaPolicy, Video
 from .config import VimeoConfig
+from .rate_limit import AdaptiveRateLimiter
+from .http_cache import ResponseCache
+from .timestamps import as_utc
+from .tracing import NULL_TRACER, Tracer
 from .exceptions import (
     VimeoAPIError,
     VimeoAuthError,
-    VimeoRateLimitError
+    VimeoRateLimitError,
+    ConfigurationError
 )
 
 logger = logging.getLogger(__name__)
 
 
-class VimeoClient:
-    """
-    Client for interacting with the Vimeo API.
+# Nested field paths that Video.from_vimeo_response -> RokuVideo.from_video
+# and the sync filters actually read. Everything else Vimeo would send is
+# downloaded and parsed for nothing. Only the embed HTML, the player URL and
+# the stats (see STATS_FIELDS) are left out.
+FEED_FIELDS = (
+    "uri",
+    "link",
+    "name",
+    "description",
+    "duration",
+    "created_time",
+    "modified_time",
+    "release_time",
+    "pictures.sizes.link",
+    "pictures.sizes.width",
+    "pictures.sizes.height",
+    "files.link",
+    "files.type",
+    "files.width",
+    "files.height",
+    "files.size",
+    "play.hls.link",
+    "tags.name",
+    "categories.name",
+    "privacy.view",
+)
 
-    Handles authentication, pagination, rate limiting, and video retrieval.
+STATS_FIELDS = (
+    "stats.plays",
+    "metadata.connections.likes.total",
+)
+
+FULL_FIELDS = (
+    "uri",
+    "name",
+    "description",
+    "duration",
+    "created_time",
+    "modified_time",
+    "release_time",
+    "pictures",
+    "files",
+    "play",
+    "tags",
+    "categories",
+    "privacy",
+    "embed",
+    "link",
+    "stats",
+    "metadata",
+    "player_embed_url",
+)
+
+# Field projections selectable with VimeoConfig.fields_profile
+FIELD_PROFILES = {
+    "feed": FEED_FIELDS,
+    "stats": FEED_FIELDS + STATS_FIELDS,
+    "full": FULL_FIELDS,
+}
+
+
+class _VimeoClientBase:
+    """
+    Credentials, endpoints and query parameters shared by the blocking and
+    asyncio Vimeo clients.
     """
 
     BASE_URL = "https://api.vimeo.com"
     DEFAULT_PER_PAGE = 100  # Vimeo's max per page
+    DEFAULT_MAX_WORKERS = 4
+    DEFAULT_REQUESTS_PER_SECOND = 10.0  # Pace until Vimeo's rate-limit headers arrive
 
-    def __init__(
+    def _init_credentials(
         self,
         access_token: str = None,
         client_id: str = None,
         client_secret: str = None,
         config: VimeoConfig = None
-    ):
-        """
-        Initialize the Vimeo client.
-
-        Args:
-            access_token: Vimeo API access token
-            client_id: Vimeo app client ID (optional, for generating tokens)
-            client_secret: Vimeo app client secret (optional, for generating tokens)
-            config: VimeoConfig object (alternative to individual parameters)
-        """
+    ) -> int:
+        """Set credentials and default IDs; returns the configured worker count."""
         if config:
             self.access_token = config.access_token
             self.client_id = config.client_id
@@ -52,6 +115,14 @@ class VimeoClient:
             self._user_id = config.user_id
             self._folder_id = config.folder_id
             self._album_id = config.album_id
+            self._init_fields(config.fields_profile, config.extra_fields)
+            self.lean_models = config.lean_models
+            self.media_policy = MediaPolicy(
+                min_thumbnail_width=config.thumbnail_min_width,
+                preferred_video_type=config.preferred_video_type.upper()
+            )
+            self.base_url = (config.api_base_url or self.BASE_URL).rstrip("/")
+            default_workers = config.max_workers
         else:
             self.access_token = access_token
             self.client_id = client_id
@@ -59,20 +130,304 @@ class VimeoClient:
             self._user_id = None
             self._folder_id = None
             self._album_id = None
+            self._init_fields()
+            self.lean_models = False
+            self.media_policy = DEFAULT_MEDIA_POLICY
+            self.base_url = self.BASE_URL
+            default_workers = self.DEFAULT_MAX_WORKERS
+
+        # Replaced by SyncManager for the duration of a sync
+        self.tracer: Tracer = NULL_TRACER
 
         if not self.access_token:
             raise VimeoAuthError("Access token is required")
 
-        self.session = requests.Session()
-        self.session.headers.update({
+        return default_workers
+
+    def _init_fields(self, profile: str = "feed", extra_fields: List[str] = None):
+        """Build the ``fields`` projection sent with every video request."""
+        if profile not in FIELD_PROFILES:
+            raise ConfigurationError(
+                f"Unknown fields profile '{profile}'. "
+                f"Choose from: {', '.join(FIELD_PROFILES)}"
+            )
+
+        fields = list(FIELD_PROFILES[profile])
+        for extra in extra_fields or []:
+            if extra not in fields:
+                fields.append(extra)
+
+        self.fields_profile = profile
+        self.fields = ",".join(fields)
+
+    def _default_headers(self) -> Dict[str, str]:
+        return {
             "Authorization": f"Bearer {self.access_token}",
             "Content-Type": "application/json",
             "Accept": "application/vnd.vimeo.*+json;version=3.4"
-        })
+        }
+
+    def _raise_for_status(self, status_code: int, text: str):
+        """Raise the SDK exception matching an error status code."""
+        if status_code in (401, 403):
+            raise VimeoAuthError(
+                f"Authentication failed: {text}",
+                status_code=status_code
+            )
+
+        if status_code >= 400:
+            try:
+                payload = json_codec.loads(text) if text else None
+            except ValueError:
+                payload = None
+            raise VimeoAPIError(
+                f"API request failed: {text}",
+                status_code=status_code,
+                response=payload
+            )
+
+    @staticmethod
+    def _last_page(response: Dict[str, Any]) -> Optional[int]:
+        """Work out the number of pages in a listing from its first page."""
+        total = response.get("total")
+        if not total or not response.get("data"):
+            return None
+        per_page = response.get("per_page") or len(response["data"])
+        return math.ceil(total / per_page)
+
+    @staticmethod
+    def _video_ids(response: Dict[str, Any]) -> List[str]:
+        """Extract video IDs from a listing page requested with ``fields=uri``."""
+        return [
+            video_data["uri"].split("/")[-1]
+            for video_data in response.get("data", [])
+            if video_data.get("uri")
+        ]
+
+    def _parse_video(self, data: Dict[str, Any]) -> Video:
+        with self.tracer.timed("parse"):
+            return Video.from_vimeo_response(data, lean=self.lean_models, policy=self.media_policy)
+
+    def _http_span(self, method: str, endpoint: str, params: Optional[Dict[str, Any]], attempt: int):
+        """Span for one HTTP request, with its latency recorded per page."""
+        return self.tracer.span(
+            "http",
+            category="http",
+            histogram="http.latency_seconds",
+            method=method,
+            endpoint=endpoint,
+            page=(params or {}).get("page"),
+            attempt=attempt + 1
+        )
+
+    def _trace_response(self, span: Dict[str, Any], status: int, body: bytes):
+        span["status"] = status
+        span["bytes"] = len(body)
+        self.tracer.count("http.requests")
+        self.tracer.count("http.bytes", len(body))
+        if status == 304:
+            self.tracer.count("http.not_modified")
+
+    def _trace_retry(self, wait_seconds: float, throttled: bool):
+        """Count a retry and the time it waits (Retry-After for 429s, else backoff)."""
+        self.tracer.count("http.retries")
+        if throttled:
+            self.tracer.count("http.throttled")
+            self.tracer.count("http.retry_after_seconds", wait_seconds)
+        else:
+            self.tracer.count("http.backoff_seconds", wait_seconds)
+
+    def _take_modified_since(
+        self,
+        response: Dict[str, Any],
+        since: datetime,
+        videos: Dict[str, Video]
+    ) -> bool:
+        """
+        Collect the videos on a ``modified_time``-ordered page changed since a time.
+
+        Videos edited while the listing is being paged move to the front and
+        can show up on a later page a second time, so they are keyed by ID.
+
+        Args:
+            response: Listing page sorted by ``modified_time`` descending
+            since: Aware UTC datetime to collect from
+            videos: Collected videos by ID, updated in place
+
+        Returns:
+            True once the page reaches a video modified before ``since``
+        """
+        for video_data in response["data"]:
+            video = self._parse_video(video_data)
+            if as_utc(video.modified_time) < since:
+                return True
+            videos.setdefault(video.id, video)
+        return False
+
+    def _user_endpoint(self, user_id: str = None) -> str:
+        if user_id:
+            return f"/users/{user_id}"
+        elif self._user_id:
+            return f"/users/{self._user_id}"
+        # Use /me endpoint for authenticated user
+        return "/me"
+
+    def _video_params(self) -> Dict[str, Any]:
+        return {"fields": self.fields}
+
+    def _videos_request(
+        self,
+        user_id: str = None,
+        per_page: int = None,
+        page: int = 1,
+        sort: str = "date",
+        direction: str = "desc",
+        filter_playable: bool = True,
+        fields: str = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        per_page = min(per_page or self.DEFAULT_PER_PAGE, 100)
+
+        params = {
+            "per_page": per_page,
+            "page": page,
+            "sort": sort,
+            "direction": direction,
+            "fields": fields or self.fields
+        }
+
+        if filter_playable:
+            params["filter"] = "playable"
+
+        # Use /me/videos for authenticated user, /users/{id}/videos for specific user
+        if user_id:
+            endpoint = f"/users/{user_id}/videos"
+        elif self._user_id:
+            endpoint = f"/users/{self._user_id}/videos"
+        else:
+            endpoint = "/me/videos"
+
+        return endpoint, params
+
+    def _album_videos_request(
+        self,
+        album_id: str = None,
+        user_id: str = None,
+        per_page: int = None,
+        page: int = 1,
+        fields: str = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        album_id = album_id or self._album_id
+        if not album_id:
+            raise VimeoAPIError("Album ID is required")
+
+        user_id = user_id or self._user_id or "me"
+        per_page = min(per_page or self.DEFAULT_PER_PAGE, 100)
+
+        params = {
+            "per_page": per_page,
+            "page": page,
+            "fields": fields or self.fields
+        }
+
+        return f"/users/{user_id}/albums/{album_id}/videos", params
+
+    def _folder_videos_request(
+        self,
+        folder_id: str = None,
+        user_id: str = None,
+        per_page: int = None,
+        page: int = 1,
+        fields: str = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        folder_id = folder_id or self._folder_id
+        if not folder_id:
+            raise VimeoAPIError("Folder ID is required")
+
+        user_id = user_id or self._user_id or "me"
+        per_page = min(per_page or self.DEFAULT_PER_PAGE, 100)
+
+        params = {
+            "per_page": per_page,
+            "page": page,
+            "fields": fields or self.fields
+        }
+
+        return f"/users/{user_id}/projects/{folder_id}/videos", params
+
+    def _search_request(
+        self,
+        query: str,
+        user_id: str = None,
+        per_page: int = None,
+        page: int = 1
+    ) -> Tuple[str, Dict[str, Any]]:
+        per_page = min(per_page or self.DEFAULT_PER_PAGE, 100)
+
+        params = {
+            "query": query,
+            "per_page": per_page,
+            "page": page,
+            "fields": self.fields
+        }
+
+        if user_id or self._user_id:
+            endpoint = f"/users/{user_id or self._user_id or 'me'}/videos"
+        else:
+            endpoint = "/videos"
+
+        return endpoint, params
+
+
+class VimeoClient(_VimeoClientBase):
+    """
+    Client for interacting with the Vimeo API.
+
+    Handles authentication, pagination, rate limiting, and video retrieval.
+    """
+
+    def __init__(
+        self,
+        access_token: str = None,
+        client_id: str = None,
+        client_secret: str = None,
+        config: VimeoConfig = None,
+        max_workers: int = None,
+        rate_limiter: AdaptiveRateLimiter = None,
+        response_cache: ResponseCache = None
+    ):
+        """
+        Initialize the Vimeo client.
+
+        Args:
+            access_token: Vimeo API access token
+            client_id: Vimeo app client ID (optional, for generating tokens)
+            client_secret: Vimeo app client secret (optional, for generating tokens)
+            config: VimeoConfig object (alternative to individual parameters)
+            max_workers: Pages fetched concurrently while paginating (1 = sequential)
+            rate_limiter: Limiter to share with other clients (optional)
+            response_cache: Cache for conditional GET requests (optional)
+        """
+        default_workers = self._init_credentials(
+            access_token, client_id, client_secret, config
+        )
+        self.max_workers = max(1, max_workers or default_workers or 1)
+
+        self.session = requests.Session()
+        self.session.headers.update(self._default_headers())
+
+        # Size the connection pool so parallel page fetches can reuse connections
+        adapter = HTTPAdapter(pool_maxsize=max(self.max_workers, 10))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
-        # Rate limiting
-        self._last_request_time = 0
-        self._min_request_interval = 0.1  # 100ms between requests
+        # Rate limiting (shared by all pagination workers), paced from the
+        # X-RateLimit-* headers on every response
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter(
+            rate=self.DEFAULT_REQUESTS_PER_SECOND
+        )
+
+        # Conditional GETs: unchanged responses come back as empty 304s
+        self.response_cache = response_cache
 
     def _make_request(
         self,
@@ -100,61 +455,149 @@ class VimeoClient:
             VimeoAuthError: On authentication errors
             VimeoRateLimitError: On rate limit errors
         """
-        url = f"{self.BASE_URL}{endpoint}"
+        url = f"{self.base_url}{endpoint}"
 
-        # Rate limiting
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self._min_request_interval:
-            time.sleep(self._min_request_interval - elapsed)
-        self._last_request_time = time.time()
+        cached = None
+        if self.response_cache is not None and method == "GET":
+            cached = self.response_cache.get(endpoint, params)
 
         for attempt in range(retry_count):
+            # Rate limiting
+            with self.tracer.timed("rate_limit_wait"):
+                self.rate_limiter.acquire()
+
             try:
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=data,
-                    timeout=30
-                )
+                with self._http_span(method, endpoint, params, attempt) as span:
+                    response = self.session.request(
+                        method=method,
+                        url=url,
+                        params=params,
+                        json=data,
+                        headers=cached.conditional_headers() if cached else None,
+                        timeout=30
+                    )
+                    self._trace_response(span, response.status_code, response.content)
+                self.rate_limiter.update(response.headers)
+
+                # Unchanged since the cached copy
+                if response.status_code == 304 and cached is not None:
+                    logger.debug(f"Not modified, serving cached response for {endpoint}")
+                    return cached.json()
 
                 # Handle rate limiting
                 if response.status_code == 429:
                     retry_after = int(response.headers.get("Retry-After", 60))
                     if attempt < retry_count - 1:
                         logger.warning(f"Rate limited, waiting {retry_after} seconds...")
-                        time.sleep(retry_after)
+                        self._trace_retry(retry_after, throttled=True)
+                        self.rate_limiter.pause(retry_after)
                         continue
                     raise VimeoRateLimitError(
                         "Rate limit exceeded",
                         retry_after=retry_after
                     )
 
-                # Handle authentication errors
-                if response.status_code in (401, 403):
-                    raise VimeoAuthError(
-                        f"Authentication failed: {response.text}",
-                        status_code=response.status_code
-                    )
+                # Handle authentication and other errors
+                self._raise_for_status(response.status_code, response.text)
 
-                # Handle other errors
-                if response.status_code >= 400:
-                    raise VimeoAPIError(
-                        f"API request failed: {response.text}",
-                        status_code=response.status_code,
-                        response=response.json() if response.text else None
-                    )
+                if self.response_cache is not None and method == "GET":
+                    self.response_cache.put(endpoint, params, response.headers, response.content)
 
-                return response.json() if response.text else {}
+                return json_codec.loads(response.content) if response.content else {}
 
             except requests.exceptions.RequestException as e:
                 if attempt < retry_count - 1:
                     wait_time = 2 ** attempt  # Exponential backoff
                     logger.warning(f"Request failed, retrying in {wait_time}s: {e}")
+                    self._trace_retry(wait_time, throttled=False)
                     time.sleep(wait_time)
                     continue
                 raise VimeoAPIError(f"Request failed after {retry_count} attempts: {e}")
 
+    def _iter_pages(
+        self,
+        fetch_page: Callable[[int], Dict[str, Any]],
+        concurrent: bool = True,
+        on_total: Callable[[int], None] = None
+    ) -> Generator[Dict[str, Any], None, None]:
+        """
+        Iterate over the pages of a paginated listing, in page order.
+
+        The first page is fetched on its own to learn the listing's ``total``.
+        The remaining pages are then fetched concurrently through a bounded
+        worker pool and yielded in order. Falls back to following
+        ``paging.next`` one page at a time when the total is unknown,
+        ``max_workers`` is 1 or ``concurrent`` is False.
+
+        Args:
+            fetch_page: Callable returning the API response for a page number
+            concurrent: Fetch ahead of the consumer (disable for scans that
+                usually stop after a page or two)
+            on_total: Called with the listing's total item count once known
+
+        Yields:
+            API responses, one per non-empty page
+        """
+        response = fetch_page(1)
+        page = 1
+        if on_total and response.get("total") is not None:
+            on_total(response["total"])
+        if not response.get("data"):
+            return
+        yield response
+
+        last_page = self._last_page(response)
+        if concurrent and self.max_workers > 1 and last_page and response.get("paging", {}).get("next"):
+            pages = self._fetch_pages_concurrently(fetch_page, page + 1, last_page)
+            try:
+                for response in pages:
+                    if not response.get("data"):
+                        return
+                    yield response
+            finally:
+                pages.close()
+            page = max(page, last_page)
+
+        # Follow the remaining links (the catalog may have grown while paging)
+        while response.get("paging", {}).get("next"):
+            page += 1
+            logger.debug(f"Fetching page {page}...")
+            response = fetch_page(page)
+            if not response.get("data"):
+                break
+            yield response
+
+    def _fetch_pages_concurrently(
+        self,
+        fetch_page: Callable[[int], Dict[str, Any]],
+        first_page: int,
+        last_page: int
+    ) -> Generator[Dict[str, Any], None, None]:
+        """
+        Fetch a range of pages through the worker pool, yielding them in order.
+
+        At most ``2 * max_workers`` pages are requested ahead of the consumer,
+        so a caller that stops early does not pull the whole listing.
+        """
+        logger.debug(
+            f"Fetching pages {first_page}-{last_page} with {self.max_workers} workers..."
+        )
+        window = self.max_workers * 2
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        pending = []
+        next_page = first_page
+
+        try:
+            while next_page <= last_page or pending:
+                while next_page <= last_page and len(pending) < window:
+                    pending.append(executor.submit(fetch_page, next_page))
+                    next_page += 1
+                yield pending.pop(0).result()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
     def get_user(self, user_id: str = None) -> Dict[str, Any]:
         """
         Get user information.
@@ -165,13 +608,7 @@ class VimeoClient:
         Returns:
             User data dictionary
         """
-        if user_id:
-            return self._make_request("GET", f"/users/{user_id}")
-        elif self._user_id:
-            return self._make_request("GET", f"/users/{self._user_id}")
-        else:
-            # Use /me endpoint for authenticated user
-            return self._make_request("GET", "/me")
+        return self._make_request("GET", self._user_endpoint(user_id))
 
     def get_video(self, video_id: str) -> Video:
         """
@@ -183,14 +620,8 @@ class VimeoClient:
         Returns:
             Video object
         """
-        # Request additional fields for full video information
-        params = {
-            "fields": "uri,name,description,duration,created_time,modified_time,"
-                      "release_time,pictures,files,play,tags,categories,privacy,"
-                      "embed,link,stats,metadata,player_embed_url"
-        }
-        data = self._make_request("GET", f"/videos/{video_id}", params=params)
-        return Video.from_vimeo_response(data)
+        data = self._make_request("GET", f"/videos/{video_id}", params=self._video_params())
+        return self._parse_video(data)
 
     def get_videos(
         self,
@@ -199,7 +630,8 @@ class VimeoClient:
         page: int = 1,
         sort: str = "date",
         direction: str = "desc",
-        filter_playable: bool = True
+        filter_playable: bool = True,
+        fields: str = None
     ) -> Dict[str, Any]:
         """
         Get videos for a user.
@@ -211,33 +643,14 @@ class VimeoClient:
             sort: Sort field (date, alphabetical, plays, likes, duration)
             direction: Sort direction (asc, desc)
             filter_playable: Only return videos that are playable
+            fields: Override the configured fields projection
 
         Returns:
             API response with video data and pagination info
         """
-        per_page = min(per_page or self.DEFAULT_PER_PAGE, 100)
-
-        params = {
-            "per_page": per_page,
-            "page": page,
-            "sort": sort,
-            "direction": direction,
-            "fields": "uri,name,description,duration,created_time,modified_time,"
-                      "release_time,pictures,files,play,tags,categories,privacy,"
-                      "embed,link,stats,metadata,player_embed_url"
-        }
-
-        if filter_playable:
-            params["filter"] = "playable"
-
-        # Use /me/videos for authenticated user, /users/{id}/videos for specific user
-        if user_id:
-            endpoint = f"/users/{user_id}/videos"
-        elif self._user_id:
-            endpoint = f"/users/{self._user_id}/videos"
-        else:
-            endpoint = "/me/videos"
-
+        endpoint, params = self._videos_request(
+            user_id, per_page, page, sort, direction, filter_playable, fields
+        )
         return self._make_request("GET", endpoint, params=params)
 
     def iter_all_videos(
@@ -245,7 +658,8 @@ class VimeoClient:
         user_id: str = None,
         sort: str = "date",
         direction: str = "desc",
-        filter_playable: bool = True
+        filter_playable: bool = True,
+        on_total: Callable[[int], None] = None
     ) -> Generator[Video, None, None]:
         """
         Iterate over all videos for a user with automatic pagination.
@@ -255,34 +669,22 @@ class VimeoClient:
             sort: Sort field
             direction: Sort direction
             filter_playable: Only return playable videos
+            on_total: Called with the total number of videos once known
 
         Yields:
             Video objects
         """
-        page = 1
-        while True:
-            response = self.get_videos(
-                user_id=user_id,
-                page=page,
-                sort=sort,
-                direction=direction,
-                filter_playable=filter_playable
-            )
-
-            videos = response.get("data", [])
-            if not videos:
-                break
-
-            for video_data in videos:
-                yield Video.from_vimeo_response(video_data)
-
-            # Check if there are more pages
-            paging = response.get("paging", {})
-            if not paging.get("next"):
-                break
-
-            page += 1
-            logger.debug(f"Fetching page {page}...")
+        pages = self._iter_pages(lambda page: self.get_videos(
+            user_id=user_id,
+            page=page,
+            sort=sort,
+            direction=direction,
+            filter_playable=filter_playable
+        ), on_total=on_total)
+
+        for response in pages:
+            for video_data in response["data"]:
+                yield self._parse_video(video_data)
 
     def get_all_videos(
         self,
@@ -312,12 +714,39 @@ class VimeoClient:
                 break
         return videos
 
+    def get_video_ids(
+        self,
+        user_id: str = None,
+        filter_playable: bool = True
+    ) -> Set[str]:
+        """
+        Get the IDs of all videos for a user.
+
+        Only each video's URI is requested, so this is a cheap way to find
+        videos that were deleted since the last sync.
+
+        Args:
+            user_id: User ID or 'me' for authenticated user
+            filter_playable: Only return playable videos
+
+        Returns:
+            Set of video IDs
+        """
+        pages = self._iter_pages(lambda page: self.get_videos(
+            user_id=user_id,
+            page=page,
+            filter_playable=filter_playable,
+            fields="uri"
+        ))
+        return {video_id for response in pages for video_id in self._video_ids(response)}
+
     def get_album_videos(
         self,
         album_id: str = None,
         user_id: str = None,
         per_page: int = None,
-        page: int = 1
+        page: int = 1,
+        fields: str = None
     ) -> Dict[str, Any]:
         """
         Get videos from an album/showcase.
@@ -327,35 +756,21 @@ class VimeoClient:
             user_id: User ID or 'me' for authenticated user
             per_page: Number of videos per page
             page: Page number
+            fields: Override the configured fields projection
 
         Returns:
             API response with video data
         """
-        album_id = album_id or self._album_id
-        if not album_id:
-            raise VimeoAPIError("Album ID is required")
-
-        user_id = user_id or self._user_id or "me"
-        per_page = min(per_page or self.DEFAULT_PER_PAGE, 100)
-
-        params = {
-            "per_page": per_page,
-            "page": page,
-            "fields": "uri,name,description,duration,created_time,modified_time,"
-                      "release_time,pictures,files,play,tags,categories,privacy,"
-                      "embed,link,stats,metadata,player_embed_url"
-        }
-
-        return self._make_request(
-            "GET",
-            f"/users/{user_id}/albums/{album_id}/videos",
-            params=params
+        endpoint, params = self._album_videos_request(
+            album_id, user_id, per_page, page, fields
         )
+        return self._make_request("GET", endpoint, params=params)
 
     def iter_album_videos(
         self,
         album_id: str = None,
-        user_id: str = None
+        user_id: str = None,
+        on_total: Callable[[int], None] = None
     ) -> Generator[Video, None, None]:
         """
         Iterate over all videos in an album with automatic pagination.
@@ -363,37 +778,47 @@ class VimeoClient:
         Args:
             album_id: Album ID
             user_id: User ID
+            on_total: Called with the total number of videos once known
 
         Yields:
             Video objects
         """
-        page = 1
-        while True:
-            response = self.get_album_videos(
-                album_id=album_id,
-                user_id=user_id,
-                page=page
-            )
+        pages = self._iter_pages(lambda page: self.get_album_videos(
+            album_id=album_id,
+            user_id=user_id,
+            page=page
+        ), on_total=on_total)
 
-            videos = response.get("data", [])
-            if not videos:
-                break
+        for response in pages:
+            for video_data in response["data"]:
+                yield self._parse_video(video_data)
 
-            for video_data in videos:
-                yield Video.from_vimeo_response(video_data)
+    def get_album_video_ids(self, album_id: str = None, user_id: str = None) -> Set[str]:
+        """
+        Get the IDs of all videos in an album.
 
-            paging = response.get("paging", {})
-            if not paging.get("next"):
-                break
+        Args:
+            album_id: Album ID
+            user_id: User ID
 
-            page += 1
+        Returns:
+            Set of video IDs
+        """
+        pages = self._iter_pages(lambda page: self.get_album_videos(
+            album_id=album_id,
+            user_id=user_id,
+            page=page,
+            fields="uri"
+        ))
+        return {video_id for response in pages for video_id in self._video_ids(response)}
 
     def get_folder_videos(
         self,
         folder_id: str = None,
         user_id: str = None,
         per_page: int = None,
-        page: int = 1
+        page: int = 1,
+        fields: str = None
     ) -> Dict[str, Any]:
         """
         Get videos from a folder/project.
@@ -403,35 +828,21 @@ class VimeoClient:
             user_id: User ID
             per_page: Number of videos per page
             page: Page number
+            fields: Override the configured fields projection
 
         Returns:
             API response with video data
         """
-        folder_id = folder_id or self._folder_id
-        if not folder_id:
-            raise VimeoAPIError("Folder ID is required")
-
-        user_id = user_id or self._user_id or "me"
-        per_page = min(per_page or self.DEFAULT_PER_PAGE, 100)
-
-        params = {
-            "per_page": per_page,
-            "page": page,
-            "fields": "uri,name,description,duration,created_time,modified_time,"
-                      "release_time,pictures,files,play,tags,categories,privacy,"
-                      "embed,link,stats,metadata,player_embed_url"
-        }
-
-        return self._make_request(
-            "GET",
-            f"/users/{user_id}/projects/{folder_id}/videos",
-            params=params
+        endpoint, params = self._folder_videos_request(
+            folder_id, user_id, per_page, page, fields
         )
+        return self._make_request("GET", endpoint, params=params)
 
     def iter_folder_videos(
         self,
         folder_id: str = None,
-        user_id: str = None
+        user_id: str = None,
+        on_total: Callable[[int], None] = None
     ) -> Generator[Video, None, None]:
         """
         Iterate over all videos in a folder with automatic pagination.
@@ -439,30 +850,39 @@ class VimeoClient:
         Args:
             folder_id: Folder ID
             user_id: User ID
+            on_total: Called with the total number of videos once known
 
         Yields:
             Video objects
         """
-        page = 1
-        while True:
-            response = self.get_folder_videos(
-                folder_id=folder_id,
-                user_id=user_id,
-                page=page
-            )
+        pages = self._iter_pages(lambda page: self.get_folder_videos(
+            folder_id=folder_id,
+            user_id=user_id,
+            page=page
+        ), on_total=on_total)
 
-            videos = response.get("data", [])
-            if not videos:
-                break
+        for response in pages:
+            for video_data in response["data"]:
+                yield self._parse_video(video_data)
 
-            for video_data in videos:
-                yield Video.from_vimeo_response(video_data)
+    def get_folder_video_ids(self, folder_id: str = None, user_id: str = None) -> Set[str]:
+        """
+        Get the IDs of all videos in a folder.
 
-            paging = response.get("paging", {})
-            if not paging.get("next"):
-                break
+        Args:
+            folder_id: Folder ID
+            user_id: User ID
 
-            page += 1
+        Returns:
+            Set of video IDs
+        """
+        pages = self._iter_pages(lambda page: self.get_folder_videos(
+            folder_id=folder_id,
+            user_id=user_id,
+            page=page,
+            fields="uri"
+        ))
+        return {video_id for response in pages for video_id in self._video_ids(response)}
 
     def get_videos_modified_since(
         self,
@@ -472,21 +892,34 @@ class VimeoClient:
         """
         Get videos modified since a specific date.
 
-        Useful for incremental syncs.
+        Useful for incremental syncs. The listing is requested newest
+        modification first and paged one page at a time, so the scan stops
+        at the first page that reaches an unchanged video.
 
         Args:
             since: Datetime to filter from
             user_id: User ID
 
         Returns:
-            List of videos modified since the given date
+            List of videos modified since the given date, most recent first
         """
-        videos = []
-        for video in self.iter_all_videos(user_id=user_id, sort="date", direction="desc"):
-            if video.modified_time < since:
-                break
-            videos.append(video)
-        return videos
+        since = as_utc(since)
+        videos: Dict[str, Video] = {}
+        pages = self._iter_pages(lambda page: self.get_videos(
+            user_id=user_id,
+            page=page,
+            sort="modified_time",
+            direction="desc"
+        ), concurrent=False)
+
+        try:
+            for response in pages:
+                if self._take_modified_since(response, since, videos):
+                    break
+        finally:
+            pages.close()
+
+        return list(videos.values())
 
     def search_videos(
         self,
@@ -507,20 +940,5 @@ class VimeoClient:
         Returns:
             API response with search results
         """
-        per_page = min(per_page or self.DEFAULT_PER_PAGE, 100)
-
-        params = {
-            "query": query,
-            "per_page": per_page,
-            "page": page,
-            "fields": "uri,name,description,duration,created_time,modified_time,"
-                      "release_time,pictures,files,play,tags,categories,privacy,"
-                      "embed,link,stats,metadata,player_embed_url"
-        }
-
-        if user_id or self._user_id:
-            endpoint = f"/users/{user_id or self._user_id or 'me'}/videos"
-        else:
-            endpoint = "/videos"
-
+        endpoint, params = self._search_request(query, user_id, per_page, page)
         return self._make_request("GET", endpoint, params=params)